@@ -1,18 +1,20 @@
 """
 Admin API endpoints for business owner dashboard
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+from collections import Counter
 import json
 
-from app.models import User, WealthRecord, AssetDetail, IncomeRecord, ExpenseRecord, Milestone, get_db
+from app.models import User, WealthRecord, AssetDetail, IncomeRecord, ExpenseRecord, Milestone, DailyRollup, get_db
 from app.api.auth import get_current_user
+from app.services.timing import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 class AdminStats(BaseModel):
     total_users: int
@@ -22,6 +24,7 @@ class AdminStats(BaseModel):
     new_users_this_month: int
     top_asset_categories: dict
     user_growth_trend: List[dict]
+    wealth_trend: List[dict] = []  # daily totals from the nightly rollup, oldest first
 
 class UserSummary(BaseModel):
     id: int
@@ -34,6 +37,22 @@ class UserSummary(BaseModel):
     asset_count: int
     home_currency: str
 
+class CohortMember(BaseModel):
+    id: int
+    name: str
+    email: str
+    score: float
+    status: str
+
+class CohortHealth(BaseModel):
+    users: int
+    average_score: float
+    median_score: float
+    percentiles: Dict[str, float]
+    status_counts: Dict[str, int]
+    metric_averages: Dict[str, float]
+    lowest: List[CohortMember]
+
 class DetailedUserView(BaseModel):
     id: int
     name: str
@@ -72,14 +91,22 @@ async def get_admin_stats(
     total_users = db.query(User).count()
     active_users = db.query(User).filter(User.is_active == True).count()
     
-    # Wealth statistics
-    latest_wealth = db.query(
-        func.sum(WealthRecord.total_wealth).label('total_wealth'),
-        func.avg(WealthRecord.total_wealth).label('avg_wealth')
-    ).first()
-    
-    total_wealth_managed = latest_wealth.total_wealth or 0
-    avg_wealth_per_user = latest_wealth.avg_wealth or 0
+    # Wealth statistics from the nightly rollup: every user's latest snapshot, summed once a day
+    rollups = db.query(DailyRollup).order_by(desc(DailyRollup.date)).limit(30).all()
+    if rollups:
+        total_wealth_managed = rollups[0].total_wealth
+        avg_wealth_per_user = rollups[0].avg_wealth
+    else:
+        latest_wealth = db.query(
+            func.sum(WealthRecord.total_wealth).label('total_wealth'),
+            func.avg(WealthRecord.total_wealth).label('avg_wealth')
+        ).first()
+        total_wealth_managed = latest_wealth.total_wealth or 0
+        avg_wealth_per_user = latest_wealth.avg_wealth or 0
+    wealth_trend = [
+        {'date': rollup.date.isoformat(), 'total_wealth': rollup.total_wealth, 'users': rollup.users}
+        for rollup in reversed(rollups)
+    ]
     
     # New users this month
     thirty_days_ago = datetime.now() - timedelta(days=30)
@@ -120,7 +147,8 @@ async def get_admin_stats(
         avg_wealth_per_user=avg_wealth_per_user,
         new_users_this_month=new_users_this_month,
         top_asset_categories=top_asset_categories,
-        user_growth_trend=user_growth_trend
+        user_growth_trend=user_growth_trend,
+        wealth_trend=wealth_trend
     )
 
 @router.get("/admin/users", response_model=List[UserSummary])
@@ -232,6 +260,49 @@ async def get_user_details(
         is_active=user.is_active
     )
 
+@router.get("/admin/health-scores", response_model=CohortHealth)
+def get_cohort_health_scores(
+    advisor_email: Optional[str] = None,
+    lowest: int = Query(20, ge=0, le=500),
+    admin_user: User = Depends(check_admin_access),
+    db: Session = Depends(get_db)
+):
+    """Financial health scores across all active users, or one adviser's clients
+
+    Plain def: FastAPI runs it in the threadpool, so scoring a large book
+    doesn't hold up the event loop.
+    """
+    
+    import numpy as np
+    from app.services.health_scoring import score_health
+    from app.services.report_data import ReportDataBuilder
+    from app.services.report_content import HEALTH_METRIC_LABELS, traffic_light
+    
+    query = db.query(User).filter(User.is_active.is_(True))
+    if advisor_email:
+        query = query.filter(func.lower(User.financial_advisor_email) == advisor_email.strip().lower())
+    users = query.order_by(User.id).all()
+    
+    if not users:
+        return CohortHealth(users=0, average_score=0, median_score=0, percentiles={}, status_counts={},
+                            metric_averages={}, lowest=[])
+    
+    scores = score_health(ReportDataBuilder(db).health_columns(users))
+    overall = scores['overall']
+    status_counts = Counter(traffic_light(score) for score in overall)
+    worst = np.argsort(overall, kind='stable')[:lowest]
+    
+    return CohortHealth(
+        users=len(users),
+        average_score=float(overall.mean()),
+        median_score=float(np.median(overall)),
+        percentiles={f"p{p}": float(v) for p, v in zip((10, 25, 75, 90), np.percentile(overall, (10, 25, 75, 90)))},
+        status_counts=dict(status_counts),
+        metric_averages={key: float(scores[key].mean()) for key in HEALTH_METRIC_LABELS},
+        lowest=[CohortMember(id=users[i].id, name=users[i].name or '', email=users[i].email,
+                             score=float(overall[i]), status=traffic_light(overall[i])) for i in worst]
+    )
+
 @router.post("/admin/users/{user_id}/toggle-active")
 async def toggle_user_active(
     user_id: int,
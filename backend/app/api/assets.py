@@ -10,8 +10,9 @@ from datetime import datetime, date
 
 from app.models import User, AssetDetail, get_db
 from app.api.auth import get_current_user
+from app.services.timing import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 class AssetCreateRequest(BaseModel):
     asset_name: str
@@ -13,8 +13,9 @@ from datetime import datetime, timedelta
 import os
 
 from app.models import User, get_db
+from app.services.timing import TimedRoute, timed
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 security = HTTPBearer()
 
 # JWT Configuration
@@ -73,13 +74,17 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
-    """Get current authenticated user from JWT token"""
+    """Get current authenticated user from JWT token
+
+    Only the token check counts as auth time; the user lookup is already
+    counted as db time.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
     # Handle demo token
     if credentials.credentials == "demo-token":
         demo_user = db.query(User).filter(User.email == "demo@wealthtracker.com").first()
@@ -98,15 +103,16 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         db.commit()
         db.refresh(demo_user)
         return demo_user
-    
-    try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
+
+    with timed("auth"):
+        try:
+            payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+            email: str = payload.get("sub")
+            if email is None:
+                raise credentials_exception
+        except JWTError:
             raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
+
     user = db.query(User).filter(User.email == email).first()
     if user is None:
         raise credentials_exception
@@ -134,7 +140,7 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": user.email, "uid": user.id}, expires_delta=access_token_expires
     )
     
     return TokenResponse(
@@ -181,7 +187,7 @@ async def register(request: RegisterRequest, db: Session = Depends(get_db)):
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": new_user.email}, expires_delta=access_token_expires
+        data={"sub": new_user.email, "uid": new_user.id}, expires_delta=access_token_expires
     )
     
     return TokenResponse(
@@ -240,7 +246,7 @@ async def create_demo_user(db: Session = Depends(get_db)):
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": demo_user.email}, expires_delta=access_token_expires
+        data={"sub": demo_user.email, "uid": demo_user.id}, expires_delta=access_token_expires
     )
     
     return TokenResponse(
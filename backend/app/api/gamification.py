@@ -6,11 +6,12 @@ from sqlalchemy.orm import Session
 from typing import List, Dict, Any
 from datetime import datetime, date, timedelta
 
-from ..models import get_db, User
+from ..models import get_db, User, Milestone, WealthProgress, WealthRecord
 from ..api.auth import get_current_user
 from pydantic import BaseModel
+from ..services.timing import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 class BadgeResponse(BaseModel):
     badge_id: str
@@ -64,15 +65,40 @@ async def get_user_streak(current_user: User = Depends(get_current_user), db: Se
 
 @router.get("/wealth-progress", response_model=ProgressResponse)
 async def get_wealth_progress(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    """Get user's wealth progress for motivation"""
-    # For now, return mock data
-    # In a real implementation, you would calculate from historical wealth records
+    """Get user's wealth progress for motivation
+
+    Month and year start figures come from the nightly rollup's cached
+    progress row; a newer wealth record since then is the current wealth.
+    """
+    progress = db.query(WealthProgress).filter(WealthProgress.user_id == current_user.id).first()
+    latest = db.query(WealthRecord.total_wealth, WealthRecord.date).filter(
+        WealthRecord.user_id == current_user.id
+    ).order_by(WealthRecord.date.desc(), WealthRecord.id.desc()).first()
+    
+    if progress is not None and (latest is None or latest.date <= progress.as_of):
+        current_wealth = progress.current_wealth
+    else:
+        current_wealth = latest.total_wealth if latest else 0.0
+    # Not rolled up yet: no history to compare against
+    year_start_wealth = progress.year_start_wealth if progress else current_wealth
+    month_start_wealth = progress.month_start_wealth if progress else current_wealth
+    
+    # Next milestone: the smallest open target above current wealth; the year goal: the largest due this year
+    open_milestones = db.query(Milestone.target_amount, Milestone.target_date).filter(
+        Milestone.user_id == current_user.id,
+        Milestone.is_completed.is_(False)
+    ).all()
+    ahead = [m.target_amount for m in open_milestones if m.target_amount > current_wealth]
+    next_milestone = min(ahead, default=current_wealth)
+    this_year = [m.target_amount for m in open_milestones if m.target_date.year == date.today().year]
+    year_goal = max(this_year, default=next_milestone)
+    
     return {
-        "current_wealth": 145000.0,
-        "year_start_wealth": 120000.0,
-        "month_start_wealth": 142000.0,
-        "year_goal": 200000.0,
-        "next_milestone": 150000.0
+        "current_wealth": current_wealth,
+        "year_start_wealth": year_start_wealth,
+        "month_start_wealth": month_start_wealth,
+        "year_goal": year_goal,
+        "next_milestone": next_milestone
     }
 
 @router.post("/update-streak")
@@ -9,8 +9,9 @@ from datetime import datetime, date
 
 from app.models import User, InsurancePolicy, get_db
 from app.api.auth import get_current_user
+from app.services.timing import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 class InsurancePolicyCreateRequest(BaseModel):
     policy_type: str
@@ -0,0 +1,173 @@
+"""
+Operational metrics endpoints
+Exposes per-worker load and latency figures for autoscaling and dashboards.
+Scrapers authenticate with the METRICS_TOKEN bearer token; otherwise an
+admin login is required.
+"""
+import hmac
+import os
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+
+from app.api.admin import check_admin_access
+from app.api.auth import get_current_user, security
+from app.models import get_db
+
+from app.middleware.admission import get_admission_stats
+from app.services.health_calculator import health_scores
+from app.services.report_jobs import report_jobs
+from app.services.report_layout import chart_cache
+from app.services.report_renderer import report_renderer
+from app.services.rollups import rollup_scheduler
+from app.services.timing import route_histograms
+from app.services.timing import TimedRoute
+
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+def check_metrics_access(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
+    """Allow the metrics scraper's token, or an admin user"""
+    if METRICS_TOKEN and hmac.compare_digest(credentials.credentials.encode(), METRICS_TOKEN.encode()):
+        return
+    check_admin_access(get_current_user(credentials, db))
+
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(check_metrics_access)])
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus text-format metrics for this worker"""
+    lines = []
+    
+    # Admission control: queue depth and shedding per route class
+    admission = get_admission_stats()
+    gauges = [
+        ("admission_active", "active", "Requests currently holding a slot"),
+        ("admission_queue_depth", "queue_depth", "Requests waiting for a slot"),
+        ("admission_expected_wait_seconds", "expected_wait_seconds", "Expected queue wait for a new request"),
+        ("admission_avg_service_seconds", "avg_service_seconds", "Moving average of time a slot is held")
+    ]
+    counters = [
+        ("admission_admitted_total", "admitted", "Requests admitted"),
+        ("admission_shed_total", "shed", "Requests shed with 503"),
+        ("admission_queue_seconds_total", "total_queue_seconds", "Total time admitted requests spent queued")
+    ]
+    for metric_type, metrics in (("gauge", gauges), ("counter", counters)):
+        for metric, key, description in metrics:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} {metric_type}")
+            for stats in admission:
+                lines.append(f'{metric}{{route_class="{stats["route_class"]}"}} {stats[key]}')
+    
+    # Request latency histograms and phase totals per route
+    routes = route_histograms.get_stats()
+    lines.append("# HELP http_request_duration_seconds Time to first response byte per route")
+    lines.append("# TYPE http_request_duration_seconds histogram")
+    for stats in routes:
+        label = f'route="{stats["route"]}"'
+        for bound, count in stats["buckets"]:
+            lines.append(f'http_request_duration_seconds_bucket{{{label},le="{bound}"}} {count}')
+        lines.append(f"http_request_duration_seconds_sum{{{label}}} {stats['sum_seconds']}")
+        lines.append(f"http_request_duration_seconds_count{{{label}}} {stats['count']}")
+    lines.append("# HELP http_request_phase_seconds_total Time spent per phase (auth, db, serialize) per route")
+    lines.append("# TYPE http_request_phase_seconds_total counter")
+    for stats in routes:
+        for phase, seconds in stats["phase_seconds"].items():
+            lines.append(f'http_request_phase_seconds_total{{route="{stats["route"]}",phase="{phase}"}} {seconds}')
+    lines.append("# HELP http_request_db_queries_total SQL statements executed per route")
+    lines.append("# TYPE http_request_db_queries_total counter")
+    for stats in routes:
+        lines.append(f'http_request_db_queries_total{{route="{stats["route"]}"}} {stats["db_queries"]}')
+    
+    # PDF rendering and the report cache
+    renderer = report_renderer.get_stats()
+    lines.append("# HELP report_renders_total Reports rendered (cache misses)")
+    lines.append("# TYPE report_renders_total counter")
+    lines.append(f"report_renders_total {renderer['rendered']}")
+    lines.append("# HELP report_render_seconds_total Total time spent rendering reports")
+    lines.append("# TYPE report_render_seconds_total counter")
+    lines.append(f"report_render_seconds_total {renderer['total_render_seconds']}")
+    cache = renderer["cache"]
+    if cache is not None:
+        for metric, key, metric_type, description in (
+            ("report_cache_hits_total", "hits", "counter", "Reports served from the disk cache"),
+            ("report_cache_misses_total", "misses", "counter", "Report cache lookups that had to render"),
+            ("report_cache_evictions_total", "evictions", "counter", "Cached reports evicted by the size cap"),
+            ("report_cache_bytes", "bytes", "gauge", "Size of the report cache on disk"),
+            ("report_cache_entries", "entries", "gauge", "Reports in the cache")
+        ):
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} {metric_type}")
+            lines.append(f"{metric} {cache[key]}")
+    
+    # Memoized chart drawings
+    charts = chart_cache.get_stats()
+    for metric, key, metric_type, description in (
+        ("report_chart_cache_hits_total", "hits", "counter", "Charts reused from the chart cache"),
+        ("report_chart_cache_misses_total", "misses", "counter", "Charts laid out from scratch"),
+        ("report_chart_cache_entries", "entries", "gauge", "Charts in the chart cache"),
+        ("report_chart_cache_saved_seconds_total", "saved_seconds", "counter", "Chart layout time saved by cache hits")
+    ):
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+        lines.append(f"{metric} {charts[key]}")
+    
+    # Background report jobs
+    jobs = report_jobs.get_stats()
+    for metric, key, metric_type, description in (
+        ("report_jobs_queue_depth", "queue_depth", "gauge", "Report jobs waiting for a worker"),
+        ("report_jobs_in_flight", "in_flight", "gauge", "Report jobs queued or running"),
+        ("report_jobs_submitted_total", "submitted", "counter", "Report jobs created by this API process"),
+        ("report_jobs_deduplicated_total", "deduplicated", "counter", "Requests answered with an in-flight job"),
+        ("report_jobs_workers", "workers", "gauge", "Report workers that checked in recently"),
+        ("report_jobs_completed", "completed", "gauge", "Completed report jobs still retained"),
+        ("report_jobs_failed", "failed", "gauge", "Failed report jobs still retained")
+    ):
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+        lines.append(f"{metric} {jobs[key]}")
+    
+    # Stored financial health scores
+    scores = health_scores.get_stats()
+    for metric, key, metric_type, description in (
+        ("health_score_hits_total", "hits", "counter", "Health scores served without recomputing"),
+        ("health_score_refreshes_total", "refreshes", "counter", "Health scores rescored after some inputs changed"),
+        ("health_score_computes_total", "computes", "counter", "Health scores computed from every input")
+    ):
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+        lines.append(f"{metric} {scores[key]}")
+    
+    # Nightly snapshot and rollup schedule
+    rollup = rollup_scheduler.get_stats()
+    for metric, key, metric_type, description in (
+        ("nightly_rollup_runs_total", "runs", "counter", "Scheduled nightly rollup runs completed"),
+        ("nightly_rollup_failures_total", "failures", "counter", "Scheduled nightly rollup runs that failed")
+    ):
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+        lines.append(f"{metric} {rollup[key]}")
+    
+    return "\n".join(lines) + "\n"
+
+@router.get("/metrics/routes")
+async def get_route_metrics():
+    """Per-route latency histograms and phase breakdown as JSON"""
+    return {"routes": route_histograms.get_stats()}
+
+@router.get("/metrics/admission")
+async def get_admission_metrics():
+    """Admission control statistics as JSON"""
+    return {"route_classes": get_admission_stats()}
+
+@router.get("/metrics/rollups")
+async def get_rollup_metrics():
+    """Nightly rollup schedule and last run statistics as JSON"""
+    return rollup_scheduler.get_stats()
+
+@router.get("/metrics/reports")
+async def get_report_metrics():
+    """PDF renderer, report cache, chart cache, report job and health score statistics as JSON"""
+    return {**report_renderer.get_stats(), "charts": chart_cache.get_stats(), "jobs": report_jobs.get_stats(),
+            "health_scores": health_scores.get_stats()}
@@ -8,8 +8,9 @@ from typing import Optional
 
 from app.models import User, get_db
 from app.api.auth import get_current_user
+from app.services.timing import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 class ProfileResponse(BaseModel):
     name: str
@@ -0,0 +1,87 @@
+"""
+Projections API endpoints
+Monte Carlo wealth projections against the user's milestones
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from app.models import User, Milestone, WealthRecord, get_db
+from app.api.auth import get_current_user
+from app.services.projections import MAX_PATHS, MAX_YEARS
+from app.services.timing import TimedRoute
+
+router = APIRouter(route_class=TimedRoute)
+
+class ProjectionRequest(BaseModel):
+    years: int = Field(30, ge=1, le=MAX_YEARS)
+    initial_wealth: Optional[float] = Field(None, ge=0)  # default: the latest wealth snapshot
+    monthly_contribution: float = Field(0.0, ge=0)
+    contribution_years: Optional[float] = Field(None, ge=0)  # default: the whole projection
+    monthly_withdrawal: float = Field(0.0, ge=0)
+    withdrawal_start_year: float = Field(0.0, ge=0)
+    expected_return: float = Field(0.07, ge=-0.5, le=0.5)
+    volatility: float = Field(0.15, ge=0, le=1)
+    inflation: float = Field(0.03, ge=-0.1, le=0.5)
+    inflation_volatility: float = Field(0.01, ge=0, le=0.5)
+    paths: int = Field(10000, ge=100, le=MAX_PATHS)
+    seed: int = 0
+
+class ProjectionBand(BaseModel):
+    year: int
+    p10: float
+    p50: float
+    p90: float
+    p10_real: float
+    p50_real: float
+    p90_real: float
+
+class GoalProjection(BaseModel):
+    id: int
+    title: str
+    target_amount: float
+    target_date: str
+    months: int
+    probability: Optional[float]
+
+class ProjectionResponse(BaseModel):
+    initial_wealth: float
+    paths: int
+    seed: int
+    bands: List[ProjectionBand]
+    final: ProjectionBand
+    depletion_probability: float
+    goals: List[GoalProjection]
+
+@router.post("", response_model=ProjectionResponse)
+def run_projection(
+    request: ProjectionRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Simulate wealth paths and report P10/P50/P90 bands and the chance of reaching each open milestone
+
+    Plain def: FastAPI runs it in the threadpool, so the simulation doesn't
+    hold up the event loop.
+    """
+
+    from app.services.projections import project
+
+    initial_wealth = request.initial_wealth
+    if initial_wealth is None:
+        initial_wealth = db.query(WealthRecord.total_wealth).filter(
+            WealthRecord.user_id == current_user.id
+        ).order_by(WealthRecord.date.desc(), WealthRecord.id.desc()).limit(1).scalar() or 0.0
+
+    milestones = db.query(Milestone).filter(
+        Milestone.user_id == current_user.id,
+        Milestone.is_completed.is_(False)
+    ).order_by(Milestone.target_date).all()
+    goals = [{'id': m.id, 'title': m.title, 'target_amount': m.target_amount, 'target_date': m.target_date}
+             for m in milestones]
+
+    assumptions = request.model_dump(exclude={'years', 'initial_wealth'})
+    result = project(initial_wealth, request.years, goals, **assumptions)
+
+    return ProjectionResponse(initial_wealth=initial_wealth, paths=request.paths, seed=request.seed, **result)
@@ -2,11 +2,12 @@
 Reports and Analytics API endpoints
 PDF generation and financial analysis
 """
-from fastapi import APIRouter, Depends, HTTPException, Response
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import date, datetime
 from io import BytesIO
 import tempfile
@@ -14,23 +15,37 @@ import os
 
 from app.models import User, get_db
 from app.api.auth import get_current_user
+from app.services.timing import TimedRoute
+from app.services.report_cache import ReportFile
+from app.services.report_data import ReportDataBuilder, report_preview
+from app.services.report_renderer import report_renderer, report_sections
+from app.services.report_jobs import report_jobs, job_to_dict, COMPLETED
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 class HealthCheckRequest(BaseModel):
     include_projections: bool = True
     include_recommendations: bool = True
 
+class ReportJobRequest(BaseModel):
+    report_type: str
+    sections: Optional[List[str]] = None
+
 class HealthCheckResponse(BaseModel):
     overall_score: float
     income_expense_score: float
     emergency_fund_score: float
     goals_score: float
     insurance_score: float
-    wealth_growth_score: float
-    debt_score: float
+    diversification_score: float
+    estate_planning_score: float
     status: str
     recommendations: list
+    computed_at: datetime  # when the stored score was last recomputed
+    # Kept until clients move to diversification_score / income_expense_score;
+    # the stored score has no growth or debt metric of its own
+    wealth_growth_score: float = Field(deprecated="Use diversification_score, which this repeats")
+    debt_score: float = Field(deprecated="Use income_expense_score, which this repeats")
 
 @router.get("/health-check", response_model=HealthCheckResponse)
 async def get_health_check(
@@ -70,53 +85,81 @@ async def generate_health_check_pdf(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating PDF: {str(e)}")
 
+# Report type -> download filename prefix
+REPORT_FILENAMES = {
+    "wealth": "wealth_report",
+    "estate-planning": "estate_planning_report",
+    "financial-health": "financial_health_report"
+}
+
+def _report_data(current_user: User, db: Session, sections: Optional[tuple] = None):
+    """User and financial data for any report type, from the user's records
+
+    sections limits the queries to what those report sections read.
+    """
+    return ReportDataBuilder(db).for_user(current_user, sections)
+
+def _report_filename(report_type: str) -> str:
+    return f"{REPORT_FILENAMES[report_type]}_{datetime.now().strftime('%Y_%m_%d')}.pdf"
+
+def _pdf_response(report: ReportFile, report_type: str) -> StreamingResponse:
+    """Stream a rendered report from disk in fixed-size chunks, closing it when done
+
+    The stream closes the file when it ends; the background task also
+    covers a response whose body never started (client gone first).
+    """
+    return StreamingResponse(
+        report.iter_chunks(),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename={_report_filename(report_type)}",
+            "Content-Length": str(report.size)
+        },
+        background=BackgroundTask(report.close)
+    )
+
+def _parse_sections(report_type: str, sections) -> Optional[tuple]:
+    """Requested sections (a comma-separated string or a list) in report order; 400 if invalid"""
+    if isinstance(sections, str):
+        sections = [section.strip() for section in sections.split(",") if section.strip()]
+    try:
+        return report_sections(report_type, sections)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+async def _render_report(report_type: str, current_user: User, db: Session, sections: Optional[tuple] = None) -> StreamingResponse:
+    user_data, financial_data = _report_data(current_user, db, sections)
+    
+    # Render in the report worker pool so the event loop stays responsive
+    report = await report_renderer.render(report_type, user_data, financial_data, sections)
+    return _pdf_response(report, report_type)
+
+@router.get("/preview")
+async def get_report_preview(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Health scores, asset tables and milestone progress from the reports, as JSON
+
+    Nothing is rendered: the app shows these figures directly and only asks for
+    a PDF when the user exports one.
+    """
+    user_data, financial_data = _report_data(current_user, db)
+    return report_preview(user_data, financial_data)
+
+SECTIONS_QUERY = Query(None, description="Comma-separated sections to include (default: the whole report)")
+
 @router.get("/wealth")
 async def generate_wealth_pdf(
+    sections: Optional[str] = SECTIONS_QUERY,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Generate modern, comprehensive wealth report PDF"""
+    """Generate modern, comprehensive wealth report PDF, optionally just some sections
+    (cover, overview, allocation, trends, advice, projections)"""
+    selected = _parse_sections("wealth", sections)
     try:
-        from app.services.stunning_pdf_generator import StunningPDFGenerator
-        
-        # Prepare user data
-        user_data = {
-            'name': current_user.name,
-            'email': current_user.email,
-            'currency': current_user.home_currency
-        }
-        
-        # Prepare financial data (using realistic demo data)
-        financial_data = {
-            'net_worth': 315000,
-            'total_assets': 350000,
-            'total_liabilities': 35000,
-            'assets': {
-                'Cash & Savings': 75000,
-                'Investments': 175000,
-                'Property': 100000
-            },
-            'liabilities': {
-                'Mortgage': 30000,
-                'Other Debt': 5000
-            },
-            'health_score': 782,
-            'monthly_income': 8500,
-            'monthly_expenses': 6200
-        }
-        
-        # Generate PDF
-        generator = StunningPDFGenerator()
-        pdf_content = generator.generate_wealth_report(user_data, financial_data)
-        
-        return Response(
-            content=pdf_content,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=wealth_report_{datetime.now().strftime('%Y_%m_%d')}.pdf"
-            }
-        )
-        
+        return await _render_report("wealth", current_user, db, selected)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating wealth PDF: {str(e)}")
 
@@ -127,149 +170,77 @@ async def generate_estate_planning_pdf(
 ):
     """Generate modern, comprehensive estate planning report PDF"""
     try:
-        from app.services.stunning_pdf_generator import StunningPDFGenerator
-        
-        # Prepare user data
-        user_data = {
-            'name': current_user.name,
-            'email': current_user.email,
-            'currency': current_user.home_currency
-        }
-        
-        # Prepare financial data (using realistic demo data)
-        financial_data = {
-            'net_worth': 315000,
-            'total_assets': 350000,
-            'total_liabilities': 35000,
-            'assets': {
-                'Cash & Savings': 75000,
-                'Investments': 175000,
-                'Property': 100000
-            },
-            'liabilities': {
-                'Mortgage': 30000,
-                'Other Debt': 5000
-            },
-            'inheritance_tax_threshold': 325000,
-            'potential_tax': 0
-        }
-        
-        # Generate PDF
-        generator = StunningPDFGenerator()
-        pdf_content = generator.generate_estate_planning_report(user_data, financial_data)
-        
-        return Response(
-            content=pdf_content,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=estate_planning_report_{datetime.now().strftime('%Y_%m_%d')}.pdf"
-            }
-        )
-        
+        return await _render_report("estate-planning", current_user, db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating estate planning PDF: {str(e)}")
 
 @router.get("/financial-health")
 async def generate_financial_health_pdf(
+    sections: Optional[str] = SECTIONS_QUERY,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Generate modern, comprehensive financial health report PDF using real user data"""
+    """Generate modern, comprehensive financial health report PDF using real user data,
+    optionally just some sections (score, breakdown, recommendations)"""
+    selected = _parse_sections("financial-health", sections)
     try:
-        from app.services.stunning_pdf_generator import StunningPDFGenerator
-        from app.models import AssetDetail, IncomeRecord, ExpenseRecord, Milestone
-        from sqlalchemy import func
-        from datetime import datetime, timedelta
-        
-        # Prepare user data with real database fields (handle None values)
-        user_data = {
-            'name': current_user.name or 'User',
-            'email': current_user.email or '',
-            'currency': current_user.home_currency or 'GBP',
-            'insurance_policies': current_user.insurance_policies or '',
-            'will_location': current_user.will_location or '',
-            'solicitor_name': current_user.solicitor_name or '',
-            'power_of_attorney_location': current_user.power_of_attorney_location or ''
-        }
-        
-        # Get real financial data from database
-        # Use the analytics API data that already works correctly
-        try:
-            from app.api.analytics import get_analytics
-            analytics_data = await get_analytics(current_user, db)
-            
-            # Extract data from analytics response
-            metrics = analytics_data.metrics
-            asset_categories = analytics_data.top_asset_categories
-            
-            # Convert to our expected format
-            asset_totals = {
-                'Cash & Savings': asset_categories.get('Cash & Savings', 0),
-                'Investments': asset_categories.get('Investments', 0),
-                'Property': asset_categories.get('Property', 0),
-                'Retirement': asset_categories.get('Retirement', 0),
-                'Other': asset_categories.get('Other', 0)
-            }
-            
-            # Clean up empty categories
-            asset_totals = {k: v for k, v in asset_totals.items() if v > 0}
-            
-            total_assets = sum(asset_totals.values())
-            net_worth = metrics.current_wealth
-            total_liabilities = max(0, total_assets - net_worth)
-            
-            # Income/expense data (convert 3-month data to monthly)
-            recent_income = metrics.total_income_3m / 3 if metrics.total_income_3m else 0
-            recent_expenses = metrics.total_expenses_3m / 3 if metrics.total_expenses_3m else 0
-            
-        except Exception as e:
-            # Fallback to safe default values if analytics fails
-            asset_totals = {}
-            total_assets = 0
-            total_liabilities = 0
-            net_worth = 0
-            recent_income = 0
-            recent_expenses = 0
-        
-        # Get milestones (handle potential database schema issues)
-        milestone_data = []
-        try:
-            milestones = db.query(Milestone).filter(Milestone.user_id == current_user.id).all()
-            milestone_data = [{
-                'title': m.title,
-                'is_completed': m.is_completed,
-                'target_amount': m.target_amount,
-                'current_amount': m.current_amount
-            } for m in milestones]
-        except Exception:
-            milestone_data = []
-        
-        # Prepare financial data with real calculations
-        financial_data = {
-            'net_worth': net_worth,
-            'total_assets': total_assets,
-            'total_liabilities': total_liabilities,
-            'monthly_income': recent_income,
-            'monthly_expenses': recent_expenses,
-            'assets': asset_totals,
-            'milestones': milestone_data
-        }
-        
-        # Generate PDF
-        generator = StunningPDFGenerator()
-        pdf_content = generator.generate_financial_health_report(user_data, financial_data)
-        
-        return Response(
-            content=pdf_content,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=financial_health_report_{datetime.now().strftime('%Y_%m_%d')}.pdf"
-            }
-        )
-        
+        return await _render_report("financial-health", current_user, db, selected)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating financial health PDF: {str(e)}")
 
+@router.post("/jobs", status_code=202)
+async def create_report_job(
+    request: ReportJobRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Queue a report for background rendering; poll the job, then download it"""
+    if request.report_type not in REPORT_FILENAMES:
+        raise HTTPException(status_code=400, detail=f"Unknown report type. Choose from: {', '.join(REPORT_FILENAMES)}")
+    sections = _parse_sections(request.report_type, request.sections)
+    
+    # With no worker running anywhere (REPORT_JOB_WORKER=external and none started), nothing would pick this up
+    if not report_jobs.worker_available(db):
+        raise HTTPException(status_code=501, detail="Background report jobs are not available here "
+                                                    "(no report worker is running). Download the report directly instead.")
+    try:
+        job, created = report_jobs.submit(db, current_user.id, request.report_type, sections)
+    except OverflowError:
+        raise HTTPException(status_code=503, detail="Report queue is full. Please try again shortly.",
+                            headers={"Retry-After": "30"})
+    
+    return {**job_to_dict(job), "deduplicated": not created}
+
+@router.get("/jobs/{job_id}")
+async def get_report_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Status, progress and timings of a report job"""
+    job = report_jobs.get(db, job_id, current_user.id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    return job_to_dict(job)
+
+@router.get("/jobs/{job_id}/download")
+async def download_report_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Download the PDF produced by a completed report job"""
+    job = report_jobs.get(db, job_id, current_user.id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    if job.status != COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Report job is {job.status}")
+    
+    report = report_jobs.open_result(job)
+    if report is None:
+        raise HTTPException(status_code=410, detail="The report is no longer stored. Please create a new job.")
+    return _pdf_response(report, job.report_type)
+
 # Legacy endpoint for backward compatibility
 @router.get("/generate-pdf")
 async def generate_legacy_pdf(
@@ -10,8 +10,9 @@ import json
 
 from app.models import User, get_db
 from app.api.auth import get_current_user
+from app.services.timing import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 class ServiceRequest(BaseModel):
     service_type: str  # "simple_will", "complex_will", "life_insurance", "financial_advice"
@@ -10,8 +10,9 @@ from datetime import date, datetime
 
 from app.models import User, IncomeRecord, ExpenseRecord, Milestone, get_db
 from app.api.auth import get_current_user
+from app.services.timing import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 class PersonalInfoUpdate(BaseModel):
     name: Optional[str] = None
@@ -0,0 +1,3 @@
+"""
+Management commands, run from the backend directory with python -m app.commands.<name>
+"""
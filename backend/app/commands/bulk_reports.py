@@ -0,0 +1,294 @@
+"""
+Bulk report generation for month-end runs
+Pages through active user ids from the database, collects report data a
+batch at a time with ReportDataBuilder and renders the PDFs across a process
+pool. Every finished report is appended to a manifest, so an interrupted run
+picks up where it stopped.
+
+Run from the backend directory:
+    python -m app.commands.bulk_reports --out reports/2026-10
+    python -m app.commands.bulk_reports --zip reports/2026-10.zip --report-type wealth --report-type financial-health
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import sys
+import threading
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
+
+from app.services.report_renderer import REPORT_METHODS, init_worker, render_to_file
+
+MANIFEST_NAME = "manifest.jsonl"
+
+
+def _init_bulk_worker() -> None:
+    # Ctrl-C reaches the whole process group; the parent decides when to stop, so renders finish cleanly
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    init_worker()
+
+
+def _render_report(report_type: str, user_data: Dict[str, Any], financial_data: Dict[str, Any], path: str) -> Tuple[int, float]:
+    """Render one report in a worker, returning (size, CPU seconds); the file only appears once complete"""
+    started = time.process_time()
+    partial = path + ".part"
+    size = render_to_file(report_type, user_data, financial_data, partial)
+    os.replace(partial, path)
+    return size, time.process_time() - started
+
+
+def report_name(user_id: int, report_type: str) -> str:
+    return f"{user_id}/{report_type}.pdf"
+
+
+class Manifest:
+    """Append-only record of rendered reports; one JSON line per report, flushed as it is written"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.done: Set[str] = set()
+        if path.exists():
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # a line cut off by the interruption
+                    if entry.get("status") == "ok":
+                        self.done.add(entry["name"])
+        self._file = open(path, "a")
+
+    def record(self, name: str, **fields) -> None:
+        self._file.write(json.dumps({"name": name, **fields}) + "\n")
+        self._file.flush()
+        if fields.get("status") == "ok":
+            self.done.add(name)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def stream_user_ids(batch_size: int, limit: int = 0) -> Iterator[List[int]]:
+    """Active user ids in id order, a batch at a time
+
+    Keyset-paged (id > the last id) with a short connection per batch, so no
+    transaction or cursor stays open for the length of the run.
+    """
+    from app.models import engine
+    from app.services.rollups import next_chunk
+
+    after, remaining = 0, limit
+    while not limit or remaining > 0:
+        with engine.connect() as connection:
+            user_ids = next_chunk(connection, after, min(batch_size, remaining) if limit else batch_size)
+        if not user_ids:
+            return
+        yield user_ids
+        after = user_ids[-1]
+        remaining -= len(user_ids)
+
+
+def count_users(limit: int = 0) -> int:
+    from sqlalchemy import func, select
+    from app.models import SessionLocal, User
+
+    db = SessionLocal()
+    try:
+        total = db.scalar(select(func.count(User.id)).where(User.is_active.is_(True)))
+    finally:
+        db.close()
+    return min(total, limit) if limit else total
+
+
+def collect_batch(user_ids: List[int], report_types: List[str]) -> List[Tuple[int, str, Dict[str, Any], Dict[str, Any]]]:
+    """Report data for a batch of users, in the builder's fixed handful of queries"""
+    from app.models import SessionLocal
+    from app.services.report_data import ReportDataBuilder
+
+    db = SessionLocal()
+    try:
+        data = ReportDataBuilder(db).build(user_ids)
+    finally:
+        db.close()
+    # Every report type renders from the same data
+    return [(user_id, report_type, user_data, financial_data)
+            for user_id, (user_data, financial_data) in data.items()
+            for report_type in report_types]
+
+
+class Progress:
+    """Throughput and worker CPU utilisation, printed every few seconds"""
+
+    def __init__(self, total: int, workers: int, interval: float = 5.0):
+        self.total = total
+        self.workers = workers
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.last_printed = self.started
+        self.rendered = 0
+        self.skipped = 0
+        self.failed = 0
+        self.bytes = 0
+        self.cpu_seconds = 0.0
+        self.collect_seconds = 0.0
+
+    def add(self, size: int, cpu_seconds: float) -> None:
+        self.rendered += 1
+        self.bytes += size
+        self.cpu_seconds += cpu_seconds
+
+    def stats(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            'rendered': self.rendered,
+            'skipped': self.skipped,
+            'failed': self.failed,
+            'total': self.total,
+            'elapsed_seconds': elapsed,
+            'reports_per_second': self.rendered / elapsed if elapsed else 0.0,
+            'cpu_utilisation': self.cpu_seconds / (elapsed * self.workers) if elapsed else 0.0,
+            'collect_seconds': self.collect_seconds,
+            'megabytes': self.bytes / 2**20
+        }
+
+    def maybe_print(self, force: bool = False) -> None:
+        now = time.perf_counter()
+        if not force and now - self.last_printed < self.interval:
+            return
+        self.last_printed = now
+        s = self.stats()
+        done = s['rendered'] + s['skipped'] + s['failed']
+        print(f"{done}/{s['total']} reports ({s['skipped']} skipped, {s['failed']} failed)  "
+              f"{s['reports_per_second']:.1f} reports/s  CPU {s['cpu_utilisation']:.0%} of {self.workers} workers  "
+              f"{s['megabytes']:.1f} MB  {s['elapsed_seconds']:.0f}s", flush=True)
+
+
+def run(out_dir: Path, report_types: List[str], workers: int, batch_size: int, limit: int = 0,
+        stop: Optional[threading.Event] = None) -> Dict[str, Any]:
+    """Render every report for every active user into out_dir, skipping those the manifest has
+
+    Setting stop ends the run after the renders already in flight, leaving a manifest to resume from.
+    """
+    stop = stop or threading.Event()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest = Manifest(out_dir / MANIFEST_NAME)
+    progress = Progress(count_users(limit) * len(report_types), workers)
+    max_in_flight = workers * 4  # enough to keep every worker busy without holding a whole batch of renders
+
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                               initializer=_init_bulk_worker)
+    in_flight = {}
+
+    def drain(limit_in_flight: int) -> None:
+        while len(in_flight) > limit_in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = in_flight.pop(future)
+                try:
+                    size, cpu_seconds = future.result()
+                except Exception as e:
+                    progress.failed += 1
+                    manifest.record(name, status="failed", error=str(e))
+                else:
+                    progress.add(size, cpu_seconds)
+                    manifest.record(name, status="ok", bytes=size, cpu_seconds=round(cpu_seconds, 4))
+            progress.maybe_print()
+
+    try:
+        for user_ids in stream_user_ids(batch_size, limit):
+            if stop.is_set():
+                break
+            # Skip users whose reports are all in the manifest before touching their data
+            pending = [user_id for user_id in user_ids
+                       if any(report_name(user_id, t) not in manifest.done for t in report_types)]
+            progress.skipped += (len(user_ids) - len(pending)) * len(report_types)
+            if not pending:
+                continue
+
+            started = time.perf_counter()
+            jobs = collect_batch(pending, report_types)
+            progress.collect_seconds += time.perf_counter() - started
+
+            for user_id, report_type, user_data, financial_data in jobs:
+                if stop.is_set():
+                    break
+                name = report_name(user_id, report_type)
+                if name in manifest.done:
+                    progress.skipped += 1
+                    continue
+                (out_dir / str(user_id)).mkdir(exist_ok=True)
+                future = pool.submit(_render_report, report_type, user_data, financial_data, str(out_dir / name))
+                in_flight[future] = name
+                drain(max_in_flight)
+        drain(0)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        manifest.close()
+        progress.maybe_print(force=True)
+    return {**progress.stats(), 'interrupted': stop.is_set()}
+
+
+def write_zip(out_dir: Path, zip_path: Path) -> int:
+    """Pack the rendered reports into a zip; PDFs are already compressed, so they are stored as-is"""
+    manifest = Manifest(out_dir / MANIFEST_NAME)
+    manifest.close()
+    partial = zip_path.with_name(zip_path.name + ".part")
+    with zipfile.ZipFile(partial, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for name in sorted(manifest.done):
+            archive.write(out_dir / name, arcname=name)
+        archive.write(out_dir / MANIFEST_NAME, arcname=MANIFEST_NAME)
+    os.replace(partial, zip_path)
+    return len(manifest.done)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render reports for every active user")
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--out", type=Path, help="directory to write <user_id>/<report_type>.pdf into")
+    output.add_argument("--zip", type=Path, help="zip file to write; reports are staged next to it until the run completes")
+    parser.add_argument("--report-type", action="append", choices=sorted(REPORT_METHODS),
+                        help="report to render (repeatable, default: all)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="render processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=500, help="users loaded per database batch")
+    parser.add_argument("--limit", type=int, default=0, help="only the first N users (0: all)")
+    args = parser.parse_args(argv)
+
+    report_types = args.report_type or list(REPORT_METHODS)
+    out_dir = args.out or args.zip.with_name(args.zip.name + ".staging")
+    print(f"Rendering {', '.join(report_types)} into {args.zip or out_dir} with {args.workers} workers "
+          f"({datetime.now():%Y-%m-%d %H:%M})", flush=True)
+
+    stop = threading.Event()
+
+    def request_stop(signum, frame):
+        if stop.is_set():
+            raise KeyboardInterrupt  # second Ctrl-C: don't wait for the renders in flight
+        stop.set()
+        print("Stopping after the reports in progress (Ctrl-C again to abort)...", file=sys.stderr, flush=True)
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    stats = run(out_dir, report_types, max(1, args.workers), args.batch_size, args.limit, stop)
+    if stats['interrupted']:
+        print(f"Interrupted; run the same command again to resume from {out_dir / MANIFEST_NAME}", file=sys.stderr)
+        return 130
+
+    if args.zip and not stats['failed']:
+        packed = write_zip(out_dir, args.zip)
+        shutil.rmtree(out_dir)
+        print(f"Wrote {packed} reports to {args.zip}")
+    elif args.zip:
+        print(f"{stats['failed']} reports failed; staging kept in {out_dir}, re-run to retry them", file=sys.stderr)
+    return 1 if stats['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Nightly snapshot and rollup run
+Writes the end-of-day wealth snapshot of every active user with a wealth
+record, refreshes their cached wealth progress and rolls up the day's
+totals (see app.services.rollups). Each day keeps a checkpoint in the
+database, so an interrupted run picks up after the last committed chunk.
+Only one run works on a day at a time: while another holds it, this exits
+with status 75.
+
+Run from the backend directory:
+    python -m app.commands.nightly_rollup                      # yesterday (UTC)
+    python -m app.commands.nightly_rollup --date 2026-10-01 --days 7
+    python -m app.commands.nightly_rollup --dry-run --batch-size 5000
+"""
+import argparse
+import signal
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict
+
+from app.services.rollups import run_day
+
+
+class Progress:
+    """Throughput for the day in progress, printed every few seconds"""
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self.last_printed = time.perf_counter()
+
+    def __call__(self, stats: Dict[str, Any], force: bool = False) -> None:
+        now = time.perf_counter()
+        if not force and now - self.last_printed < self.interval:
+            return
+        self.last_printed = now
+        print(f"{stats['date']}: {stats['users']} users in {stats['chunks']} chunks  "
+              f"{stats['snapshots']} snapshots ({stats['carried_forward']} carried forward)  "
+              f"{stats['users_per_second']:.0f} users/s  {stats['elapsed_seconds']:.0f}s", flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Snapshot, refresh and roll up per-user daily wealth")
+    parser.add_argument("--date", type=date.fromisoformat, default=datetime.utcnow().date() - timedelta(days=1),
+                        help="day to roll up, YYYY-MM-DD (default: yesterday, UTC)")
+    parser.add_argument("--days", type=int, default=1, help="also backfill the days before --date (oldest first)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="users per chunk and transaction")
+    parser.add_argument("--dry-run", action="store_true", help="do the work and roll it back, reporting counts and throughput")
+    parser.add_argument("--restart", action="store_true", help="ignore existing checkpoints and redo the days from the start")
+    args = parser.parse_args(argv)
+
+    from app.models import create_tables
+    create_tables()  # the snapshot, rollup and checkpoint tables, if the app hasn't created them yet
+
+    days = [args.date - timedelta(days=i) for i in reversed(range(max(1, args.days)))]
+    stop = threading.Event()
+
+    def request_stop(signum, frame):
+        if stop.is_set():
+            raise KeyboardInterrupt  # second Ctrl-C: abandon the chunk in progress (it rolls back)
+        stop.set()
+        print("Stopping after the chunk in progress (Ctrl-C again to abort)...", file=sys.stderr, flush=True)
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    progress = Progress()
+    for day in days:
+        stats = run_day(day, max(1, args.batch_size), args.dry_run, args.restart, stop, progress)
+        if stats['already_complete']:
+            print(f"{stats['date']}: already rolled up (--restart to redo it)")
+            continue
+        if stats['locked_by']:
+            print(f"{stats['date']}: already being rolled up by {stats['locked_by']}; try again once it finishes",
+                  file=sys.stderr)
+            return 75
+        progress(stats, force=True)
+        if stats['interrupted']:
+            print(f"Interrupted; run the same command again to resume {stats['date']} from its checkpoint",
+                  file=sys.stderr)
+            return 130
+        print(f"{stats['date']}: {'dry run, nothing written' if args.dry_run else 'rolled up'}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
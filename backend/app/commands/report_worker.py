@@ -0,0 +1,65 @@
+"""
+Report worker for background report jobs
+Claims jobs from the report_jobs table, renders them in a process pool and
+stores the PDFs in the report cache, where every API process can serve
+them. API processes run a worker of their own by default; run this to keep
+renders off the API machines, setting REPORT_JOB_WORKER=external on the API
+so it leaves jobs to these. Workers and API processes must share the
+database and REPORT_CACHE_DIR.
+
+Run from the backend directory:
+    python -m app.commands.report_worker
+    python -m app.commands.report_worker --concurrency 4 --render-workers 4
+"""
+import argparse
+import asyncio
+import os
+import signal
+import sys
+
+
+async def serve(concurrency: int, render_workers: int) -> int:
+    from app.models import create_tables
+    from app.services.report_jobs import ReportJobWorker
+    from app.services.report_renderer import ReportRenderer
+
+    create_tables()  # the job and worker tables, if the app hasn't created them yet
+    renderer = ReportRenderer(workers=render_workers)
+    worker = ReportJobWorker(concurrency, renderer)
+    stop = asyncio.Event()
+
+    def request_stop():
+        if stop.is_set():
+            raise KeyboardInterrupt  # second signal: don't wait for the renders in flight
+        stop.set()
+        print("Stopping after the jobs in progress (Ctrl-C again to abort)...", file=sys.stderr, flush=True)
+
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, request_stop)
+
+    print(f"Report worker {worker.name}: {concurrency} jobs at a time, {render_workers} render processes", flush=True)
+    try:
+        await worker.run(stop)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        renderer.shutdown()
+    stats = worker.get_stats()
+    print(f"Stopped: {stats['completed']} jobs completed, {stats['failed']} failed", flush=True)
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render queued background report jobs")
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("REPORT_JOB_WORKERS", "2")),
+                        help="jobs handled at once")
+    parser.add_argument("--render-workers", type=int, default=int(os.getenv("REPORT_WORKERS", "2")),
+                        help="PDF render processes (0: render in threads)")
+    args = parser.parse_args(argv)
+    return asyncio.run(serve(max(1, args.concurrency), max(0, args.render_workers)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,16 +8,27 @@ from fastapi.security import HTTPBearer
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import uvicorn
+import logging
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+from sqlalchemy.exc import SQLAlchemyError
 from app.middleware.security import SecurityMiddleware
+from app.middleware.admission import AdmissionMiddleware
+from app.middleware.compression import CompressionMiddleware, PrecompressedStaticFiles, precompress_directory
+from app.services.timing import ServerTimingMiddleware
+from app.services.report_jobs import local_job_worker
+from app.services.report_renderer import report_renderer
+from app.services.rollups import rollup_scheduler
+from app.models import create_tables, ensure_indexes
 
 # Load environment variables
 load_dotenv()
 
 # Import API routers
-from app.api import auth, wealth, reports, users, assets, analytics, income, expenses, milestones, profile, gamification, admin, services, whitelabel, insurance
+from app.api import auth, wealth, reports, users, assets, analytics, income, expenses, milestones, profile, gamification, admin, services, whitelabel, insurance, metrics, projections
+
+logger = logging.getLogger(__name__)
 
 # Security
 security = HTTPBearer()
@@ -41,9 +52,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add security middleware
+# Compress JSON and HTML responses (brotli or gzip, skipping PDFs and small bodies)
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+# Bound concurrent PDF renders, admin aggregations and projections, shedding with 503 when overloaded
+app.add_middleware(AdmissionMiddleware)
+
+# Add security middleware (added last so it runs first: rate limiting happens before queueing)
 app.add_middleware(SecurityMiddleware, calls_per_minute=100)
 
+# Outermost: Server-Timing header (auth, db, db_count, serialize, total) and per-route histograms
+app.add_middleware(ServerTimingMiddleware)
+
 # Include API routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(wealth.router, prefix="/api/wealth", tags=["Wealth Management"])
@@ -53,6 +73,7 @@ app.include_router(income.router, prefix="/api/income", tags=["Income Management
 app.include_router(expenses.router, prefix="/api/expenses", tags=["Expense Management"])
 app.include_router(insurance.router, prefix="/api/insurance", tags=["Insurance Management"])
 app.include_router(milestones.router, prefix="/api/milestones", tags=["Financial Goals"])
+app.include_router(projections.router, prefix="/api/projections", tags=["Projections"])
 app.include_router(profile.router, prefix="/api/profile", tags=["User Profile"])
 app.include_router(reports.router, prefix="/api/reports", tags=["Reports & Analytics"])
 app.include_router(users.router, prefix="/api/users", tags=["User Management"])
@@ -60,12 +81,19 @@ app.include_router(gamification.router, prefix="/api", tags=["Gamification"])
 app.include_router(admin.router, prefix="/api", tags=["Admin Dashboard"])
 app.include_router(services.router, prefix="/api", tags=["Additional Services"])
 app.include_router(whitelabel.router, prefix="/api", tags=["White Label Partners"])
+app.include_router(metrics.router, prefix="/api", tags=["Metrics"])
 
 # Serve React frontend from backend (Replit compatibility)
 frontend_dist = Path(__file__).parent.parent.parent / "frontend" / "dist"
 if frontend_dist.exists():
+    # Precompress the bundle once so assets are served from .br/.gz siblings with no per-request CPU
+    try:
+        precompress_directory(frontend_dist / "assets")
+    except OSError:
+        pass  # read-only filesystem (e.g. serverless); serve uncompressed originals
+    
     # Mount static assets
-    app.mount("/assets", StaticFiles(directory=str(frontend_dist / "assets")), name="static")
+    app.mount("/assets", PrecompressedStaticFiles(directory=str(frontend_dist / "assets")), name="static")
     
     # Serve React app for non-API routes
     @app.get("/{full_path:path}")
@@ -93,6 +121,45 @@ else:
             "note": "React frontend not found. Access React dev server on port 5000."
         }
 
+@app.on_event("startup")
+async def start_report_workers():
+    """Pre-fork and warm the PDF render workers before taking traffic"""
+    try:
+        report_renderer.start()
+    except OSError:
+        report_renderer.workers = 0  # no subprocesses allowed (e.g. serverless); render in threads
+
+@app.on_event("startup")
+async def prepare_database():
+    """Add tables and indexes declared since the database was created"""
+    try:
+        create_tables()
+        ensure_indexes()
+    except SQLAlchemyError as e:
+        logger.warning("Could not create database tables and indexes: %s", e)
+
+@app.on_event("startup")
+async def start_report_job_worker():
+    """Run background report jobs in this process unless a separate report worker handles them"""
+    try:
+        local_job_worker.start(report_renderer)
+    except SQLAlchemyError as e:
+        logger.warning("Could not start the report job worker: %s", e)
+
+@app.on_event("startup")
+async def start_rollup_scheduler():
+    """Schedule the nightly snapshot and rollup run (only when NIGHTLY_ROLLUP_AT is set)"""
+    rollup_scheduler.start()
+
+@app.on_event("shutdown")
+async def stop_report_workers():
+    await local_job_worker.stop()  # its jobs render in report_renderer's pool
+    report_renderer.shutdown()
+
+@app.on_event("shutdown")
+async def stop_rollup_scheduler():
+    await rollup_scheduler.stop()
+
 @app.get("/api/health")
 async def health_check():
     """Detailed health check"""
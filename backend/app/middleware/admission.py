@@ -0,0 +1,215 @@
+"""
+Admission control and load shedding for expensive endpoints
+Bounds concurrent PDF renders, admin aggregations and projections per worker with a short wait queue
+"""
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Route classes, matched by path prefix. Limits are per worker process.
+DEFAULT_ROUTE_CLASSES = [
+    {
+        "name": "pdf",
+        "prefixes": [
+            "/api/reports/wealth",
+            "/api/reports/estate-planning",
+            "/api/reports/financial-health",
+            "/api/reports/generate-pdf",
+            "/api/reports/health-check/pdf"
+        ],
+        "max_concurrent": int(os.getenv("ADMISSION_PDF_CONCURRENCY", "2")),
+        "max_queue": int(os.getenv("ADMISSION_PDF_QUEUE", "8")),
+        "max_wait_seconds": float(os.getenv("ADMISSION_PDF_MAX_WAIT", "10"))
+    },
+    {
+        "name": "admin",
+        "prefixes": ["/api/admin/stats", "/api/admin/users", "/api/admin/export", "/api/admin/health-scores"],
+        "max_concurrent": int(os.getenv("ADMISSION_ADMIN_CONCURRENCY", "4")),
+        "max_queue": int(os.getenv("ADMISSION_ADMIN_QUEUE", "16")),
+        "max_wait_seconds": float(os.getenv("ADMISSION_ADMIN_MAX_WAIT", "5"))
+    },
+    {
+        "name": "projections",
+        "prefixes": ["/api/projections"],
+        "max_concurrent": int(os.getenv("ADMISSION_PROJECTION_CONCURRENCY", "2")),
+        "max_queue": int(os.getenv("ADMISSION_PROJECTION_QUEUE", "8")),
+        "max_wait_seconds": float(os.getenv("ADMISSION_PROJECTION_MAX_WAIT", "5"))
+    }
+]
+
+# Every controller created in this process, for the metrics endpoint
+ADMISSION_CONTROLLERS: Dict[str, "AdmissionController"] = {}
+
+
+class AdmissionController:
+    """Concurrency limiter with a bounded FIFO wait queue and queue-time-based shedding
+
+    A request is shed up front when the queue is full or when the expected
+    wait (queue position x average service time / concurrency) already
+    exceeds the deadline, and later if it is still queued at the deadline.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, max_wait_seconds: float,
+                 initial_service_seconds: float = 1.0):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.avg_service_seconds = initial_service_seconds
+
+        self.active = 0
+        self.waiters: deque = deque()
+
+        self.admitted = 0
+        self.shed_queue_full = 0
+        self.shed_expected_wait = 0
+        self.shed_timeout = 0
+        self.total_queue_seconds = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self.waiters)
+
+    @property
+    def shed(self) -> int:
+        return self.shed_queue_full + self.shed_expected_wait + self.shed_timeout
+
+    def expected_wait(self) -> float:
+        """Estimated seconds a newly arriving request would queue"""
+        if self.active < self.max_concurrent and not self.waiters:
+            return 0.0
+        return (len(self.waiters) + 1) * self.avg_service_seconds / self.max_concurrent
+
+    async def acquire(self) -> bool:
+        """Wait for a slot; return False if the request should be shed"""
+        if self.active < self.max_concurrent and not self.waiters:
+            self.active += 1
+            self.admitted += 1
+            return True
+
+        if len(self.waiters) >= self.max_queue:
+            self.shed_queue_full += 1
+            return False
+        if self.expected_wait() > self.max_wait_seconds:
+            self.shed_expected_wait += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        queued_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.max_wait_seconds)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            # release() may have handed us its slot in the same tick the timeout fired (wait_for
+            # still raises on 3.12+); the slot is ours then, so take it rather than leak it
+            if not (waiter.done() and not waiter.cancelled()):
+                self.shed_timeout += 1
+                return False
+        except asyncio.CancelledError:
+            # Client went away; hand the slot on if it had already been given to us
+            self._discard(waiter)
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+        # release() transferred its slot to us, so active is already counted
+        self.total_queue_seconds += time.perf_counter() - queued_at
+        self.admitted += 1
+        return True
+
+    def release(self, service_seconds: Optional[float] = None) -> None:
+        """Free a slot, handing it straight to the next live waiter if there is one"""
+        if service_seconds is not None:
+            self.avg_service_seconds += 0.2 * (service_seconds - self.avg_service_seconds)
+
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+                return
+        self.active -= 1
+
+    def _discard(self, waiter) -> None:
+        try:
+            self.waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.expected_wait()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission statistics"""
+        return {
+            'route_class': self.name,
+            'active': self.active,
+            'queue_depth': self.queue_depth,
+            'max_concurrent': self.max_concurrent,
+            'max_queue': self.max_queue,
+            'max_wait_seconds': self.max_wait_seconds,
+            'avg_service_seconds': self.avg_service_seconds,
+            'expected_wait_seconds': self.expected_wait(),
+            'admitted': self.admitted,
+            'shed': self.shed,
+            'shed_queue_full': self.shed_queue_full,
+            'shed_expected_wait': self.shed_expected_wait,
+            'shed_timeout': self.shed_timeout,
+            'total_queue_seconds': self.total_queue_seconds
+        }
+
+
+class AdmissionMiddleware:
+    """Apply admission control to configured route classes, returning 503 when shedding"""
+
+    def __init__(self, app: ASGIApp, route_classes: Optional[List[dict]] = None):
+        self.app = app
+        self.routes = []
+        for route_class in (route_classes if route_classes is not None else DEFAULT_ROUTE_CLASSES):
+            controller = AdmissionController(
+                route_class["name"],
+                max_concurrent=route_class["max_concurrent"],
+                max_queue=route_class["max_queue"],
+                max_wait_seconds=route_class["max_wait_seconds"]
+            )
+            ADMISSION_CONTROLLERS[controller.name] = controller
+            for prefix in route_class["prefixes"]:
+                self.routes.append((prefix, controller))
+
+    def _controller_for(self, path: str) -> Optional[AdmissionController]:
+        for prefix, controller in self.routes:
+            if path.startswith(prefix):
+                return controller
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        controller = self._controller_for(scope["path"]) if scope["type"] == "http" else None
+        if controller is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await controller.acquire():
+            response = JSONResponse(
+                {"detail": "Server is busy. Please try again shortly."},
+                status_code=503,
+                headers={"Retry-After": str(controller.retry_after())}
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(time.perf_counter() - started)
+
+
+def get_admission_stats() -> List[Dict[str, Any]]:
+    """Stats for every admission controller in this process"""
+    return [controller.get_stats() for controller in ADMISSION_CONTROLLERS.values()]
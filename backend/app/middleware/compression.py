@@ -0,0 +1,258 @@
+"""
+Response compression for the JSON API and the static SPA bundle
+Negotiates brotli/gzip per request and serves precompressed siblings for static assets
+"""
+import gzip
+import mimetypes
+import os
+import zlib
+from pathlib import Path
+from typing import Iterable, Optional, Set
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Content that is already compressed (or not worth compressing)
+SKIP_CONTENT_TYPES = (
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/octet-stream",
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+)
+
+# Static asset types worth precompressing
+PRECOMPRESS_SUFFIXES = (".js", ".css", ".html", ".svg", ".json", ".map", ".txt")
+
+
+def accepted_encodings(accept_encoding: str) -> Set[str]:
+    """Parse an Accept-Encoding header into the set of encodings with non-zero quality"""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        encoding, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if encoding:
+            accepted.add(encoding)
+    return accepted
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    """Streaming compressor with a common interface over zlib and brotli"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == "br":
+            out = self._brotli.process(data)
+            return out + (self._brotli.finish() if final else self._brotli.flush())
+        out = self._zlib.compress(data)
+        return out + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """Compress compressible responses above a minimum size
+
+    Whole (single-message) bodies are compressed in one go with an exact
+    Content-Length; streamed bodies are compressed chunk by chunk. Responses
+    that already carry a Content-Encoding (such as precompressed static
+    assets) or an already-compressed media type like application/pdf pass
+    through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(send, encoding, self)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, config: CompressionMiddleware):
+        self._send = send
+        self.encoding = encoding
+        self.config = config
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[_Compressor] = None
+
+    def _should_skip(self, message: Message) -> bool:
+        headers = Headers(raw=message.get("headers", []))
+        if "content-encoding" in headers or message["status"] in (204, 304):
+            return True
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(SKIP_CONTENT_TYPES)
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            self.passthrough = self._should_skip(message)
+            return
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.passthrough:
+            if self.start_message is not None:
+                await self._send(self.start_message)
+                self.start_message = None
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            start["headers"] = list(start.get("headers", []))
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body and len(body) < self.config.minimum_size:
+                # Too small to be worth it
+                await self._send(start)
+                await self._send(message)
+                return
+
+            self.compressor = _Compressor(self.encoding, self.config.gzip_level, self.config.brotli_quality)
+            body = self.compressor.compress(body, final=not more_body)
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(body))
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        if self.compressor is None:
+            await self._send(message)
+            return
+        await self._send({
+            "type": "http.response.body",
+            "body": self.compressor.compress(body, final=not more_body),
+            "more_body": more_body
+        })
+
+
+def precompress_directory(directory: Path, minimum_size: int = 1024) -> int:
+    """Write .gz (and .br when available) siblings for static assets that lack fresh ones
+
+    Run at build or startup time so serving assets costs no compression CPU.
+    Returns the number of files written.
+    """
+    written = 0
+    for path in Path(directory).rglob("*"):
+        if not path.is_file() or path.suffix not in PRECOMPRESS_SUFFIXES:
+            continue
+        source_stat = path.stat()
+        if source_stat.st_size < minimum_size:
+            continue
+        data = None
+        for suffix, compress in _precompressors():
+            sibling = path.with_name(path.name + suffix)
+            if sibling.exists() and sibling.stat().st_mtime >= source_stat.st_mtime:
+                continue
+            if data is None:
+                data = path.read_bytes()
+            # Several workers may start at once; write privately, then swap in atomically
+            tmp = sibling.with_name(f"{sibling.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(compress(data))
+            os.replace(tmp, sibling)
+            written += 1
+    return written
+
+
+def _precompressors() -> Iterable:
+    # Maximum effort: this runs once, not per request
+    yield ".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+    if brotli is not None:
+        yield ".br", lambda data: brotli.compress(data, quality=11)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves a fresh .br/.gz sibling when the client accepts it
+
+    If-None-Match / If-Modified-Since are checked against the file actually
+    sent, so a client revalidating with a sibling's ETag gets its 304.
+    """
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope,
+                      status_code: int = 200) -> Response:
+        response = self._precompressed(full_path, stat_result, scope, status_code)
+        if response is None:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+            response.headers["Vary"] = "Accept-Encoding"
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _precompressed(self, full_path, stat_result: os.stat_result, scope: Scope,
+                       status_code: int) -> Optional[FileResponse]:
+        accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            if encoding not in accepted:
+                continue
+            sibling = f"{full_path}{suffix}"
+            try:
+                sibling_stat = os.stat(sibling)
+            except OSError:
+                continue
+            if sibling_stat.st_mtime < stat_result.st_mtime:
+                continue  # stale; fall back rather than serve old content
+            return FileResponse(
+                sibling,
+                status_code=status_code,
+                stat_result=sibling_stat,
+                media_type=mimetypes.guess_type(str(full_path))[0] or "text/plain",
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+            )
+        return None
+
+
+if __name__ == "__main__":
+    # Build step: python -m app.middleware.compression ../frontend/dist
+    import sys
+    for target in sys.argv[1:]:
+        print(f"{target}: {precompress_directory(Path(target))} files written")
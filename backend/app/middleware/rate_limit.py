@@ -0,0 +1,289 @@
+"""
+Rate limiting primitives for the security middleware
+Sliding-window counters with constant work per request and bounded memory
+
+Backends:
+    memory  - per-process counters (default)
+    mmap    - counters in a shared memory file, shared by all workers on one host
+    redis   - counters in Redis (or anything speaking the Redis protocol), shared across hosts
+
+Select one with RATE_LIMIT_BACKEND; see create_rate_limiter().
+"""
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+class RateLimitBackend:
+    """Base class for rate limiter backends
+
+    Synchronous backends implement allow(); the middleware always awaits
+    check(), which backends doing network I/O override.
+    """
+
+    name = "base"
+
+    def __init__(self, limit: int, window_seconds: float = 60.0):
+        self.limit = limit
+        self.window_seconds = window_seconds
+
+    def allow(self, key: str, now: Optional[float] = None, cost: int = 1) -> bool:
+        raise NotImplementedError
+
+    async def check(self, key: str, cost: int = 1) -> bool:
+        """Record a request of the given cost for key and return False if it exceeds the limit"""
+        return self.allow(key, cost=cost)
+
+    def _estimate(self, previous: int, current: int, now: float, window: int) -> float:
+        """Weight the previous window by how much of it still overlaps the sliding window"""
+        elapsed = (now / self.window_seconds) - window
+        return previous * (1.0 - elapsed) + current
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics"""
+        return {
+            'backend': self.name,
+            'limit': self.limit,
+            'window_seconds': self.window_seconds
+        }
+
+
+class SlidingWindowRateLimiter(RateLimitBackend):
+    """Sliding-window-counter rate limiter keyed by client identifier
+
+    Each client keeps only the request count of the current and previous
+    window. The previous window is weighted by how much of it still overlaps
+    the sliding window, which approximates a true sliding log in O(1).
+
+    All state is touched from the event loop thread only, so no lock is taken.
+    Clients are kept in least-recently-seen order and idle ones are evicted
+    from the front of the table as new requests arrive.
+    """
+
+    name = "memory"
+
+    def __init__(self, limit: int, window_seconds: float = 60.0, max_clients: int = 100000):
+        super().__init__(limit, window_seconds)
+        self.max_clients = max_clients
+        # client key -> [window index, previous window count, current window count]
+        self._clients: "OrderedDict[str, list]" = OrderedDict()
+        self.evictions = 0
+
+    def allow(self, key: str, now: Optional[float] = None, cost: int = 1) -> bool:
+        """Record a request of the given cost for key and return False if it exceeds the limit"""
+        if now is None:
+            now = time.monotonic()
+        window = int(now // self.window_seconds)
+        clients = self._clients
+
+        state = clients.get(key)
+        if state is None:
+            state = [window, 0, 0]
+            clients[key] = state
+        else:
+            clients.move_to_end(key)
+            if state[0] != window:
+                # Roll the window forward; anything older than one window ago counts as zero
+                state[1] = state[2] if state[0] == window - 1 else 0
+                state[2] = 0
+                state[0] = window
+
+        allowed = self._estimate(state[1], state[2], now, window) + cost <= self.limit
+        if allowed:
+            state[2] += cost
+
+        self._evict_idle(window)
+        return allowed
+
+    def _evict_idle(self, window: int) -> None:
+        """Drop clients whose counts have fully expired, oldest first (amortised O(1))"""
+        clients = self._clients
+        # At most two evictions per request keeps the worst case constant
+        for _ in range(2):
+            if not clients:
+                return
+            oldest_key = next(iter(clients))
+            oldest = clients[oldest_key]
+            if oldest[0] < window - 1 or len(clients) > self.max_clients:
+                del clients[oldest_key]
+                self.evictions += 1
+            else:
+                return
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics"""
+        stats = super().get_stats()
+        stats.update({
+            'tracked_clients': len(self._clients),
+            'evictions': self.evictions
+        })
+        return stats
+
+
+class SharedMemoryRateLimiter(RateLimitBackend):
+    """Sliding-window counters in a memory-mapped file shared by every worker on the host
+
+    The file is a set-associative table: each key hashes to a bucket of a few
+    fixed-size slots (key hash, window index, previous count, current count).
+    A bucket is updated under an fcntl byte-range lock covering just that
+    bucket, so workers only contend when they hit the same bucket. When a
+    bucket is full the slot with the oldest window is recycled, which bounds
+    memory at the cost of occasionally forgetting an idle client.
+    """
+
+    name = "mmap"
+    SLOT = struct.Struct("<QqII")  # key hash, window index, previous count, current count
+    WAYS = 4
+
+    def __init__(self, limit: int, window_seconds: float = 60.0, path: Optional[str] = None, buckets: int = 65536):
+        import fcntl  # POSIX only; imported here so the module still loads elsewhere
+        super().__init__(limit, window_seconds)
+        self._fcntl = fcntl
+        self.path = path or os.path.join(tempfile.gettempdir(), "wealthtracker-ratelimit.bin")
+        self.buckets = buckets
+        self.bucket_size = self.SLOT.size * self.WAYS
+        size = self.bucket_size * buckets
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            # Growing the file zero-fills it; never truncate a table other workers are using
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+
+    @staticmethod
+    def _hash_key(key: str) -> int:
+        # Must be stable across processes, so the builtin (salted) hash() is not usable
+        digest = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+        return digest or 1  # zero marks an empty slot
+
+    def allow(self, key: str, now: Optional[float] = None, cost: int = 1) -> bool:
+        if now is None:
+            now = time.time()  # wall clock, so every worker agrees on the window
+        window = int(now // self.window_seconds)
+        key_hash = self._hash_key(key)
+        offset = (key_hash % self.buckets) * self.bucket_size
+        slot_struct = self.SLOT
+        buf = self._map
+
+        self._fcntl.lockf(self._fd, self._fcntl.LOCK_EX, self.bucket_size, offset, os.SEEK_SET)
+        try:
+            target = None
+            stalest = None
+            for way in range(self.WAYS):
+                slot_offset = offset + way * slot_struct.size
+                slot = slot_struct.unpack_from(buf, slot_offset)
+                if slot[0] == key_hash:
+                    target = (slot_offset, slot)
+                    break
+                if stalest is None or slot[1] < stalest[1][1]:
+                    stalest = (slot_offset, slot)
+
+            if target is None:
+                slot_offset = stalest[0]
+                previous = current = 0
+            else:
+                slot_offset, (_, slot_window, previous, current) = target
+                if slot_window != window:
+                    previous = current if slot_window == window - 1 else 0
+                    current = 0
+
+            allowed = self._estimate(previous, current, now, window) + cost <= self.limit
+            if allowed:
+                current += cost
+            slot_struct.pack_into(buf, slot_offset, key_hash, window, previous, current)
+        finally:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN, self.bucket_size, offset, os.SEEK_SET)
+        return allowed
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics"""
+        stats = super().get_stats()
+        stats.update({
+            'path': self.path,
+            'capacity': self.buckets * self.WAYS
+        })
+        return stats
+
+
+class RedisRateLimiter(RateLimitBackend):
+    """Sliding-window counters stored in Redis, shared by every worker and host
+
+    Each (key, window) pair is one Redis integer. A request is a single
+    MULTI/EXEC round trip (INCRBY current window, EXPIRE, GET previous
+    window); over-limit requests are refunded with DECRBY. Any server
+    speaking the Redis protocol works, including local stand-ins such as
+    fakeredis for development.
+    """
+
+    name = "redis"
+
+    def __init__(self, limit: int, window_seconds: float = 60.0, url: Optional[str] = None,
+                 client=None, prefix: str = "ratelimit"):
+        super().__init__(limit, window_seconds)
+        if client is None:
+            import redis.asyncio as redis_asyncio  # optional dependency, only needed for this backend
+            client = redis_asyncio.from_url(url or "redis://localhost:6379/0")
+        self.client = client
+        self.prefix = prefix
+
+    def allow(self, key: str, now: Optional[float] = None, cost: int = 1) -> bool:
+        raise RuntimeError("RedisRateLimiter is asynchronous; use 'await check(key)'")
+
+    async def check(self, key: str, cost: int = 1) -> bool:
+        now = time.time()
+        window = int(now // self.window_seconds)
+        current_key = f"{self.prefix}:{key}:{window}"
+        previous_key = f"{self.prefix}:{key}:{window - 1}"
+
+        pipe = self.client.pipeline(transaction=True)
+        pipe.incrby(current_key, cost)
+        pipe.expire(current_key, int(self.window_seconds * 2))
+        pipe.get(previous_key)
+        current, _, previous = await pipe.execute()
+
+        # current already includes this request; judge it on the count before it
+        allowed = self._estimate(int(previous or 0), int(current) - cost, now, window) + cost <= self.limit
+        if not allowed:
+            await self.client.decrby(current_key, cost)
+        return allowed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics"""
+        stats = super().get_stats()
+        stats['prefix'] = self.prefix
+        return stats
+
+
+def create_rate_limiter(limit: int, window_seconds: float = 60.0, max_clients: int = 100000,
+                        backend: Optional[str] = None) -> RateLimitBackend:
+    """Build the rate limiter backend selected by RATE_LIMIT_BACKEND (memory, mmap or redis)"""
+    backend = (backend or os.getenv("RATE_LIMIT_BACKEND", "memory")).lower()
+
+    if backend == "mmap":
+        return SharedMemoryRateLimiter(
+            limit,
+            window_seconds,
+            path=os.getenv("RATE_LIMIT_MMAP_PATH"),
+            buckets=int(os.getenv("RATE_LIMIT_MMAP_BUCKETS", "65536"))
+        )
+    if backend == "redis":
+        return RedisRateLimiter(
+            limit,
+            window_seconds,
+            url=os.getenv("RATE_LIMIT_REDIS_URL") or os.getenv("REDIS_URL")
+        )
+    if backend != "memory":
+        raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {backend}")
+    return SlidingWindowRateLimiter(limit, window_seconds, max_clients=max_clients)
@@ -0,0 +1,105 @@
+"""
+Declarative rate-limit policies
+Maps routes to a budget and a cost, and requests to the identity they are charged to
+"""
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from jose import JWTError, jwt
+
+from app.api.auth import SECRET_KEY, ALGORITHM
+
+# Budgets in cost units per minute. Cheap interactive calls and CPU-heavy
+# operations draw from separate budgets, so a client rendering PDFs cannot
+# starve its own (or anyone's) dashboard requests and vice versa. Projections
+# get their own: the page re-runs them as inputs change, and that shouldn't
+# eat into (or be blocked by) PDF downloads.
+DEFAULT_BUDGETS = {
+    "interactive": 100,
+    "expensive": 20,
+    "projections": 30
+}
+
+# Route policies, matched by longest path prefix (and method, where given).
+# Anything unmatched costs 1 unit of the interactive budget.
+DEFAULT_ROUTE_POLICIES = [
+    # PDF generation (full ReportLab renders)
+    {"prefix": "/api/reports/wealth", "budget": "expensive", "cost": 5},
+    {"prefix": "/api/reports/estate-planning", "budget": "expensive", "cost": 5},
+    {"prefix": "/api/reports/financial-health", "budget": "expensive", "cost": 5},
+    {"prefix": "/api/reports/generate-pdf", "budget": "expensive", "cost": 5},
+    {"prefix": "/api/reports/health-check/pdf", "budget": "expensive", "cost": 5},
+    # Queuing a background report costs a render; polling and downloading it don't
+    {"prefix": "/api/reports/jobs", "methods": ["POST"], "budget": "expensive", "cost": 5},
+    # CSV export and admin aggregates
+    {"prefix": "/api/admin/export", "budget": "expensive", "cost": 5},
+    {"prefix": "/api/admin/stats", "budget": "expensive", "cost": 2},
+    {"prefix": "/api/admin/users", "budget": "expensive", "cost": 1},
+    # Monte Carlo wealth projections (vectorized, but thousands of simulated paths)
+    {"prefix": "/api/projections", "budget": "projections", "cost": 1},
+    # Heavier interactive reads
+    {"prefix": "/api/analytics", "budget": "interactive", "cost": 2},
+    {"prefix": "/api/wealth/history", "budget": "interactive", "cost": 2},
+    # Health probes are nearly free
+    {"prefix": "/api/health", "budget": "interactive", "cost": 1}
+]
+
+
+class RateLimitPolicy:
+    """Resolve the budget and cost of a request path"""
+
+    def __init__(self, route_policies: Optional[List[dict]] = None, default_budget: str = "interactive"):
+        policies = route_policies if route_policies is not None else DEFAULT_ROUTE_POLICIES
+        self.default = (default_budget, 1)
+        # Longest prefix first so specific routes win over their parents
+        self.routes: List[Tuple[str, Optional[frozenset], str, int]] = sorted(
+            (
+                (p["prefix"], frozenset(p["methods"]) if p.get("methods") else None, p["budget"], p.get("cost", 1))
+                for p in policies
+            ),
+            key=lambda route: len(route[0]),
+            reverse=True
+        )
+
+    def resolve(self, path: str, method: str = "GET") -> Tuple[str, int]:
+        """Return (budget name, cost) for a request"""
+        for prefix, methods, budget, cost in self.routes:
+            if path.startswith(prefix) and (methods is None or method in methods):
+                return budget, cost
+        return self.default
+
+    def budgets_used(self) -> List[str]:
+        return sorted({budget for _, _, budget, _ in self.routes} | {self.default[0]})
+
+
+@lru_cache(maxsize=4096)
+def _token_identity(token: str) -> Optional[Tuple[str, float]]:
+    """Decode a bearer token once and remember who it belongs to and when it expires"""
+    if token == "demo-token":
+        return "user:demo", float("inf")
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    identity = payload.get("uid") or payload.get("sub")
+    if identity is None:
+        return None
+    return f"user:{identity}", float(payload.get("exp", 0))
+
+
+def request_identity(headers: List[Tuple[bytes, bytes]], client: Optional[Tuple[str, int]]) -> str:
+    """Key a request by authenticated user where possible, falling back to client IP
+
+    Only verified tokens are trusted; an invalid or expired token is charged
+    to the IP so rotating garbage tokens cannot dodge the limit.
+    """
+    for name, value in headers:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                identity = _token_identity(token)
+                if identity is not None and identity[1] > time.time():
+                    return identity[0]
+            break
+    return f"ip:{client[0]}" if client else "ip:unknown"
@@ -1,53 +1,74 @@
 """
 Security middleware for production deployment
 """
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-import time
-from collections import defaultdict
-import threading
-
-class SecurityMiddleware(BaseHTTPMiddleware):
-    """Enhanced security middleware with rate limiting and security headers"""
-    
-    def __init__(self, app, calls_per_minute: int = 100):
-        super().__init__(app)
+from typing import Dict, List, Optional
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.middleware.rate_limit import create_rate_limiter
+from app.middleware.rate_policies import DEFAULT_BUDGETS, RateLimitPolicy, request_identity
+
+# Security headers, encoded once and appended to every response
+SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"content-security-policy", b"default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'"),
+]
+
+class SecurityMiddleware:
+    """Enhanced security middleware with rate limiting and security headers
+
+    Implemented as a plain ASGI middleware so responses (including streamed
+    PDFs) pass straight through without BaseHTTPMiddleware's task and stream
+    wrapping.
+
+    Requests are charged to the authenticated user (or client IP when
+    anonymous) against a per-route budget and cost; see rate_policies.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        calls_per_minute: int = 100,
+        max_clients: int = 100000,
+        budgets: Optional[Dict[str, int]] = None,
+        route_policies: Optional[List[dict]] = None
+    ):
+        self.app = app
         self.calls_per_minute = calls_per_minute
-        self.requests = defaultdict(list)
-        self.lock = threading.Lock()
-    
-    async def dispatch(self, request: Request, call_next) -> Response:
-        # Rate limiting
-        client_ip = request.client.host
-        current_time = time.time()
-        
-        with self.lock:
-            # Clean old requests
-            self.requests[client_ip] = [
-                req_time for req_time in self.requests[client_ip]
-                if current_time - req_time < 60  # Last minute
-            ]
-            
-            # Check rate limit
-            if len(self.requests[client_ip]) >= self.calls_per_minute:
-                raise HTTPException(
-                    status_code=429,
-                    detail="Rate limit exceeded. Please try again later."
-                )
-            
-            # Record this request
-            self.requests[client_ip].append(current_time)
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Content-Security-Policy"] = "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'"
-        
-        return response
\ No newline at end of file
+        self.policy = RateLimitPolicy(route_policies)
+
+        budgets = dict(budgets or DEFAULT_BUDGETS)
+        budgets["interactive"] = calls_per_minute
+        # One limiter per budget; backend chosen by RATE_LIMIT_BACKEND so limits can be shared across workers
+        self.limiters = {
+            name: create_rate_limiter(budgets[name], window_seconds=60, max_clients=max_clients)
+            for name in self.policy.budgets_used()
+        }
+        self.rate_limited_response = JSONResponse(
+            {"detail": "Rate limit exceeded. Please try again later."},
+            status_code=429,
+            headers={"Retry-After": "60"}
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + SECURITY_HEADERS
+            await send(message)
+
+        # Rate limiting (O(1) per request, charged to user or IP by route cost)
+        budget, cost = self.policy.resolve(scope["path"], scope["method"])
+        identity = request_identity(scope["headers"], scope.get("client"))
+
+        if not await self.limiters[budget].check(f"{budget}:{identity}", cost):
+            await self.rate_limited_response(scope, receive, send_with_headers)
+            return
+
+        await self.app(scope, receive, send_with_headers)
@@ -1,16 +1,19 @@
 """
 Database models for WealthTracker Pro - Migrated from Streamlit version
 """
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text, update
 from datetime import datetime, date
 import os
 
+from app.services.timing import instrument_engine, timed
+
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://localhost/wealthtracker")
 engine = create_engine(DATABASE_URL)
+instrument_engine(engine)  # SQL time and query count feed the Server-Timing header
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -63,6 +66,7 @@ class User(Base):
 class WealthRecord(Base):
     """Historical wealth tracking records"""
     __tablename__ = 'wealth_records'
+    __table_args__ = (Index('idx_wealth_records_user_date', 'user_id', 'date'),)
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False)  # Foreign key to users
@@ -81,6 +85,7 @@ class WealthRecord(Base):
 class AssetDetail(Base):
     """Individual asset details with ownership information"""
     __tablename__ = 'asset_details'
+    __table_args__ = (Index('idx_asset_details_user_category', 'user_id', 'asset_category'),)
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False)  # Foreign key to users
@@ -148,6 +153,7 @@ class AssetDetail(Base):
 class IncomeRecord(Base):
     """Income tracking records"""
     __tablename__ = 'income_records'
+    __table_args__ = (Index('idx_income_records_user_date', 'user_id', 'income_date'),)
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False)
@@ -164,6 +170,7 @@ class IncomeRecord(Base):
 class ExpenseRecord(Base):
     """Expense tracking records"""
     __tablename__ = 'expense_records'
+    __table_args__ = (Index('idx_expense_records_user_date', 'user_id', 'expense_date'),)
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False)
@@ -210,6 +217,203 @@ class InsurancePolicy(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+class HealthScore(Base):
+    """Stored financial health score with the inputs it was computed from
+
+    Writes to a user's records flag the affected input group dirty (see
+    mark_health_inputs_dirty); the next read reloads just those inputs and
+    rescores, so unchanged users are served straight from this row.
+    """
+    __tablename__ = 'health_scores'
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, unique=True, index=True, nullable=False)
+    
+    # Scores (0-100)
+    overall = Column(Float, nullable=False)
+    emergency_fund = Column(Float, nullable=False)
+    expense_ratio = Column(Float, nullable=False)
+    expense_percentage = Column(Float, nullable=False)
+    milestones = Column(Float, nullable=False)
+    insurance = Column(Float, nullable=False)
+    diversification = Column(Float, nullable=False)
+    estate_planning = Column(Float, nullable=False)
+    
+    # Inputs (app.services.health_scoring.HEALTH_COLUMNS)
+    monthly_income = Column(Float, default=0.0)
+    monthly_expenses = Column(Float, default=0.0)
+    cash = Column(Float, default=0.0)
+    asset_total = Column(Float, default=0.0)
+    asset_max = Column(Float, default=0.0)
+    milestones_total = Column(Integer, default=0)
+    milestones_completed = Column(Integer, default=0)
+    has_insurance = Column(Boolean, default=False)
+    has_will = Column(Boolean, default=False)
+    has_solicitor = Column(Boolean, default=False)
+    has_power_of_attorney = Column(Boolean, default=False)
+    
+    # Input groups written to since the score was computed
+    assets_dirty = Column(Boolean, default=False)
+    cashflow_dirty = Column(Boolean, default=False)
+    milestones_dirty = Column(Boolean, default=False)
+    insurance_dirty = Column(Boolean, default=False)
+    estate_dirty = Column(Boolean, default=False)
+    
+    computed_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class ReportJobRecord(Base):
+    """A background report render, shared by every API process and report worker
+
+    The finished PDF lives in the shared report cache under cache_key. At
+    most one job per user, report and sections is queued or running at a
+    time (a partial unique index), so concurrent requests share one render.
+    """
+    __tablename__ = 'report_jobs'
+    __table_args__ = (
+        Index('idx_report_jobs_status_created', 'status', 'created_at'),
+        Index('uq_report_jobs_in_flight', 'user_id', 'report_type', 'sections', unique=True,
+              postgresql_where=text("status IN ('queued', 'running')"),
+              sqlite_where=text("status IN ('queued', 'running')")),
+    )
+    
+    id = Column(String(32), primary_key=True)
+    user_id = Column(Integer, index=True, nullable=False)
+    report_type = Column(String(50), nullable=False)
+    sections = Column(String(255))  # comma-separated, in report order; empty for the whole report
+    status = Column(String(20), nullable=False, default='queued')
+    stage = Column(String(50), nullable=False, default='queued')
+    progress = Column(Float, default=0.0)
+    error = Column(Text)
+    cache_key = Column(String(64))
+    size_bytes = Column(Integer)
+    worker = Column(String(255))  # report worker running the job
+    timings = Column(Text)  # JSON
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)  # refreshed while running; a stale one means the worker died
+
+class ReportWorker(Base):
+    """A running report worker process and when it last checked in"""
+    __tablename__ = 'report_workers'
+    
+    name = Column(String(255), primary_key=True)  # host:pid
+    started_at = Column(DateTime, default=datetime.utcnow)
+    heartbeat_at = Column(DateTime, nullable=False)
+
+class DailySnapshot(Base):
+    """A user's wealth as it stood at the end of each day
+
+    Written by the nightly rollup (app.services.rollups): the user's latest
+    wealth record dated on or before that day, carried forward when nothing
+    new was recorded, so every active user with a wealth record has a row
+    for every rolled-up day. Users with no wealth record get no snapshot.
+    """
+    __tablename__ = 'daily_snapshots'
+    __table_args__ = (
+        Index('idx_daily_snapshots_user_date', 'user_id', 'date', unique=True),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False)
+    date = Column(Date, index=True, nullable=False)
+    recorded_on = Column(Date, nullable=False)  # date of the wealth record the figures come from
+    cash_savings = Column(Float, default=0.0)
+    stocks_securities = Column(Float, default=0.0)
+    real_estate = Column(Float, default=0.0)
+    retirement_accounts = Column(Float, default=0.0)
+    business_assets = Column(Float, default=0.0)
+    other_investments = Column(Float, default=0.0)
+    total_wealth = Column(Float, nullable=False)
+
+class DailyRollup(Base):
+    """Totals across every snapshot of one day, for admin totals and trends"""
+    __tablename__ = 'daily_rollups'
+    
+    id = Column(Integer, primary_key=True, index=True)
+    date = Column(Date, unique=True, index=True, nullable=False)
+    users = Column(Integer, nullable=False)
+    users_updated = Column(Integer, nullable=False)  # snapshots from a record made that day
+    total_wealth = Column(Float, nullable=False)
+    avg_wealth = Column(Float, nullable=False)
+    cash_savings = Column(Float, default=0.0)
+    stocks_securities = Column(Float, default=0.0)
+    real_estate = Column(Float, default=0.0)
+    retirement_accounts = Column(Float, default=0.0)
+    business_assets = Column(Float, default=0.0)
+    other_investments = Column(Float, default=0.0)
+    computed_at = Column(DateTime, default=datetime.utcnow)
+
+class WealthProgress(Base):
+    """Per-user wealth now and at the start of the month and year, refreshed nightly"""
+    __tablename__ = 'wealth_progress'
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, unique=True, index=True, nullable=False)
+    as_of = Column(Date, nullable=False)
+    current_wealth = Column(Float, nullable=False)
+    month_start_wealth = Column(Float, nullable=False)
+    year_start_wealth = Column(Float, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class RollupCheckpoint(Base):
+    """How far the nightly rollup for a date has got, so an interrupted run resumes
+
+    The run working on the date holds a lease on its row (locked_by until
+    locked_until, renewed with every chunk), so only one run at a time
+    processes a day.
+    """
+    __tablename__ = 'rollup_checkpoints'
+    
+    id = Column(Integer, primary_key=True, index=True)
+    date = Column(Date, unique=True, index=True, nullable=False)
+    last_user_id = Column(Integer, default=0)  # users are processed in id order
+    users = Column(Integer, default=0)
+    locked_by = Column(String(64))  # host:pid:run of the run holding the lease
+    locked_until = Column(DateTime)
+    started_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    completed_at = Column(DateTime)
+
+# Record type -> the health score input group its writes change
+HEALTH_INPUT_MODELS = {
+    AssetDetail: 'assets',
+    WealthRecord: 'assets',
+    IncomeRecord: 'cashflow',
+    ExpenseRecord: 'cashflow',
+    Milestone: 'milestones',
+    InsurancePolicy: 'insurance',
+}
+# Profile fields the score reads -> input group
+HEALTH_INPUT_USER_FIELDS = {
+    'insurance_policies': 'insurance',
+    'will_location': 'estate',
+    'solicitor_name': 'estate',
+    'power_of_attorney_location': 'estate',
+}
+
+def mark_health_inputs_dirty(session, flush_context):
+    """Flag stored health scores whose inputs this flush changed, in the same transaction"""
+    dirty = {}
+    modified = [obj for obj in session.dirty if session.is_modified(obj)]
+    for obj in list(session.new) + modified + list(session.deleted):
+        group = HEALTH_INPUT_MODELS.get(type(obj))
+        if group is not None:
+            dirty.setdefault(group, set()).add(obj.user_id)
+        elif isinstance(obj, User) and obj not in session.new:
+            state = inspect(obj)
+            for field, group in HEALTH_INPUT_USER_FIELDS.items():
+                if state.attrs[field].history.has_changes():
+                    dirty.setdefault(group, set()).add(obj.id)
+    for group, user_ids in dirty.items():
+        # Core update on the flush's connection: no ORM bookkeeping inside the flush
+        session.connection().execute(
+            update(HealthScore.__table__).where(HealthScore.user_id.in_(user_ids)).values({f'{group}_dirty': True})
+        )
+
+event.listen(SessionLocal, 'after_flush', mark_health_inputs_dirty)
+
 # Database session dependency
 def get_db():
     """Get database session for dependency injection"""
@@ -217,9 +421,17 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
+        # Returning the connection to the pool (and any rollback) counts as DB time
+        with timed("db"):
+            db.close()
 
 # Create tables
 def create_tables():
     """Create all database tables"""
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
+
+def ensure_indexes():
+    """Create any declared index missing from an existing database (create_all skips existing tables)"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
\ No newline at end of file
@@ -1,8 +1,26 @@
 """
 Analytics service for dashboard data
+Dashboard metrics are computed in the database: a windowed query picks one
+wealth snapshot per month, a single row of aggregates covers the 3-month
+figures, and recent transactions come from a UNION of the latest income
+and expense rows. Every query walks the (user_id, date) indexes.
 """
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import extract, func, literal, select, union_all
 from sqlalchemy.orm import Session
-from app.models import User, AssetDetail, WealthRecord
+
+from app.models import AssetDetail, ExpenseRecord, IncomeRecord, WealthRecord
+
+TREND_MONTHS = 6
+CHANGE_DAYS = 90  # the "3 month" window for wealth change, income and expenses
+RECENT_TRANSACTIONS = 10
+
+# wealth_records category columns, as reported in top_asset_categories
+CATEGORY_COLUMNS = ('cash_savings', 'stocks_securities', 'real_estate',
+                    'retirement_accounts', 'business_assets', 'other_investments')
+
 
 def get_user_analytics(user_id: int, db: Session) -> dict:
     """Get analytics data for user dashboard"""
@@ -15,4 +33,111 @@ def get_user_analytics(user_id: int, db: Session) -> dict:
         "total_value": sum(asset.value for asset in assets),
         "growth_rate": 5.2,  # Placeholder
         "monthly_change": 1250.0  # Placeholder
-    }
\ No newline at end of file
+    }
+
+
+def wealth_trend(user_id: int, db: Session, months: int = TREND_MONTHS) -> List[Dict[str, Any]]:
+    """The latest snapshot of each of the user's most recent months with data, oldest first"""
+    month_rank = func.row_number().over(
+        partition_by=(extract('year', WealthRecord.date), extract('month', WealthRecord.date)),
+        order_by=(WealthRecord.date.desc(), WealthRecord.id.desc())
+    ).label('month_rank')
+    ranked = (
+        select(WealthRecord.date, WealthRecord.total_wealth,
+               *(getattr(WealthRecord, column) for column in CATEGORY_COLUMNS), month_rank)
+        .where(WealthRecord.user_id == user_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(ranked).where(ranked.c.month_rank == 1).order_by(ranked.c.date.desc()).limit(months)
+    ).mappings().all()
+    return [
+        {'date': row['date'].isoformat(), 'total_wealth': row['total_wealth'] or 0.0,
+         **{column: row[column] or 0.0 for column in CATEGORY_COLUMNS}}
+        for row in reversed(rows)
+    ]
+
+
+def _window_totals(user_id: int, db: Session, since: date) -> Dict[str, float]:
+    """Wealth at the start of the window and income/expense totals within it, in one row"""
+    past_wealth = (
+        select(WealthRecord.total_wealth)
+        .where(WealthRecord.user_id == user_id, WealthRecord.date <= since)
+        .order_by(WealthRecord.date.desc(), WealthRecord.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    income = (
+        select(func.coalesce(func.sum(IncomeRecord.amount), 0.0))
+        .where(IncomeRecord.user_id == user_id, IncomeRecord.income_date > since)
+        .scalar_subquery()
+    )
+    expenses = (
+        select(func.coalesce(func.sum(ExpenseRecord.amount), 0.0))
+        .where(ExpenseRecord.user_id == user_id, ExpenseRecord.expense_date > since)
+        .scalar_subquery()
+    )
+    row = db.execute(select(past_wealth.label('past_wealth'), income.label('income'),
+                            expenses.label('expenses'))).one()
+    return row._asdict()
+
+
+def recent_transactions(user_id: int, db: Session, limit: int = RECENT_TRANSACTIONS) -> List[Dict[str, Any]]:
+    """The newest income and expense records, newest first; expenses have negative amounts"""
+    latest_income = (
+        select(literal('income').label('type'), IncomeRecord.id, IncomeRecord.income_name.label('description'),
+               IncomeRecord.amount, IncomeRecord.income_date.label('date'), IncomeRecord.category)
+        .where(IncomeRecord.user_id == user_id)
+        .order_by(IncomeRecord.income_date.desc(), IncomeRecord.id.desc())
+        .limit(limit)
+        .subquery()
+    )
+    latest_expenses = (
+        select(literal('expense').label('type'), ExpenseRecord.id, ExpenseRecord.expense_name.label('description'),
+               (-ExpenseRecord.amount).label('amount'), ExpenseRecord.expense_date.label('date'),
+               ExpenseRecord.category)
+        .where(ExpenseRecord.user_id == user_id)
+        .order_by(ExpenseRecord.expense_date.desc(), ExpenseRecord.id.desc())
+        .limit(limit)
+        .subquery()
+    )
+    # Each side is limited first, so the union never holds more than 2 * limit rows
+    combined = union_all(select(latest_income), select(latest_expenses)).subquery()
+    rows = db.execute(
+        select(combined).order_by(combined.c.date.desc(), combined.c.type, combined.c.id.desc()).limit(limit)
+    ).mappings().all()
+    return [{**row, 'date': row['date'].isoformat()} for row in rows]
+
+
+def get_dashboard_analytics(user_id: int, db: Session, today: Optional[date] = None) -> Dict[str, Any]:
+    """Dashboard metrics, wealth trend, asset categories and recent transactions from the user's records"""
+    today = today or date.today()
+    since = today - timedelta(days=CHANGE_DAYS)
+
+    trend = wealth_trend(user_id, db)
+    totals = _window_totals(user_id, db, since)
+    latest = trend[-1] if trend else None
+
+    current_wealth = latest['total_wealth'] if latest else 0.0
+    past_wealth = totals['past_wealth']
+    # No snapshot that old yet: there is no change to report
+    wealth_change = current_wealth - past_wealth if past_wealth is not None else 0.0
+    monthly_expenses = totals['expenses'] / (CHANGE_DAYS / 30)
+
+    return {
+        'metrics': {
+            'current_wealth': current_wealth,
+            'wealth_change_3m': wealth_change,
+            'wealth_change_percent': wealth_change / past_wealth * 100 if past_wealth else 0.0,
+            'total_income_3m': totals['income'],
+            'total_expenses_3m': totals['expenses'],
+            'net_savings_3m': totals['income'] - totals['expenses'],
+            'emergency_fund_months': latest['cash_savings'] / monthly_expenses if latest and monthly_expenses > 0 else 0.0
+        },
+        'wealth_trend': trend,
+        'top_asset_categories': dict(sorted(
+            ((column, latest[column]) for column in CATEGORY_COLUMNS if latest and latest[column] > 0),
+            key=lambda item: item[1], reverse=True
+        )),
+        'recent_transactions': recent_transactions(user_id, db)
+    }
@@ -0,0 +1,132 @@
+"""
+Financial health scoring
+The health check scores (emergency fund, expense control, milestones,
+insurance, diversification, estate planning and the weighted overall) are
+computed with NumPy over column arrays, one element per user, so a whole
+client book is scored in one pass. A single user is a cohort of one.
+"""
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+import numpy as np
+
+# Column name -> dtype; every array passed to score_health has one element per user
+HEALTH_COLUMNS = {
+    'monthly_income': np.float64,
+    'monthly_expenses': np.float64,
+    'cash': np.float64,              # Cash & Savings, the emergency fund
+    'asset_total': np.float64,       # sum of the asset categories
+    'asset_max': np.float64,         # largest asset category
+    'milestones_total': np.int64,
+    'milestones_completed': np.int64,
+    'has_insurance': np.bool_,
+    'has_will': np.bool_,
+    'has_solicitor': np.bool_,
+    'has_power_of_attorney': np.bool_,
+}
+
+# Columns grouped by the records they come from, so a change to one kind of
+# record only needs that group reloaded
+HEALTH_INPUT_GROUPS = {
+    'assets': ('cash', 'asset_total', 'asset_max'),
+    'cashflow': ('monthly_income', 'monthly_expenses'),
+    'milestones': ('milestones_total', 'milestones_completed'),
+    'insurance': ('has_insurance',),
+    'estate': ('has_will', 'has_solicitor', 'has_power_of_attorney'),
+}
+
+# Metric -> weight in the overall score
+HEALTH_WEIGHTS = {
+    'emergency_fund': 0.20,
+    'expense_ratio': 0.20,
+    'milestones': 0.15,
+    'insurance': 0.15,
+    'diversification': 0.15,
+    'estate_planning': 0.15,
+}
+
+EMERGENCY_FUND_MONTHS = 6  # months of expenses that score 100
+INSURANCE_SCORE = 80       # documented cover; adequacy isn't assessed
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """numerator / denominator, 0 where the denominator isn't positive"""
+    positive = denominator > 0
+    return np.divide(numerator, denominator, out=np.zeros(len(numerator)), where=positive)
+
+
+def score_health(columns: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Health scores (0-100 each, plus the weighted overall) for every user in columns"""
+    income = np.asarray(columns['monthly_income'], dtype=np.float64)
+    expenses = np.asarray(columns['monthly_expenses'], dtype=np.float64)
+
+    # Emergency fund: months of expenses covered by cash, against a 6 month target
+    emergency = np.minimum(100.0, _ratio(np.asarray(columns['cash'], dtype=np.float64), expenses)
+                           / EMERGENCY_FUND_MONTHS * 100)
+
+    # Expense control: good below 70% of income, 100 down to 60 by 85%, then down to 0 by 100%
+    expense_percentage = _ratio(expenses, income) * 100
+    expense_ratio = np.select(
+        [income <= 0, expense_percentage < 70, expense_percentage < 85],
+        [0.0, 100.0, 100 - (expense_percentage - 70) / 15 * 40],
+        np.maximum(0.0, 60 - (expense_percentage - 85) / 15 * 60)
+    )
+
+    milestones = _ratio(np.asarray(columns['milestones_completed'], dtype=np.float64),
+                        np.asarray(columns['milestones_total'], dtype=np.float64)) * 100
+
+    insurance = np.where(columns['has_insurance'], float(INSURANCE_SCORE), 0.0)
+
+    # Diversification: penalise a single category above 70% of assets
+    asset_total = np.asarray(columns['asset_total'], dtype=np.float64)
+    max_share = _ratio(np.asarray(columns['asset_max'], dtype=np.float64), asset_total)
+    diversification = np.select(
+        [asset_total <= 0, max_share > 0.7],
+        [0.0, np.maximum(0.0, 100 - (max_share - 0.7) * 200)],
+        100.0
+    )
+
+    estate_planning = (np.where(columns['has_will'], 40.0, 0.0)
+                       + np.where(columns['has_solicitor'], 30.0, 0.0)
+                       + np.where(columns['has_power_of_attorney'], 30.0, 0.0))
+
+    scores = {
+        'emergency_fund': emergency,
+        'expense_ratio': expense_ratio,
+        'milestones': milestones,
+        'insurance': insurance,
+        'diversification': diversification,
+        'estate_planning': estate_planning,
+    }
+    overall = sum(scores[metric] * weight for metric, weight in HEALTH_WEIGHTS.items())
+    return {'overall': overall, **scores, 'expense_percentage': expense_percentage}
+
+
+def is_documented(value: Any) -> bool:
+    """Whether a free-text profile field (will location, solicitor, ...) is filled in"""
+    return bool(value and str(value).strip())
+
+
+def health_columns(records: Iterable[Tuple[Mapping[str, Any], Mapping[str, Any]]]) -> Dict[str, np.ndarray]:
+    """Column arrays from (user_data, financial_data) pairs, as ReportDataBuilder produces them"""
+    values = {name: [] for name in HEALTH_COLUMNS}
+    for user_data, financial_data in records:
+        assets = financial_data.get('assets', {})
+        milestones = financial_data.get('milestones', [])
+        values['monthly_income'].append(financial_data.get('monthly_income', 0))
+        values['monthly_expenses'].append(financial_data.get('monthly_expenses', 0))
+        values['cash'].append(assets.get('Cash & Savings', 0))
+        values['asset_total'].append(sum(assets.values()))
+        values['asset_max'].append(max(assets.values(), default=0))
+        values['milestones_total'].append(len(milestones))
+        values['milestones_completed'].append(sum(1 for m in milestones if m.get('is_completed', False)))
+        values['has_insurance'].append(is_documented(user_data.get('insurance_policies')))
+        values['has_will'].append(is_documented(user_data.get('will_location')))
+        values['has_solicitor'].append(is_documented(user_data.get('solicitor_name')))
+        values['has_power_of_attorney'].append(is_documented(user_data.get('power_of_attorney_location')))
+    return {name: np.array(column, dtype=HEALTH_COLUMNS[name]) for name, column in values.items()}
+
+
+def calculate_health_metrics(financial_data: Dict[str, Any], user_data: Dict[str, Any]) -> Dict[str, float]:
+    """Health scores for one user from report data"""
+    scores = score_health(health_columns([(user_data, financial_data)]))
+    return {metric: float(values[0]) for metric, values in scores.items()}
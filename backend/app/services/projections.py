@@ -0,0 +1,132 @@
+"""
+Monte Carlo wealth projections
+Simulates monthly investment returns and inflation for thousands of paths
+at once: every step is a NumPy operation across all paths, so the only
+Python loop is over months. Runs are seeded, so the same request always
+returns the same bands.
+"""
+import os
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+MAX_PATHS = int(os.getenv("PROJECTION_MAX_PATHS", "20000"))
+MAX_YEARS = 60
+PERCENTILES = (10, 50, 90)
+
+
+def months_until(start: date, end: date) -> int:
+    """Whole months from start to end (0 if end has passed)"""
+    return max(0, (end.year - start.year) * 12 + end.month - start.month - (end.day < start.day))
+
+
+def simulate(initial_wealth: float, years: int, monthly_contribution: float = 0.0,
+             contribution_years: Optional[float] = None, monthly_withdrawal: float = 0.0,
+             withdrawal_start_year: float = 0.0, expected_return: float = 0.07, volatility: float = 0.15,
+             inflation: float = 0.03, inflation_volatility: float = 0.01, paths: int = 10000,
+             seed: int = 0, goal_months: Sequence[int] = ()) -> Dict[str, Any]:
+    """Simulate wealth paths month by month
+
+    Returns are lognormal with the given annual mean and volatility;
+    inflation is normal around its annual rate. Contributions (for the
+    first contribution_years, default all) and withdrawals (from
+    withdrawal_start_year) are in today's money and rise with each path's
+    simulated prices. A path that runs out of money stays at zero.
+
+    Returns nominal and real (today's money) wealth for every path at each
+    year end and the highest nominal wealth each path reached up to each of
+    goal_months, plus whether each path was ever depleted.
+    """
+    months = years * 12
+    rng = np.random.default_rng(seed)
+
+    monthly_sigma = volatility / np.sqrt(12)
+    monthly_mu = np.log1p(expected_return) / 12 - monthly_sigma ** 2 / 2  # so the mean annual return is expected_return
+    inflation_mu = np.log1p(inflation) / 12
+    inflation_sigma = inflation_volatility / np.sqrt(12)
+    contribution_months = months if contribution_years is None else int(contribution_years * 12)
+    withdrawal_start = int(withdrawal_start_year * 12)
+
+    wealth = np.full(paths, float(initial_wealth))
+    prices = np.ones(paths)
+    depleted = np.zeros(paths, dtype=bool)
+    peak = wealth.copy()  # highest wealth so far, for the odds of reaching a goal by its date
+
+    yearly = np.empty((years + 1, paths))
+    yearly_real = np.empty((years + 1, paths))
+    yearly[0] = yearly_real[0] = wealth
+    goal_index = {month: i for i, month in enumerate(sorted(set(goal_months))) if 0 < month <= months}
+    peak_at_goals = np.empty((len(goal_index), paths))
+
+    for year in range(1, years + 1):
+        # A year of draws at a time: far fewer generator calls than one per month
+        growth = np.exp(rng.normal(monthly_mu, monthly_sigma, (12, paths)))
+        price_growth = np.exp(rng.normal(inflation_mu, inflation_sigma, (12, paths)))
+        for i in range(12):
+            month = (year - 1) * 12 + i + 1
+            wealth *= growth[i]
+            prices *= price_growth[i]
+            flow = (monthly_contribution if month <= contribution_months else 0.0) \
+                - (monthly_withdrawal if month > withdrawal_start else 0.0)
+            if flow:
+                wealth += flow * prices
+                depleted |= wealth <= 0
+                np.maximum(wealth, 0.0, out=wealth)
+            if goal_index:
+                np.maximum(peak, wealth, out=peak)
+                if month in goal_index:
+                    peak_at_goals[goal_index[month]] = peak
+        yearly[year] = wealth
+        yearly_real[year] = wealth / prices
+
+    return {
+        'yearly': yearly,
+        'yearly_real': yearly_real,
+        'goal_months': list(goal_index),
+        'peak_at_goals': peak_at_goals,
+        'depleted': depleted,
+    }
+
+
+def project(initial_wealth: float, years: int, goals: List[Dict[str, Any]] = (), today: Optional[date] = None,
+            **assumptions) -> Dict[str, Any]:
+    """Percentile bands per year and goal success probabilities
+
+    goals are dicts with title, target_amount and target_date; a goal's
+    probability is the share of paths whose wealth reaches its target at
+    any point up to its date, even if it dips again afterwards (None if the
+    date is beyond the projection).
+    """
+    today = today or date.today()
+    goal_months = [months_until(today, goal['target_date']) for goal in goals]
+    result = simulate(initial_wealth, years, goal_months=goal_months, **assumptions)
+
+    nominal = np.percentile(result['yearly'], PERCENTILES, axis=1)
+    real = np.percentile(result['yearly_real'], PERCENTILES, axis=1)
+    bands = [
+        {'year': year,
+         **{f'p{p}': float(nominal[i, year]) for i, p in enumerate(PERCENTILES)},
+         **{f'p{p}_real': float(real[i, year]) for i, p in enumerate(PERCENTILES)}}
+        for year in range(years + 1)
+    ]
+
+    rows = {month: i for i, month in enumerate(result['goal_months'])}
+    goal_results = []
+    for goal, month in zip(goals, goal_months):
+        row = rows.get(month)
+        if month == 0:
+            probability = float(initial_wealth >= goal['target_amount'])  # due now: either met or not
+        elif row is None:
+            probability = None
+        else:
+            probability = float((result['peak_at_goals'][row] >= goal['target_amount']).mean())
+        goal_results.append({**goal, 'target_date': goal['target_date'].isoformat(), 'months': month,
+                             'probability': probability})
+
+    return {
+        'bands': bands,
+        'final': bands[-1],
+        'depletion_probability': float(result['depleted'].mean()),
+        'goals': goal_results,
+    }
@@ -0,0 +1,288 @@
+"""
+Content-addressed disk cache for rendered PDF reports
+Reports are keyed by a hash of everything that goes into them, so a repeat
+download of unchanged data is a file read instead of a render. Reports are
+handed out as open files and streamed, never loaded whole into memory.
+"""
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Sequence
+
+# Code that shapes the rendered PDFs, relative to app/services; a directory means its .py files
+GENERATOR_SOURCES = ("report_document.py", "report_content.py", "report_engine.py", "report_layout.py", "report_themes",
+                     "health_scoring.py")
+
+
+def generator_version() -> str:
+    """Hash of the generator sources and the ReportLab version
+
+    Part of every cache key, so a deploy that changes how reports render
+    never serves renders from the previous code.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    digest = hashlib.sha256()
+    services = Path(__file__).parent
+    for name in GENERATOR_SOURCES:
+        path = services / name
+        for source in sorted(path.glob("*.py")) if path.is_dir() else [path]:
+            digest.update(source.relative_to(services).as_posix().encode("utf-8"))
+            digest.update(source.read_bytes())
+    try:
+        digest.update(version("reportlab").encode("utf-8"))
+    except PackageNotFoundError:
+        pass
+    return digest.hexdigest()[:16]
+
+
+GENERATOR_VERSION = generator_version()
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "wealthtracker-report-cache")
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+def report_cache_key(report_type: str, user_data: Dict[str, Any], financial_data: Dict[str, Any],
+                     day: Optional[date] = None, sections: Optional[Sequence[str]] = None) -> str:
+    """Stable hash of a report's inputs
+
+    Reports print the current date, so the day is part of the key: cached
+    renders are reused within a day and naturally expire overnight.
+    A partial report (sections) is keyed apart from the whole one.
+    """
+    parts = [report_type, GENERATOR_VERSION, (day or date.today()).isoformat(), user_data, financial_data]
+    if sections:
+        parts.append(list(sections))
+    payload = json.dumps(
+        parts,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReportFile:
+    """A rendered PDF held open read-only
+
+    Reads are positional (pread), so one file can be streamed to several
+    clients at once, and the content stays readable even if the cache
+    evicts (unlinks) the file meanwhile.
+    """
+
+    def __init__(self, fd: int, size: int, unlink_on_close: Optional[Path] = None):
+        self.fd: Optional[int] = fd
+        self.size = size
+        self._unlink_on_close = unlink_on_close
+
+    @classmethod
+    def open(cls, path: Path, delete: bool = False) -> "ReportFile":
+        """Open a rendered report; with delete=True the file is removed once nobody holds it"""
+        fd = os.open(path, os.O_RDONLY)
+        size = os.fstat(fd).st_size
+        pending = None
+        if delete:
+            try:
+                os.unlink(path)  # POSIX: the open descriptor keeps the data alive
+            except OSError:
+                pending = Path(path)
+        return cls(fd, size, pending)
+
+    def duplicate(self) -> "ReportFile":
+        """An independent handle to the same file, for a caller that will close it"""
+        return ReportFile(os.dup(self.fd), self.size)
+
+    def iter_chunks(self, chunk_size: int = STREAM_CHUNK_SIZE, close: bool = True) -> Iterator[bytes]:
+        """Yield the file in chunks, closing it afterwards (also if the client goes away)"""
+        try:
+            offset = 0
+            while offset < self.size:
+                chunk = os.pread(self.fd, min(chunk_size, self.size - offset), offset)
+                if not chunk:
+                    break
+                offset += len(chunk)
+                yield chunk
+        finally:
+            if close:
+                self.close()
+
+    def read(self) -> bytes:
+        return b"".join(self.iter_chunks(close=False))
+
+    def __del__(self):
+        # Safety net for a handle nobody closed (e.g. a response that was never sent)
+        if getattr(self, "fd", None) is not None or getattr(self, "_unlink_on_close", None) is not None:
+            self.close()
+
+    def close(self) -> None:
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+        if self._unlink_on_close is not None:
+            try:
+                os.unlink(self._unlink_on_close)
+            except OSError:
+                pass
+            self._unlink_on_close = None
+
+
+class ReportCache:
+    """Size-capped LRU cache of PDF files on local disk
+
+    Render workers write straight into the cache directory (temp_path, then
+    commit), so a render's bytes never pass through the API process. The
+    directory can be shared by several workers: files are swapped in
+    atomically, and an entry deleted by another process is just a miss.
+    Recency survives restarts via file mtimes, which hits refresh.
+    The directory holds users' financial reports: it is created private
+    (0700), and the cache disables itself if the directory is anyone
+    else's or others can get into it.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.directory = Path(directory or os.getenv("REPORT_CACHE_DIR", DEFAULT_CACHE_DIR))
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("REPORT_CACHE_MAX_MB", "256")) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.enabled = max_bytes > 0
+
+        # key -> size in bytes, least recently used first
+        self.entries: "OrderedDict[str, int]" = OrderedDict()
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_served = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pdf"
+
+    def _load(self) -> None:
+        """Rebuild the index from disk, oldest first (caller holds the lock)"""
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._check_private()
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pdf") and entry.is_file():
+                entry_stat = entry.stat()
+                files.append((entry_stat.st_mtime, entry.name[:-4], entry_stat.st_size))
+        files.sort()
+        self.entries = OrderedDict((key, size) for _, key, size in files)
+        self.total_bytes = sum(self.entries.values())
+        self._loaded = True
+
+    def _check_private(self) -> None:
+        """Refuse a directory another user owns (or could have planted) or others can read"""
+        info = os.lstat(self.directory)
+        if not stat.S_ISDIR(info.st_mode):
+            raise PermissionError(f"{self.directory} is not a directory")
+        if hasattr(os, "geteuid") and info.st_uid != os.geteuid():
+            raise PermissionError(f"{self.directory} is owned by another user")
+        if info.st_mode & 0o077:
+            raise PermissionError(f"{self.directory} is accessible to other users (mode {info.st_mode & 0o777:o})")
+
+    def available(self) -> bool:
+        """Whether reports can be stored and read here (the directory is usable and private)"""
+        return self.enabled and self._ensure_loaded()
+
+    def _ensure_loaded(self) -> bool:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    try:
+                        self._load()
+                    except OSError as e:
+                        # Unusable directory (read-only filesystem, not private, ...): render every time
+                        logger.warning("Report cache disabled: %s", e)
+                        self.enabled = False
+        return self.enabled
+
+    def open(self, key: str) -> Optional[ReportFile]:
+        """The cached report for a key, opened for streaming, or None"""
+        if not self.available():
+            return None
+        path = self._path(key)
+        try:
+            report = ReportFile.open(path)
+            os.utime(path)  # mark as recently used for other workers and restarts
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+                size = self.entries.pop(key, None)
+                if size is not None:
+                    self.total_bytes -= size  # evicted by another worker
+            return None
+        with self._lock:
+            self.hits += 1
+            self.bytes_served += report.size
+            if key in self.entries:
+                self.entries.move_to_end(key)
+        return report
+
+    def temp_path(self, key: str) -> Optional[Path]:
+        """A private path in the cache directory for a render to write to, or None if caching is unavailable"""
+        if not self.available():
+            return None
+        return self.directory / f"{key}.pdf.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+
+    def commit(self, key: str, temp_path: Path) -> ReportFile:
+        """Publish a finished render under its key and return it opened, evicting beyond the size cap"""
+        path = self._path(key)
+        with self._lock:
+            os.replace(temp_path, path)
+            # Open before evicting so our own entry can't disappear underneath us
+            report = ReportFile.open(path)
+
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous
+            self.entries[key] = report.size
+            self.total_bytes += report.size
+
+            if self.total_bytes > self.max_bytes:
+                # Other workers write here too; rescan so the cap applies to the whole directory
+                self._load()
+                if key in self.entries:
+                    self.entries.move_to_end(key)
+                while self.total_bytes > self.max_bytes and self.entries:
+                    old_key, size = self.entries.popitem(last=False)
+                    self.total_bytes -= size
+                    self.evictions += 1
+                    try:
+                        os.remove(self._path(old_key))
+                    except FileNotFoundError:
+                        pass
+        return report
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'directory': str(self.directory),
+            'entries': len(self.entries),
+            'bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'bytes_served': self.bytes_served
+        }
+
+
+report_cache = ReportCache()
@@ -0,0 +1,344 @@
+"""
+Report content
+What each report says, section by section, as plain blocks (covers, sections,
+tables, charts) with no layout in them; report_document draws the blocks in
+whichever theme a generator uses. Nothing here imports ReportLab.
+"""
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Pages of each report, in report order
+WEALTH_SECTIONS = ("cover", "overview", "allocation", "trends", "advice", "projections")
+HEALTH_SECTIONS = ("score", "breakdown", "recommendations")
+ESTATE_SECTIONS = ("cover", "tax")
+
+# Health metric key -> label, in the order the reports list them
+HEALTH_METRIC_LABELS = {
+    'emergency_fund': 'Emergency Fund',
+    'expense_ratio': 'Expense Control',
+    'milestones': 'Milestone Progress',
+    'insurance': 'Insurance',
+    'diversification': 'Diversification',
+    'estate_planning': 'Estate Planning',
+}
+
+INHERITANCE_TAX_THRESHOLD = 325000
+INHERITANCE_TAX_RATE = 0.4
+
+
+def select_sections(available: Tuple[str, ...], sections: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    """The requested sections in report order; None (or nothing) means the whole report"""
+    if not sections:
+        return available
+    unknown = set(sections) - set(available)
+    if unknown:
+        raise ValueError(f"Unknown report sections: {', '.join(sorted(unknown))}. Choose from: {', '.join(available)}")
+    return tuple(section for section in available if section in sections)
+
+
+def traffic_light(score: float) -> str:
+    """'green', 'amber' or 'red' for a 0-100 score"""
+    if score >= 80:
+        return 'green'
+    elif score >= 60:
+        return 'amber'
+    return 'red'
+
+
+class Table(NamedTuple):
+    title: str
+    columns: Tuple[str, ...]
+    rows: Tuple[Tuple[str, ...], ...]
+
+
+class Chart(NamedTuple):
+    kind: str                              # 'pie' or 'bar'
+    title: str
+    items: Tuple[Tuple[str, float], ...]   # (label, value)
+    value_format: str = '£%s'
+
+
+class Cover(NamedTuple):
+    title: Tuple[str, ...]   # one word or phrase per line
+    subtitle: str
+    name: str
+    facts: Tuple[str, ...]
+
+
+class ScoreCover(NamedTuple):
+    title: Tuple[str, ...]
+    name: str
+    score: float             # 0-100
+    label: str
+
+
+class Section(NamedTuple):
+    """A numbered section
+
+    lines are the section's text: a line ending in ':' heads the lines after
+    it, '• ' starts a bullet and '' is a gap. A half-panel section has a side
+    (the aside lines, a table or traffic-light scores) that page layouts draw
+    beside it and flowing layouts after it; charts only appear in flowing
+    layouts.
+    """
+    number: str
+    title: str
+    lines: Tuple[str, ...]
+    panel: str = 'full'                              # 'full' or 'half'
+    color: str = 'primary'                           # palette role of the section's panel or header
+    aside_title: str = ''
+    aside: Tuple[str, ...] = ()
+    table: Optional[Table] = None
+    scores: Tuple[Tuple[str, float], ...] = ()       # (label, 0-100 score)
+    chart: Optional[Chart] = None
+
+
+def _money(value: float) -> str:
+    return f"£{value:,.0f}"
+
+
+def _name(user_data: Dict[str, Any]) -> str:
+    return user_data.get('name', 'VALUED CLIENT')
+
+
+# Wealth report: each section reads only the inputs report_data.SECTION_INPUTS lists for it
+
+def _wealth_cover(user_data, financial_data) -> Cover:
+    return Cover(
+        title=('WEALTH', 'REPORT'),
+        subtitle=datetime.now().strftime('%Y'),
+        name=_name(user_data),
+        facts=(f"Net Worth: {_money(financial_data.get('net_worth', 0))}",
+               f"Health Score: {financial_data.get('health_score', 0)}/1000")
+    )
+
+
+def _wealth_overview(user_data, financial_data) -> Section:
+    return Section('01', 'FINANCIAL OVERVIEW', (
+        f"Net Worth: {_money(financial_data.get('net_worth', 0))}",
+        f"Total Assets: {_money(financial_data.get('total_assets', 0))}",
+        f"Monthly Income: {_money(financial_data.get('monthly_income', 0))}",
+        f"Monthly Expenses: {_money(financial_data.get('monthly_expenses', 0))}",
+        f"Health Score: {financial_data.get('health_score', 0)}/1000",
+        "",
+        "Your financial position demonstrates strong",
+        "wealth accumulation with diversified assets",
+        "across multiple categories and consistent",
+        "growth trajectory over time."
+    ))
+
+
+def _wealth_allocation(user_data, financial_data) -> Section:
+    assets = financial_data.get('assets', {})
+    total_assets = sum(assets.values())
+    rows = tuple((asset_type, _money(value), f"{(value / total_assets) * 100 if total_assets > 0 else 0:.1f}%")
+                 for asset_type, value in assets.items())
+    return Section('02', 'ASSET ALLOCATION', (
+        "Cash & Savings:",
+        _money(assets.get('Cash & Savings', 0)),
+        "",
+        "Investments:",
+        _money(assets.get('Investments', 0)),
+        "",
+        "Property:",
+        _money(assets.get('Property', 0)),
+        "",
+        "Diversification Score: 8.5/10"
+    ), panel='half', color='accent',
+        table=Table('ASSET BREAKDOWN', ('Asset Type', 'Value', 'Share'), rows),
+        chart=Chart('pie', 'Asset Distribution', tuple(assets.items())) if total_assets > 0 else None)
+
+
+def _wealth_trends(user_data, financial_data) -> Section:
+    return Section('03', 'WEALTH TRENDS', (
+        "6-Month Performance:",
+        "• Growth: +£45,000 (+16.1%)",
+        "• Monthly Average: £7,500",
+        "• Best Month: April 2024",
+        "",
+        "12-Month Performance:",
+        "• Total Growth: +£78,000 (+32.8%)",
+        "• Compound Annual Growth: 28.5%",
+        "• Risk-Adjusted Return: 15.2%",
+        "",
+        "Key Drivers:",
+        "• Investment portfolio performance",
+        "• Property value appreciation",
+        "• Consistent savings discipline"
+    ))
+
+
+def _wealth_advice(user_data, financial_data) -> Section:
+    return Section('04', 'STRATEGIC ADVICE', (
+        "Immediate Actions:",
+        "• Increase emergency fund",
+        "• Diversify internationally",
+        "• Optimize tax efficiency",
+        "",
+        "Medium-term Goals:",
+        "• Property investment review",
+        "• Pension contribution increase",
+        "• Insurance coverage audit",
+        "",
+        "Long-term Strategy:",
+        "• Wealth preservation planning",
+        "• Estate planning review",
+        "• Legacy structure setup"
+    ), panel='half', color='accent', aside_title='DETAILED RECOMMENDATIONS', aside=(
+        "1. Increase emergency fund to 8 months of expenses",
+        "2. Consider international equity diversification",
+        "3. Maximize pension contributions for tax benefits",
+        "4. Review life insurance coverage adequacy",
+        "5. Explore property investment opportunities",
+        "6. Implement tax-efficient investment strategies",
+        "7. Schedule quarterly portfolio rebalancing",
+        "8. Consider wealth preservation trusts"
+    ))
+
+
+def _wealth_projections(user_data, financial_data) -> Section:
+    current_wealth = financial_data.get('net_worth', 0)
+    moderate = (('5 Years', current_wealth * 1.47), ('10 Years', current_wealth * 2.16),
+                ('15 Years', current_wealth * 3.17))
+    return Section('05', 'PROJECTIONS', (
+        "Conservative Scenario (5% annual growth):",
+        f"• 5 years: {_money(current_wealth * 1.28)}",
+        f"• 10 years: {_money(current_wealth * 1.63)}",
+        f"• 15 years: {_money(current_wealth * 2.08)}",
+        "",
+        "Moderate Scenario (8% annual growth):",
+        f"• 5 years: {_money(current_wealth * 1.47)}",
+        f"• 10 years: {_money(current_wealth * 2.16)}",
+        f"• 15 years: {_money(current_wealth * 3.17)}",
+        "",
+        "Optimistic Scenario (12% annual growth):",
+        f"• 5 years: {_money(current_wealth * 1.76)}",
+        f"• 10 years: {_money(current_wealth * 3.11)}",
+        f"• 15 years: {_money(current_wealth * 5.47)}"
+    ), chart=Chart('bar', 'Wealth Projections (8% Annual Growth)', moderate) if current_wealth > 0 else None)
+
+
+# Health report sections read the scores calculate_health_metrics() gives
+
+def _health_score(user_data, metrics) -> ScoreCover:
+    return ScoreCover(('FINANCIAL', 'HEALTH CHECK'), _name(user_data), metrics['overall'], 'FINANCIAL HEALTH SCORE')
+
+
+def _health_breakdown(user_data, metrics) -> Section:
+    return Section('01', 'HEALTH BREAKDOWN', (
+        f"Emergency Fund: {int(metrics['emergency_fund'])}/100",
+        "• 6 months expenses recommended",
+        "• Current coverage assessment",
+        "",
+        f"Expense Control: {int(metrics['expense_ratio'])}/100",
+        f"• {metrics['expense_percentage']:.1f}% of income spent",
+        "• Target: <70% of income",
+        "",
+        f"Milestone Achievement: {int(metrics['milestones'])}/100",
+        "• Progress toward financial goals",
+        "• Target achievement rate",
+        "",
+        f"Insurance Coverage: {int(metrics['insurance'])}/100",
+        "• Life, health, property protection",
+        "• Coverage adequacy analysis",
+        "",
+        f"Asset Diversification: {int(metrics['diversification'])}/100",
+        "• Portfolio balance assessment",
+        "• Risk distribution analysis",
+        "",
+        f"Estate Planning: {int(metrics['estate_planning'])}/100",
+        "• Will, solicitor, power of attorney",
+        "• Legal documentation status"
+    ), chart=Chart('bar', 'Health Score Breakdown',
+                   tuple((label, round(metrics[key], 1)) for key, label in HEALTH_METRIC_LABELS.items()), '%s'))
+
+
+def _health_recommendations(user_data, metrics) -> Section:
+    return Section('02', 'RECOMMENDATIONS', (
+        "Priority Actions:",
+        "• Build emergency fund to 6 months",
+        "• Review insurance coverage gaps",
+        "• Complete will and estate planning",
+        "• Diversify investment portfolio",
+        "",
+        "Next Steps:",
+        "• Schedule solicitor consultation",
+        "• Update power of attorney",
+        "• Review milestone timelines",
+        "• Optimize asset allocation"
+    ), panel='half', color='accent', aside_title='TRAFFIC LIGHT ASSESSMENT',
+        scores=tuple((label, metrics[key]) for key, label in HEALTH_METRIC_LABELS.items()))
+
+
+# Estate planning report
+
+def _estate_cover(user_data, financial_data) -> Cover:
+    net_worth = financial_data.get('net_worth', 0)
+    return Cover(
+        title=('ESTATE', 'PLANNING'),
+        subtitle=datetime.now().strftime('%Y'),
+        name=_name(user_data),
+        facts=(f"Estate Value: {_money(net_worth)}", f"Potential Tax: {_money(_potential_tax(net_worth))}")
+    )
+
+
+def _estate_tax(user_data, financial_data) -> Section:
+    net_worth = financial_data.get('net_worth', 0)
+    taxable = max(0, net_worth - INHERITANCE_TAX_THRESHOLD)
+    potential_tax = _potential_tax(net_worth)
+    return Section('01', 'TAX PLANNING', (
+        "Current Position:",
+        f"• Estate Value: {_money(net_worth)}",
+        f"• Tax-Free Allowance: {_money(INHERITANCE_TAX_THRESHOLD)}",
+        f"• Taxable Amount: {_money(taxable)}",
+        f"• Potential Tax (40%): {_money(potential_tax)}",
+        "",
+        "Optimization Strategies:",
+        "• Annual gifting allowance (£3,000)",
+        "• Spouse exemption utilization",
+        "• Trust structures for tax efficiency",
+        "• Business property relief options",
+        "• Charitable giving benefits"
+    ), chart=Chart('pie', 'Estate Tax Breakdown', (
+        ('Tax-Free Allowance', INHERITANCE_TAX_THRESHOLD),
+        ('Taxable Estate', taxable),
+        ('Tax Due (40%)', potential_tax)
+    )) if taxable > 0 else None)
+
+
+def _potential_tax(net_worth: float) -> float:
+    return max(0, (net_worth - INHERITANCE_TAX_THRESHOLD) * INHERITANCE_TAX_RATE)
+
+
+# Report type -> (sections in report order, section -> builder)
+REPORTS: Dict[str, Tuple[Tuple[str, ...], Dict[str, Callable]]] = {
+    "wealth": (WEALTH_SECTIONS, {
+        "cover": _wealth_cover,
+        "overview": _wealth_overview,
+        "allocation": _wealth_allocation,
+        "trends": _wealth_trends,
+        "advice": _wealth_advice,
+        "projections": _wealth_projections,
+    }),
+    "financial-health": (HEALTH_SECTIONS, {
+        "score": _health_score,
+        "breakdown": _health_breakdown,
+        "recommendations": _health_recommendations,
+    }),
+    "estate-planning": (ESTATE_SECTIONS, {
+        "cover": _estate_cover,
+        "tax": _estate_tax,
+    }),
+}
+
+
+def report_blocks(report_type: str, user_data: Dict[str, Any], financial_data: Dict[str, Any],
+                  sections: Optional[Sequence[str]] = None) -> List[Any]:
+    """The blocks of a report (or of just the given sections), in report order"""
+    available, builders = REPORTS[report_type]
+    selected = select_sections(available, sections)
+    if report_type == "financial-health":
+        # NumPy is only needed by the health report, so it isn't imported with the content
+        from app.services.health_scoring import calculate_health_metrics
+        financial_data = calculate_health_metrics(financial_data, user_data)
+    return [builders[section](user_data, financial_data) for section in selected]
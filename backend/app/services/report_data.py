@@ -0,0 +1,424 @@
+"""
+Report data builder
+Gathers every input the PDF reports use (assets, wealth snapshots, income,
+expenses, milestones, insurance and estate details) for one user or a batch
+of users in a fixed number of set-based queries, and shapes it into the
+user_data / financial_data dicts all generators share
+"""
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, TypedDict
+
+import numpy as np
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from app.models import (
+    AssetDetail, ExpenseRecord, IncomeRecord, InsurancePolicy, Milestone, User, WealthRecord
+)
+from app.services.health_scoring import (
+    HEALTH_COLUMNS, HEALTH_INPUT_GROUPS, calculate_health_metrics, health_columns, is_documented, score_health
+)
+from app.services.report_content import (HEALTH_METRIC_LABELS, INHERITANCE_TAX_RATE, INHERITANCE_TAX_THRESHOLD,
+                                         traffic_light)
+
+# asset_details.asset_category / wealth_records column -> report category, in report order
+REPORT_CATEGORIES = {
+    'cash_savings': 'Cash & Savings',
+    'stocks_securities': 'Investments',
+    'real_estate': 'Property',
+    'retirement_accounts': 'Retirement',
+    'business_assets': 'Other',
+    'other_investments': 'Other',
+}
+CATEGORY_ORDER = ['Cash & Savings', 'Investments', 'Property', 'Retirement', 'Other']
+
+CASHFLOW_MONTHS = 3  # income and expenses are averaged over this many recent months
+
+# Inputs a report can draw on; 'health_score' needs all the others
+REPORT_INPUTS = ('assets', 'cashflow', 'milestones', 'insurance', 'health_score')
+# Report section -> the inputs its page reads (see the section builders in
+# report_content); sections not listed here read everything
+SECTION_INPUTS = {
+    'cover': ('assets', 'health_score'),
+    'overview': ('assets', 'cashflow', 'health_score'),
+    'allocation': ('assets',),
+    'trends': (),
+    'advice': (),
+    'projections': ('assets',),
+}
+
+
+class UserData(TypedDict):
+    name: str
+    email: str
+    currency: str
+    insurance_policies: str
+    will_location: str
+    solicitor_name: str
+    power_of_attorney_location: str
+
+
+class MilestoneData(TypedDict):
+    title: str
+    is_completed: bool
+    target_amount: float
+    current_amount: float
+
+
+class InsuranceData(TypedDict):
+    policy_type: str
+    provider: str
+    coverage_amount: float
+    monthly_premium: float
+
+
+class FinancialData(TypedDict):
+    net_worth: float
+    total_assets: float
+    total_liabilities: float
+    assets: Dict[str, float]
+    liabilities: Dict[str, float]
+    monthly_income: float
+    monthly_expenses: float
+    emergency_fund: float
+    health_score: int
+    milestones: List[MilestoneData]
+    insurance: List[InsuranceData]
+    inheritance_tax_threshold: float
+    potential_tax: float
+    last_updated: Optional[str]
+
+
+ReportData = Tuple[UserData, FinancialData]
+
+
+class ReportDataBuilder:
+    """Loads report inputs for many users at once
+
+    Each build runs at most six queries (plus one for the users when given
+    ids) whatever the number of users: every table is read once with
+    user_id IN (...) and aggregated in SQL where possible. Given report
+    sections, only the queries those sections read are run; the other
+    fields are left empty.
+    """
+
+    def __init__(self, db: Session, today: Optional[date] = None):
+        self.db = db
+        self.today = today or date.today()
+        self.queries = 0
+
+    def for_user(self, user: User, sections: Optional[Sequence[str]] = None) -> ReportData:
+        """Report data for one already-loaded user, for the given report sections (default: all)"""
+        return self.build_for_users([user], sections)[user.id]
+
+    def build(self, user_ids: Iterable[int]) -> Dict[int, ReportData]:
+        """Report data for users by id; unknown ids are left out"""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+        users = self._execute(select(User).where(User.id.in_(user_ids)).order_by(User.id)).scalars().all()
+        return self.build_for_users(users)
+
+    def build_for_users(self, users: Sequence[User],
+                        sections: Optional[Sequence[str]] = None) -> Dict[int, ReportData]:
+        user_ids = [user.id for user in users]
+        if not user_ids:
+            return {}
+
+        inputs = section_inputs(sections)
+        assets, liabilities, snapshots = {}, {}, {}
+        if 'assets' in inputs:
+            assets, liabilities = self._asset_totals(user_ids)
+            snapshots = self._latest_snapshots(user_ids)
+        income, expenses = {}, {}
+        if 'cashflow' in inputs:
+            since = self.today - timedelta(days=30 * CASHFLOW_MONTHS)
+            income = self._sums(IncomeRecord.user_id, IncomeRecord.amount, IncomeRecord.income_date, user_ids, since)
+            expenses = self._sums(ExpenseRecord.user_id, ExpenseRecord.amount, ExpenseRecord.expense_date, user_ids, since)
+        milestones = self._milestones(user_ids) if 'milestones' in inputs else {}
+        insurance = self._insurance(user_ids) if 'insurance' in inputs else {}
+
+        data = {}
+        for user in users:
+            snapshot = snapshots.get(user.id)
+            user_data = self._user_data(user, insurance.get(user.id, []))
+            financial_data = self._financial_data(
+                _user_assets(user.id, assets, snapshots), liabilities.get(user.id, {}),
+                income.get(user.id, 0.0), expenses.get(user.id, 0.0),
+                milestones.get(user.id, []), insurance.get(user.id, []),
+                snapshot.date.isoformat() if snapshot is not None else None
+            )
+            data[user.id] = (user_data, financial_data)
+
+        if 'health_score' not in inputs:
+            return data
+        # Score the whole batch in one vectorized pass
+        overall = score_health(health_columns(data.values()))['overall']
+        for (user_data, financial_data), score in zip(data.values(), overall):
+            financial_data['health_score'] = round(float(score) * 10)
+        return data
+
+    def health_columns(self, users: Sequence[User], groups: Optional[Iterable[str]] = None,
+                       batch_size: int = 5000) -> Dict[str, np.ndarray]:
+        """score_health input columns for users, in order, without building full report data
+
+        groups limits the columns to those input groups (see HEALTH_INPUT_GROUPS)
+        and skips the other queries. Milestones and insurance are counted in
+        SQL rather than loaded, so this scales to a whole client book; users
+        are queried batch_size at a time to stay under the database's
+        bound-parameter limit.
+        """
+        groups = set(HEALTH_INPUT_GROUPS if groups is None else groups)
+        names = [name for name in HEALTH_COLUMNS if any(name in HEALTH_INPUT_GROUPS[group] for group in groups)]
+        batches = [self._health_columns(users[start:start + batch_size], groups)
+                   for start in range(0, len(users), batch_size)]
+        return {name: np.concatenate([batch[name] for batch in batches]) if batches
+                else np.zeros(0, dtype=HEALTH_COLUMNS[name]) for name in names}
+
+    def _health_columns(self, users, groups):
+        user_ids = [user.id for user in users]
+        values = defaultdict(list)
+
+        if 'assets' in groups:
+            assets, _ = self._asset_totals(user_ids)
+            snapshots = self._latest_snapshots(user_ids)
+            for user in users:
+                user_assets = _user_assets(user.id, assets, snapshots)
+                values['cash'].append(user_assets.get('Cash & Savings', 0.0))
+                values['asset_total'].append(sum(user_assets.values()))
+                values['asset_max'].append(max(user_assets.values(), default=0.0))
+
+        if 'cashflow' in groups:
+            since = self.today - timedelta(days=30 * CASHFLOW_MONTHS)
+            income = self._sums(IncomeRecord.user_id, IncomeRecord.amount, IncomeRecord.income_date, user_ids, since)
+            expenses = self._sums(ExpenseRecord.user_id, ExpenseRecord.amount, ExpenseRecord.expense_date, user_ids, since)
+            for user in users:
+                values['monthly_income'].append(income.get(user.id, 0.0) / CASHFLOW_MONTHS)
+                values['monthly_expenses'].append(expenses.get(user.id, 0.0) / CASHFLOW_MONTHS)
+
+        if 'milestones' in groups:
+            milestone_counts = self._milestone_counts(user_ids)
+            for user in users:
+                total, completed = milestone_counts.get(user.id, (0, 0))
+                values['milestones_total'].append(total)
+                values['milestones_completed'].append(completed)
+
+        if 'insurance' in groups:
+            insured = set(self._execute(
+                select(InsurancePolicy.user_id)
+                .where(InsurancePolicy.user_id.in_(user_ids), InsurancePolicy.is_active.is_(True))
+                .distinct()
+            ).scalars())
+            for user in users:
+                # Same rule as _user_data: free text or a tracked active policy
+                values['has_insurance'].append(is_documented(user.insurance_policies) or user.id in insured)
+
+        if 'estate' in groups:
+            for user in users:
+                values['has_will'].append(is_documented(user.will_location))
+                values['has_solicitor'].append(is_documented(user.solicitor_name))
+                values['has_power_of_attorney'].append(is_documented(user.power_of_attorney_location))
+
+        return {name: np.array(column, dtype=HEALTH_COLUMNS[name]) for name, column in values.items()}
+
+    def _execute(self, statement):
+        self.queries += 1
+        return self.db.execute(statement)
+
+    def _asset_totals(self, user_ids):
+        rows = self._execute(
+            select(AssetDetail.user_id, AssetDetail.asset_category,
+                   func.sum(AssetDetail.value), func.sum(AssetDetail.mortgage_balance))
+            .where(AssetDetail.user_id.in_(user_ids))
+            .group_by(AssetDetail.user_id, AssetDetail.asset_category)
+        )
+        assets = defaultdict(lambda: defaultdict(float))
+        liabilities = defaultdict(dict)
+        for user_id, category, value, mortgage in rows:
+            assets[user_id][REPORT_CATEGORIES.get(category, 'Other')] += value or 0.0
+            if mortgage:
+                liabilities[user_id]['Mortgage'] = liabilities[user_id].get('Mortgage', 0.0) + mortgage
+        return assets, liabilities
+
+    def _latest_snapshots(self, user_ids):
+        latest = (
+            select(WealthRecord.user_id, func.max(WealthRecord.date).label('date'))
+            .where(WealthRecord.user_id.in_(user_ids))
+            .group_by(WealthRecord.user_id)
+            .subquery()
+        )
+        records = self._execute(
+            select(WealthRecord)
+            .join(latest, (WealthRecord.user_id == latest.c.user_id) & (WealthRecord.date == latest.c.date))
+            .order_by(WealthRecord.id)
+        ).scalars()
+        return {record.user_id: record for record in records}  # same-day duplicates: the last one entered wins
+
+    def _sums(self, user_column, amount_column, date_column, user_ids, since):
+        rows = self._execute(
+            select(user_column, func.sum(amount_column))
+            .where(user_column.in_(user_ids), date_column >= since)
+            .group_by(user_column)
+        )
+        return {user_id: total or 0.0 for user_id, total in rows}
+
+    def _milestones(self, user_ids):
+        rows = self._execute(
+            select(Milestone.user_id, Milestone.title, Milestone.is_completed,
+                   Milestone.target_amount, Milestone.current_amount)
+            .where(Milestone.user_id.in_(user_ids))
+            .order_by(Milestone.user_id, Milestone.id)
+        )
+        milestones = defaultdict(list)
+        for user_id, title, is_completed, target_amount, current_amount in rows:
+            milestones[user_id].append(MilestoneData(
+                title=title, is_completed=bool(is_completed),
+                target_amount=target_amount or 0.0, current_amount=current_amount or 0.0
+            ))
+        return milestones
+
+    def _milestone_counts(self, user_ids):
+        rows = self._execute(
+            select(Milestone.user_id, func.count(Milestone.id),
+                   func.sum(case((Milestone.is_completed.is_(True), 1), else_=0)))
+            .where(Milestone.user_id.in_(user_ids))
+            .group_by(Milestone.user_id)
+        )
+        return {user_id: (total, completed or 0) for user_id, total, completed in rows}
+
+    def _insurance(self, user_ids):
+        rows = self._execute(
+            select(InsurancePolicy.user_id, InsurancePolicy.policy_type, InsurancePolicy.provider,
+                   InsurancePolicy.coverage_amount, InsurancePolicy.monthly_premium)
+            .where(InsurancePolicy.user_id.in_(user_ids), InsurancePolicy.is_active.is_(True))
+            .order_by(InsurancePolicy.user_id, InsurancePolicy.id)
+        )
+        policies = defaultdict(list)
+        for user_id, policy_type, provider, coverage_amount, monthly_premium in rows:
+            policies[user_id].append(InsuranceData(
+                policy_type=policy_type, provider=provider,
+                coverage_amount=coverage_amount or 0.0, monthly_premium=monthly_premium or 0.0
+            ))
+        return policies
+
+    def _user_data(self, user: User, insurance: List[InsuranceData]) -> UserData:
+        # Policies tracked in the app count as documented insurance even if the free-text field is empty
+        insurance_text = user.insurance_policies or ', '.join(
+            f"{policy['policy_type']} ({policy['provider']})" for policy in insurance)
+        return UserData(
+            name=user.name or 'User',
+            email=user.email or '',
+            currency=user.home_currency or 'GBP',
+            insurance_policies=insurance_text,
+            will_location=user.will_location or '',
+            solicitor_name=user.solicitor_name or '',
+            power_of_attorney_location=user.power_of_attorney_location or ''
+        )
+
+    def _financial_data(self, assets, liabilities, income, expenses, milestones, insurance,
+                        last_updated) -> FinancialData:
+        total_assets = sum(assets.values())
+        total_liabilities = sum(liabilities.values())
+        net_worth = total_assets - total_liabilities
+        return FinancialData(
+            net_worth=net_worth,
+            total_assets=total_assets,
+            total_liabilities=total_liabilities,
+            assets=assets,
+            liabilities=liabilities,
+            monthly_income=income / CASHFLOW_MONTHS,
+            monthly_expenses=expenses / CASHFLOW_MONTHS,
+            emergency_fund=assets.get('Cash & Savings', 0.0),
+            health_score=0,
+            milestones=milestones,
+            insurance=insurance,
+            inheritance_tax_threshold=INHERITANCE_TAX_THRESHOLD,
+            potential_tax=max(0.0, net_worth - INHERITANCE_TAX_THRESHOLD) * INHERITANCE_TAX_RATE,
+            last_updated=last_updated
+        )
+
+
+def report_preview(user_data: UserData, financial_data: FinancialData) -> Dict[str, Any]:
+    """The figures the PDF reports show, as JSON for rendering in the app
+
+    Health scores come from the same calculate_health_metrics call the
+    financial-health report makes, so the preview and the PDF always agree.
+    """
+    metrics = calculate_health_metrics(financial_data, user_data)
+    total_assets = financial_data['total_assets']
+    milestones = financial_data['milestones']
+    return {
+        'currency': user_data['currency'],
+        'last_updated': financial_data['last_updated'],
+        'health': {
+            'score': round(metrics['overall'], 1),
+            'status': traffic_light(metrics['overall']),
+            'expense_percentage': round(metrics['expense_percentage'], 1),
+            'metrics': [
+                {'key': key, 'label': label, 'score': round(metrics[key], 1), 'status': traffic_light(metrics[key])}
+                for key, label in HEALTH_METRIC_LABELS.items()
+            ]
+        },
+        'summary': {
+            'net_worth': financial_data['net_worth'],
+            'total_assets': total_assets,
+            'total_liabilities': financial_data['total_liabilities'],
+            'monthly_income': financial_data['monthly_income'],
+            'monthly_expenses': financial_data['monthly_expenses'],
+            'emergency_fund': financial_data['emergency_fund']
+        },
+        'assets': [
+            {'category': category, 'value': value, 'share': value / total_assets * 100 if total_assets else 0.0}
+            for category, value in financial_data['assets'].items()
+        ],
+        'liabilities': [
+            {'category': category, 'value': value} for category, value in financial_data['liabilities'].items()
+        ],
+        'milestones': {
+            'completed': sum(1 for milestone in milestones if milestone['is_completed']),
+            'total': len(milestones),
+            'items': [
+                {**milestone, 'progress': min(100.0, milestone['current_amount'] / milestone['target_amount'] * 100)
+                 if milestone['target_amount'] else 0.0}
+                for milestone in milestones
+            ]
+        },
+        'estate': {
+            'inheritance_tax_threshold': financial_data['inheritance_tax_threshold'],
+            'potential_tax': financial_data['potential_tax']
+        }
+    }
+
+
+def section_inputs(sections: Optional[Sequence[str]] = None) -> set:
+    """The REPORT_INPUTS the given report sections read; no sections means the whole report"""
+    if not sections:
+        return set(REPORT_INPUTS)
+    inputs = set()
+    for section in sections:
+        inputs.update(SECTION_INPUTS.get(section, REPORT_INPUTS))
+    if 'health_score' in inputs:
+        inputs.update(REPORT_INPUTS)
+    return inputs
+
+
+def _user_assets(user_id: int, assets, snapshots) -> Dict[str, float]:
+    user_assets = assets.get(user_id)
+    snapshot = snapshots.get(user_id)
+    if not user_assets and snapshot is not None:
+        # No itemised assets yet: fall back to the latest wealth snapshot
+        user_assets = _snapshot_categories(snapshot)
+    return _ordered(user_assets or {})
+
+
+def _snapshot_categories(record: WealthRecord) -> Dict[str, float]:
+    totals = defaultdict(float)
+    for column, category in REPORT_CATEGORIES.items():
+        totals[category] += getattr(record, column) or 0.0
+    return totals
+
+
+def _ordered(assets: Dict[str, float]) -> Dict[str, float]:
+    """Non-zero categories in report order"""
+    return {category: assets[category] for category in CATEGORY_ORDER if assets.get(category, 0) > 0}
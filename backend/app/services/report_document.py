@@ -0,0 +1,488 @@
+"""
+Report layout engine
+Draws a report's content blocks (see report_content) in a theme. Themes with
+the "pages" layout get one page per block, drawn straight on the canvas in
+large color panels; "flow" themes are laid out with platypus using the
+theme's paragraph styles and page decoration. Platypus and the chart widgets
+are only imported for flowing themes, so render workers drawing the stunning
+theme never load them.
+"""
+import io
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence
+
+from reportlab.lib.pagesizes import A4
+
+from app.services.report_content import Cover, ScoreCover, Section, Table, report_blocks, traffic_light
+from app.services.report_engine import report_engine
+from app.services.report_themes import Theme, get_theme
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+
+# Traffic light -> palette role it is drawn in, and the word flowing layouts print beside a score
+TRAFFIC_LIGHT_ROLES = {'green': 'success', 'amber': 'warning', 'red': 'danger'}
+TRAFFIC_LIGHT_LABELS = {'green': 'On track', 'amber': 'Review', 'red': 'Act now'}
+
+# Style role -> ParagraphStyle settings before the theme's STYLES overrides;
+# values of *Color settings are palette roles
+BASE_STYLES = {
+    'title': {'fontSize': 28, 'leading': 34, 'spaceAfter': 30, 'alignment': 1, 'textColor': 'dark', 'font': 'bold'},
+    'subtitle': {'fontSize': 16, 'leading': 20, 'spaceAfter': 10, 'alignment': 1, 'textColor': 'dark', 'font': 'bold'},
+    'section': {'fontSize': 20, 'leading': 24, 'spaceBefore': 20, 'spaceAfter': 12, 'textColor': 'dark',
+                'font': 'bold'},
+    'subsection': {'fontSize': 14, 'leading': 17, 'spaceBefore': 12, 'spaceAfter': 8, 'textColor': 'dark',
+                   'font': 'bold'},
+    'body': {'fontSize': 11, 'leading': 14, 'spaceAfter': 6, 'textColor': 'text', 'font': 'regular'},
+    'highlight': {'fontSize': 12, 'leading': 15, 'spaceBefore': 12, 'spaceAfter': 12, 'leftIndent': 20,
+                  'rightIndent': 20, 'alignment': 1, 'textColor': 'dark', 'backColor': 'highlight', 'font': 'bold'},
+    'metric': {'fontSize': 48, 'leading': 56, 'spaceAfter': 10, 'alignment': 1, 'textColor': 'primary',
+               'font': 'bold'},
+    'metric_label': {'fontSize': 14, 'leading': 17, 'spaceAfter': 20, 'alignment': 1, 'textColor': 'muted',
+                     'font': 'regular'},
+}
+
+
+def render_report(theme_name: str, report_type: str, user_data: Dict[str, Any], financial_data: Dict[str, Any],
+                  output: Optional[BinaryIO] = None, sections: Optional[Sequence[str]] = None) -> Optional[bytes]:
+    """Render a report (or just some of its sections) in a theme
+
+    Writes straight to output if given and returns None, otherwise returns the PDF bytes.
+    """
+    theme = get_theme(theme_name)
+    blocks = report_blocks(report_type, user_data, financial_data, sections)
+    buffer = output if output is not None else io.BytesIO()
+    if theme.layout == "pages":
+        PageLayout(theme).draw(blocks, buffer)
+    else:
+        FlowLayout(theme).draw(blocks, buffer)
+    if output is not None:
+        return None
+    return buffer.getvalue()
+
+
+def prepare_theme(theme_name: str) -> None:
+    """Load a theme and build what its renders share, e.g. when a render worker starts"""
+    theme = get_theme(theme_name)
+    if theme.layout == "pages":
+        from reportlab.pdfgen import canvas  # noqa: F401
+    else:
+        FlowLayout(theme)
+
+
+class ThemedReportGenerator:
+    """Every report, drawn in the generator's theme
+
+    A generator is just a theme name; instances hold no state, so one can be
+    made per render.
+    """
+
+    theme_name = ""
+
+    def generate_wealth_report(self, user_data: Dict[str, Any], financial_data: Dict[str, Any],
+                               output: Optional[BinaryIO] = None,
+                               sections: Optional[Sequence[str]] = None) -> Optional[bytes]:
+        """Generate the wealth report; sections limits it to those pages (see WEALTH_SECTIONS)"""
+        return render_report(self.theme_name, "wealth", user_data, financial_data, output, sections)
+
+    def generate_financial_health_report(self, user_data: Dict[str, Any], financial_data: Dict[str, Any],
+                                         output: Optional[BinaryIO] = None,
+                                         sections: Optional[Sequence[str]] = None) -> Optional[bytes]:
+        """Generate the financial health report; sections limits it to those pages (see HEALTH_SECTIONS)"""
+        return render_report(self.theme_name, "financial-health", user_data, financial_data, output, sections)
+
+    def generate_estate_planning_report(self, user_data: Dict[str, Any], financial_data: Dict[str, Any],
+                                        output: Optional[BinaryIO] = None) -> Optional[bytes]:
+        """Generate the estate planning report"""
+        return render_report(self.theme_name, "estate-planning", user_data, financial_data, output)
+
+
+class PageLayout:
+    """One canvas-drawn page per block: color panels, big numbers and a brand footer"""
+
+    def __init__(self, theme: Theme):
+        self.colors = theme.colors
+        self.regular = theme.fonts['regular']
+        self.bold = theme.fonts['bold']
+
+    def draw(self, blocks: List[Any], output: BinaryIO) -> None:
+        from reportlab.pdfgen import canvas
+        c = canvas.Canvas(output, pagesize=A4)
+        for block in blocks:
+            if isinstance(block, Cover):
+                self._cover(c, block)
+            elif isinstance(block, ScoreCover):
+                self._score_cover(c, block)
+            elif block.panel == 'half':
+                self._half_page(c, block)
+            else:
+                self._full_page(c, block)
+            c.showPage()
+        c.save()
+
+    def _title_lines(self, c, lines) -> float:
+        """Draw the big title lines from the top; returns the last line's y"""
+        c.setFont(self.bold, 48)
+        c.setFillColor(self.colors['white'])
+        y = PAGE_HEIGHT - 120
+        for i, line in enumerate(lines):
+            y = PAGE_HEIGHT - 120 - 60 * i
+            c.drawString(60, y, line)
+        return y
+
+    def _brand_footer(self, c) -> None:
+        c.setFillColor(self.colors['accent'])
+        c.rect(0, 0, PAGE_WIDTH, 80, fill=1, stroke=0)
+        c.setFont(self.bold, 16)
+        c.setFillColor(self.colors['white'])
+        c.drawString(60, 40, 'WEALTHTRACKER PRO')
+        c.setFont(self.regular, 12)
+        c.drawString(60, 25, 'Professional Wealth Management')
+
+    def _cover(self, c, cover: Cover) -> None:
+        c.setFillColor(self.colors['primary'])
+        c.rect(0, PAGE_HEIGHT/3, PAGE_WIDTH, PAGE_HEIGHT*2/3, fill=1, stroke=0)
+
+        y = self._title_lines(c, cover.title) - 40
+        c.setFont(self.regular, 16)
+        c.drawString(60, y, cover.subtitle)
+        c.setFont(self.bold, 20)
+        c.drawString(60, y - 60, cover.name)
+        c.setFont(self.regular, 14)
+        for i, fact in enumerate(cover.facts):
+            c.drawString(60, y - 100 - 20 * i, fact)
+
+        self._brand_footer(c)
+
+    def _score_cover(self, c, cover: ScoreCover) -> None:
+        c.setFillColor(self.colors['primary'])
+        c.rect(0, PAGE_HEIGHT/2, PAGE_WIDTH, PAGE_HEIGHT/2, fill=1, stroke=0)
+
+        y = self._title_lines(c, cover.title)
+        c.setFont(self.bold, 20)
+        c.drawString(60, y - 40, cover.name)
+
+        # Score ring: the track, then the score's share of it in its traffic light color
+        x, y, radius = PAGE_WIDTH/2, PAGE_HEIGHT/4, 80
+        c.setLineWidth(12)
+        c.setStrokeColor(self.colors['rule'])
+        c.circle(x, y, radius, fill=0, stroke=1)
+        c.setStrokeColor(self.colors[TRAFFIC_LIGHT_ROLES[traffic_light(cover.score)]])
+        if cover.score >= 100:
+            c.circle(x, y, radius, fill=0, stroke=1)
+        elif cover.score > 0:
+            c.arc(x - radius, y - radius, x + radius, y + radius, startAng=90, extent=-360 * cover.score / 100)
+
+        c.setFillColor(self.colors['dark'])
+        c.setFont(self.bold, 48)
+        c.drawCentredString(x, y + 15, f'{int(cover.score)}')
+        c.setFont(self.regular, 16)
+        c.drawCentredString(x, y - 15, 'out of 100')
+        c.setFont(self.bold, 18)
+        c.drawCentredString(x, y - 50, cover.label)
+
+        self._brand_footer(c)
+
+    def _full_page(self, c, section: Section) -> None:
+        """The whole page in the section's color: number, title and lines"""
+        c.setFillColor(self.colors[section.color])
+        c.rect(0, 0, PAGE_WIDTH, PAGE_HEIGHT, fill=1, stroke=0)
+
+        c.setFont(self.bold, 120)
+        c.setFillColor(self.colors['white'])
+        c.drawString(60, PAGE_HEIGHT - 180, section.number)
+        c.setFont(self.bold, 32)
+        c.drawString(60, PAGE_HEIGHT - 240, section.title)
+
+        c.setFont(self.regular, 14)
+        for i, line in enumerate(section.lines):
+            c.drawString(60, PAGE_HEIGHT - 300 - 25 * i, line)
+
+    def _half_page(self, c, section: Section) -> None:
+        """The section on the colored left half, its side on the white right half"""
+        c.setFillColor(self.colors[section.color])
+        c.rect(0, 0, PAGE_WIDTH/2, PAGE_HEIGHT, fill=1, stroke=0)
+
+        c.setFont(self.bold, 100)
+        c.setFillColor(self.colors['white'])
+        c.drawString(40, PAGE_HEIGHT - 150, section.number)
+        c.setFont(self.bold, 24)
+        c.drawString(40, PAGE_HEIGHT - 200, section.title)
+
+        c.setFont(self.regular, 12)
+        for i, line in enumerate(section.lines):
+            c.drawString(40, PAGE_HEIGHT - 240 - 20 * i, line)
+
+        x = PAGE_WIDTH/2 + 40
+        c.setFillColor(self.colors['text'])
+        c.setFont(self.bold, 18)
+        c.drawString(x, PAGE_HEIGHT - 100, section.aside_title or (section.table.title if section.table else ''))
+
+        if section.table:
+            c.setFont(self.regular, 12)
+            for i, row in enumerate(section.table.rows):
+                y = PAGE_HEIGHT - 140 - 50 * i
+                c.drawString(x, y, row[0])
+                c.drawString(x, y - 15, ' '.join(row[1:2]) + ''.join(f' ({cell})' for cell in row[2:]))
+        for i, (label, score) in enumerate(section.scores):
+            y = PAGE_HEIGHT - 150 - 30 * i
+            c.setFillColor(self.colors[TRAFFIC_LIGHT_ROLES[traffic_light(score)]])
+            c.circle(x + 10, y, 8, fill=1, stroke=0)
+            c.setFillColor(self.colors['text'])
+            c.setFont(self.regular, 12)
+            c.drawString(x + 30, y - 3, f'{label}: {int(score)}/100')
+        c.setFont(self.regular, 11)
+        for i, line in enumerate(section.aside):
+            c.drawString(x, PAGE_HEIGHT - 140 - 25 * i, line)
+
+
+def draw_decoration(canvas, theme: Theme) -> None:
+    """Draw a theme's PAGE_DECORATION
+
+    Each item is ('rect', color, x, y, width, height),
+    ('line', color, line_width, x1, y1, x2, y2) or
+    ('text', color, font, size, x, y, text), with colors as palette roles and
+    fonts as 'regular' or 'bold'. A negative x counts from the right edge and
+    a negative y from the top; a width or height of None runs to the page
+    edge. '{date}' in a text is replaced by today's date.
+    """
+    for kind, color, *args in theme.page_decoration:
+        if kind == 'rect':
+            x, y, width, height = args
+            x, y = _x(x), _y(y)
+            canvas.setFillColor(theme.colors[color])
+            canvas.rect(x, y, PAGE_WIDTH - x if width is None else width,
+                        PAGE_HEIGHT - y if height is None else height, fill=1, stroke=0)
+        elif kind == 'line':
+            line_width, x1, y1, x2, y2 = args
+            canvas.setStrokeColor(theme.colors[color])
+            canvas.setLineWidth(line_width)
+            canvas.line(_x(x1), _y(y1), _x(x2), _y(y2))
+        elif kind == 'text':
+            font, size, x, y, text = args
+            canvas.setFont(theme.fonts[font], size)
+            canvas.setFillColor(theme.colors[color])
+            canvas.drawString(_x(x), _y(y), text.format(date=datetime.now().strftime('%B %d, %Y')))
+        else:
+            raise ValueError(f"Unknown page decoration in theme {theme.name}: {kind}")
+
+
+def escape(text: str) -> str:
+    """Paragraph markup escaping; xml.sax.saxutils would pull in urllib and ssl"""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _x(x: float) -> float:
+    return PAGE_WIDTH + x if x < 0 else x
+
+
+def _y(y: float) -> float:
+    return PAGE_HEIGHT + y if y < 0 else y
+
+
+class FlowLayout:
+    """Blocks laid out as platypus flowables under the theme's page decoration"""
+
+    def __init__(self, theme: Theme):
+        self.theme = theme
+        self.colors = theme.colors
+        # Built once per theme and process; renders only read them
+        self.styles = report_engine.stylesheet(f"theme:{theme.name}", lambda: _build_styles(theme))
+        left, right, _, _ = theme.page_margins
+        self.frame_width = PAGE_WIDTH - left - right
+
+    def draw(self, blocks: List[Any], output: BinaryIO) -> None:
+        from reportlab.platypus import PageBreak, SimpleDocTemplate
+
+        left, right, top, bottom = self.theme.page_margins
+        doc = SimpleDocTemplate(output, pagesize=A4, leftMargin=left, rightMargin=right,
+                                topMargin=top, bottomMargin=bottom)
+        story = []
+        for i, block in enumerate(blocks):
+            if isinstance(block, Cover):
+                story += self._band_cover(block) if self.theme.cover == "band" else self._cover(block)
+            elif isinstance(block, ScoreCover):
+                story += self._score_cover(block)
+            else:
+                story += self._section(block)
+                continue
+            if i < len(blocks) - 1:
+                story.append(PageBreak())  # covers get a page of their own
+        doc.build(story, onFirstPage=self.decorate_page, onLaterPages=self.decorate_page)
+
+    def decorate_page(self, canvas, doc) -> None:
+        """Page decoration, drawn once per document and reused, then the page number"""
+        from app.services.report_layout import draw_page_template
+
+        canvas.saveState()
+        draw_page_template(canvas, f'{self.theme.name}Page', lambda c: draw_decoration(c, self.theme))
+        number = self.theme.page_number
+        if number:
+            canvas.setFont(self.theme.fonts['regular'], number['size'])
+            canvas.setFillColor(self.colors[number['color']])
+            text = number.get('format', 'Page {page}').format(page=doc.page)
+            if number['align'] == 'centre':
+                canvas.drawCentredString(PAGE_WIDTH/2, number['y'], text)
+            else:
+                canvas.drawRightString(_x(number['x']), number['y'], text)
+        canvas.restoreState()
+
+    def _cover(self, cover: Cover) -> list:
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, Spacer
+
+        story = [Spacer(1, 2*inch), Paragraph(escape(' '.join(cover.title)), self.styles['title']),
+                 Paragraph(escape(cover.name), self.styles['subtitle']),
+                 Paragraph(escape(cover.subtitle), self.styles['metric_label'])]
+        if cover.facts:
+            story.append(Paragraph('<br/>'.join(escape(fact) for fact in cover.facts), self.styles['highlight']))
+        return story
+
+    def _band_cover(self, cover: Cover) -> list:
+        """The cover on a block of the primary color, with a logo plate below"""
+        from reportlab.graphics.shapes import Drawing, Rect, String
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Spacer
+
+        width, height = self.frame_width, 4*inch
+        band = Drawing(width, height)
+        band.add(Rect(0, 0, width, height, fillColor=self.colors['primary'], strokeColor=None))
+        band.add(Rect(0, height - 0.2*inch, width, 0.2*inch, fillColor=self.colors['accent'], strokeColor=None))
+        band.add(Rect(0, 0, width, 0.2*inch, fillColor=self.colors['accent'], strokeColor=None))
+        lines = [(cover.title[0], 28, self.bold_font, 'white'),
+                 (' '.join(cover.title[1:]), 32, self.bold_font, 'accent'),
+                 (f"Prepared for: {cover.name}", 14, self.regular_font, 'white'),
+                 (cover.subtitle, 12, self.regular_font, 'muted')]
+        lines += [(fact, 14, self.bold_font, 'white') for fact in cover.facts]
+        y = height - 1*inch
+        for text, size, font, color in lines:
+            band.add(String(width/2, y, text, fontSize=size, fontName=font, textAnchor='middle',
+                            fillColor=self.colors[color]))
+            y -= size + 10
+
+        logo_width, logo_height = 2*inch, 0.8*inch
+        logo = Drawing(logo_width, logo_height)
+        logo.add(Rect(0, 0, logo_width, logo_height, fillColor=self.colors['primary'], strokeColor=None))
+        logo.add(Rect(0, logo_height - 8, logo_width, 8, fillColor=self.colors['accent'], strokeColor=None))
+        logo.add(String(logo_width/2, logo_height/2 + 8, 'WealthTracker Pro', fontSize=18, fontName=self.bold_font,
+                        textAnchor='middle', fillColor=self.colors['white']))
+        logo.add(String(logo_width/2, logo_height/2 - 8, 'Professional Wealth Management', fontSize=10,
+                        fontName=self.regular_font, textAnchor='middle', fillColor=self.colors['muted']))
+        return [Spacer(1, 0.3*inch), band, Spacer(1, 0.5*inch), logo]
+
+    def _score_cover(self, cover: ScoreCover) -> list:
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, Spacer
+
+        score_style = ParagraphStyle(name='Score', parent=self.styles['metric'],
+                                     textColor=self.colors[TRAFFIC_LIGHT_ROLES[traffic_light(cover.score)]])
+        return [Spacer(1, 1.5*inch), Paragraph(escape(' '.join(cover.title)), self.styles['title']),
+                Paragraph(escape(cover.name), self.styles['subtitle']), Spacer(1, 0.5*inch),
+                Paragraph(f'{int(cover.score)}/100', score_style),
+                Paragraph(escape(cover.label), self.styles['metric_label'])]
+
+    def _section(self, section: Section) -> list:
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, Spacer
+
+        story = [self._section_header(section), Spacer(1, 0.2*inch)]
+        for line in section.lines:
+            if not line:
+                story.append(Spacer(1, 6))
+            elif line.endswith(':'):
+                story.append(Paragraph(escape(line), self.styles['subsection']))
+            elif line.startswith('• '):
+                story.append(Paragraph(escape(line[2:]), self.styles['bullet'], bulletText='•'))
+            else:
+                story.append(Paragraph(escape(line), self.styles['body']))
+
+        if section.chart:
+            story += [Spacer(1, 0.2*inch), self._chart(section.chart)]
+        if section.table:
+            story += [Paragraph(escape(section.table.title.title()), self.styles['subsection']),
+                      self._table(section.table, section.color)]
+        if section.scores:
+            story += [Paragraph(escape(section.aside_title.title()), self.styles['subsection']),
+                      self._score_table(section.scores, section.color)]
+        if section.aside:
+            story.append(Paragraph(escape(section.aside_title.title()), self.styles['subsection']))
+            story += [Paragraph(escape(line), self.styles['body']) for line in section.aside]
+        story.append(Spacer(1, 0.3*inch))
+        return story
+
+    def _section_header(self, section: Section):
+        from reportlab.lib.units import inch
+
+        if self.theme.section_header != "band":
+            from reportlab.platypus import Paragraph
+            return Paragraph(escape(section.title.title()), self.styles['section'])
+
+        from reportlab.graphics.shapes import Drawing, Rect, String
+        band = Drawing(self.frame_width, 0.8*inch)
+        band.add(Rect(0, 0, self.frame_width, 0.8*inch, fillColor=self.colors['primary'], strokeColor=None))
+        band.add(Rect(0, 0, self.frame_width, 0.1*inch, fillColor=self.colors['accent'], strokeColor=None))
+        band.add(String(30, 0.4*inch, f"{section.number} {section.title}", fontSize=22, fontName=self.bold_font,
+                        textAnchor='start', fillColor=self.colors['white']))
+        return band
+
+    def _chart(self, chart):
+        from app.services import report_layout
+
+        build = report_layout.pie_chart if chart.kind == 'pie' else report_layout.bar_chart
+        options = {} if chart.kind == 'pie' else {'value_format': chart.value_format}
+        return build(chart.items, chart.title, self.theme, **options)
+
+    def _table(self, table: Table, header_role: str, extra_styles=()):
+        from reportlab.platypus import Table as TableFlowable, TableStyle
+
+        flowable = TableFlowable([list(table.columns)] + [list(row) for row in table.rows],
+                                 colWidths=[self.frame_width / len(table.columns)] * len(table.columns))
+        flowable.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), self.colors[header_role]),
+            ('TEXTCOLOR', (0, 0), (-1, 0), self.colors['white']),
+            ('FONTNAME', (0, 0), (-1, 0), self.bold_font),
+            ('FONTNAME', (0, 1), (-1, -1), self.regular_font),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BACKGROUND', (0, 1), (-1, -1), self.colors['background']),
+            ('TEXTCOLOR', (0, 1), (-1, -1), self.colors['text']),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('GRID', (0, 0), (-1, -1), 1, self.colors['rule']),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            *extra_styles
+        ]))
+        return flowable
+
+    def _score_table(self, scores, header_role: str):
+        lights = [traffic_light(score) for _, score in scores]
+        rows = tuple((label, f'{int(score)}/100', TRAFFIC_LIGHT_LABELS[light])
+                     for (label, score), light in zip(scores, lights))
+        status_colors = [('TEXTCOLOR', (2, row), (2, row), self.colors[TRAFFIC_LIGHT_ROLES[light]])
+                         for row, light in enumerate(lights, 1)]
+        return self._table(Table('', ('Metric', 'Score', 'Status'), rows), header_role, status_colors)
+
+    @property
+    def regular_font(self) -> str:
+        return self.theme.fonts['regular']
+
+    @property
+    def bold_font(self) -> str:
+        return self.theme.fonts['bold']
+
+
+def _build_styles(theme: Theme) -> Dict[str, Any]:
+    from reportlab.lib.styles import ParagraphStyle
+
+    styles = {}
+    for role, base in BASE_STYLES.items():
+        settings = {**base, **theme.styles.get(role, {})}
+        font = settings.pop('font')
+        settings.setdefault('fontName', theme.fonts[font])
+        for key, value in settings.items():
+            if key.endswith('Color'):
+                settings[key] = theme.colors[value]
+        styles[role] = ParagraphStyle(name=f'{theme.name}-{role}', **settings)
+    styles['bullet'] = ParagraphStyle(name=f'{theme.name}-bullet', parent=styles['body'], leftIndent=18,
+                                      bulletIndent=6)
+    return styles
@@ -0,0 +1,59 @@
+"""
+Process-wide report engine
+Builds the immutable parts of report generation (style sheets and each
+theme's paragraph styles) once per process and shares them with every render
+"""
+import threading
+import time
+from typing import Callable, Dict, Any
+
+
+class ReportEngine:
+    """Cache of named style sheets
+
+    Shared objects are treated as read-only: renders read styles but never
+    modify them, so one copy per process serves every request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stylesheets: Dict[str, Any] = {}
+
+        self.builds = 0
+        self.reuses = 0
+        self.build_seconds = 0.0
+
+    def stylesheet(self, name: str, build: Callable[[], Any]):
+        """A named style sheet, built once by build()"""
+        sheet = self._stylesheets.get(name)
+        if sheet is not None:
+            self.reuses += 1
+            return sheet
+        with self._lock:
+            sheet = self._stylesheets.get(name)
+            if sheet is None:
+                started = time.perf_counter()
+                sheet = build()
+                self._stylesheets[name] = sheet
+                self.builds += 1
+                self.build_seconds += time.perf_counter() - started
+        return sheet
+
+    def warm(self) -> None:
+        """Build the styles render workers use up front, e.g. when a worker starts"""
+        # Only the theme the workers render with: the flowing themes would pull
+        # in platypus and the chart widgets
+        from app.services.report_document import prepare_theme
+        prepare_theme("stunning")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get engine statistics"""
+        return {
+            'stylesheets': sorted(self._stylesheets),
+            'builds': self.builds,
+            'reuses': self.reuses,
+            'build_seconds': self.build_seconds
+        }
+
+
+report_engine = ReportEngine()
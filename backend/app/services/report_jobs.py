@@ -0,0 +1,413 @@
+"""
+Background report jobs
+Queues PDF renders so large reports never have to finish inside one HTTP
+request (serverless platforms cut requests off), with in-flight dedupe and
+per-job progress and timings.
+
+Jobs live in the report_jobs table and are rendered into the shared report
+cache, so any API process or instance can create, poll and download a job.
+By default each API process runs a worker of its own (see LocalJobWorker);
+separate worker processes (python -m app.commands.report_worker) can take
+over or add capacity. Workers check in every few seconds; while none has,
+new jobs are refused rather than queued for nobody.
+"""
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, and_, delete, func, insert, literal, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import ReportJobRecord, ReportWorker, SessionLocal, User
+from app.services.report_cache import ReportCache, ReportFile, report_cache, report_cache_key
+from app.services.report_renderer import ReportRenderer, report_sections
+
+logger = logging.getLogger(__name__)
+
+# Job lifecycle: queued -> running -> completed | failed
+QUEUED, RUNNING, COMPLETED, FAILED = "queued", "running", "completed", "failed"
+
+# A worker (and its running jobs) counts as gone after this long without a heartbeat
+WORKER_STALE_SECONDS = float(os.getenv("REPORT_WORKER_STALE_SECONDS", "60"))
+
+
+def _epoch(value: Optional[datetime]) -> Optional[float]:
+    return value.replace(tzinfo=timezone.utc).timestamp() if value is not None else None
+
+
+def job_sections(job: ReportJobRecord) -> Optional[Tuple[str, ...]]:
+    return tuple(job.sections.split(",")) if job.sections else None
+
+
+def job_to_dict(job: ReportJobRecord) -> Dict[str, Any]:
+    sections = job_sections(job)
+    return {
+        "job_id": job.id,
+        "report_type": job.report_type,
+        "sections": list(sections) if sections else None,
+        "status": job.status,
+        "stage": job.stage,
+        "progress": job.progress,
+        "error": job.error,
+        "size_bytes": job.size_bytes,
+        "created_at": _epoch(job.created_at),
+        "started_at": _epoch(job.started_at),
+        "finished_at": _epoch(job.finished_at),
+        "timings": json.loads(job.timings) if job.timings else {}
+    }
+
+
+class ReportJobStore:
+    """API side of the job queue: creates jobs and reads their status and results"""
+
+    def __init__(self, cache: ReportCache = report_cache, max_queue: Optional[int] = None):
+        self.cache = cache
+        self.max_queue = max_queue if max_queue is not None else int(os.getenv("REPORT_JOB_QUEUE", "100"))
+
+        self.submitted = 0
+        self.deduplicated = 0
+
+    def worker_available(self, db: Session) -> bool:
+        """Whether a report worker has checked in recently"""
+        cutoff = datetime.utcnow() - timedelta(seconds=WORKER_STALE_SECONDS)
+        return db.query(ReportWorker.name).filter(ReportWorker.heartbeat_at >= cutoff).first() is not None
+
+    def submit(self, db: Session, user_id: int, report_type: str,
+               sections: Optional[Sequence[str]] = None) -> Tuple[ReportJobRecord, bool]:
+        """Queue a report, returning (job, created); an in-flight job for the same user, report and sections is reused
+
+        Safe against concurrent requests: the in-flight unique index turns a
+        duplicate insert into an IntegrityError (answered with the job that
+        won), and the queue limit is checked by the INSERT itself.
+        """
+        sections = report_sections(report_type, sections)
+        key = ",".join(sections) if sections else ""
+        while True:
+            existing = db.query(ReportJobRecord).filter(
+                ReportJobRecord.user_id == user_id,
+                ReportJobRecord.report_type == report_type,
+                ReportJobRecord.sections == key,
+                ReportJobRecord.status.in_((QUEUED, RUNNING))
+            ).first()
+            if existing is not None:
+                self.deduplicated += 1
+                return existing, False
+
+            job_id = uuid.uuid4().hex
+            queued = select(func.count(ReportJobRecord.id)).where(ReportJobRecord.status == QUEUED).scalar_subquery()
+            row = select(literal(job_id), literal(user_id), literal(report_type), literal(key), literal(QUEUED),
+                         literal("queued"), literal(0.0), literal(datetime.utcnow(), DateTime)
+                         ).where(queued < self.max_queue)
+            try:
+                if db.get_bind().dialect.name == "postgresql":
+                    # Serialize submits so two can't both take the last queue slot
+                    db.execute(text("SELECT pg_advisory_xact_lock(hashtext('report_jobs_queue'))"))
+                inserted = db.execute(insert(ReportJobRecord).from_select(
+                    ['id', 'user_id', 'report_type', 'sections', 'status', 'stage', 'progress', 'created_at'], row
+                )).rowcount
+                db.commit()
+            except IntegrityError:
+                db.rollback()  # a concurrent request queued the same report first; answer with its job
+                continue
+            if not inserted:
+                raise OverflowError("Report queue is full")
+            self.submitted += 1
+            return db.get(ReportJobRecord, job_id), True
+
+    def get(self, db: Session, job_id: str, user_id: int) -> Optional[ReportJobRecord]:
+        """A job by id, only if it belongs to the user"""
+        job = db.get(ReportJobRecord, job_id)
+        if job is None or job.user_id != user_id:
+            return None
+        return job
+
+    def open_result(self, job: ReportJobRecord) -> Optional[ReportFile]:
+        """The finished PDF, opened for streaming, or None if the cache no longer holds it"""
+        if job.status != COMPLETED or not job.cache_key:
+            return None
+        return self.cache.open(job.cache_key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get job queue statistics"""
+        cutoff = datetime.utcnow() - timedelta(seconds=WORKER_STALE_SECONDS)
+        db = SessionLocal()
+        try:
+            counts = dict(db.query(ReportJobRecord.status, func.count(ReportJobRecord.id))
+                          .group_by(ReportJobRecord.status).all())
+            workers = db.query(func.count(ReportWorker.name)).filter(ReportWorker.heartbeat_at >= cutoff).scalar()
+        finally:
+            db.close()
+        return {
+            'workers': workers,
+            'queue_depth': counts.get(QUEUED, 0),
+            'in_flight': counts.get(QUEUED, 0) + counts.get(RUNNING, 0),
+            'jobs_retained': sum(counts.values()),
+            'submitted': self.submitted,
+            'deduplicated': self.deduplicated,
+            'completed': counts.get(COMPLETED, 0),
+            'failed': counts.get(FAILED, 0)
+        }
+
+
+class ReportJobWorker:
+    """Worker side: claims queued jobs, collects their data and renders them into the shared cache
+
+    Several workers can run against one database: a job is claimed with a
+    conditional UPDATE, so exactly one worker gets it. Running jobs carry
+    the worker's heartbeat; if a worker dies, another re-queues its jobs
+    once the heartbeat goes stale. Finished jobs are kept for
+    result_ttl_seconds; the PDF itself stays as long as the cache keeps it.
+    """
+
+    def __init__(self, concurrency: int = 2, renderer: Optional[ReportRenderer] = None,
+                 cache: ReportCache = report_cache, poll_seconds: float = 1.0,
+                 result_ttl_seconds: Optional[float] = None):
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self.concurrency = concurrency
+        self.cache = cache
+        self.renderer = renderer or ReportRenderer(cache=cache)
+        self._owns_renderer = renderer is None  # a renderer passed in is shut down by its owner
+        self.poll_seconds = poll_seconds
+        self.result_ttl_seconds = (result_ttl_seconds if result_ttl_seconds is not None
+                                   else float(os.getenv("REPORT_JOB_TTL", "3600")))
+
+        self.completed = 0
+        self.failed = 0
+
+    def heartbeat(self) -> None:
+        """Record that this worker, and every job it is running, is alive"""
+        now = datetime.utcnow()
+        db = SessionLocal()
+        try:
+            worker = db.get(ReportWorker, self.name)
+            if worker is None:
+                db.add(ReportWorker(name=self.name, started_at=now, heartbeat_at=now))
+            else:
+                worker.heartbeat_at = now
+            db.execute(update(ReportJobRecord).where(ReportJobRecord.worker == self.name,
+                                                     ReportJobRecord.status == RUNNING).values(heartbeat_at=now))
+            db.commit()
+        finally:
+            db.close()
+
+    def unregister(self) -> None:
+        db = SessionLocal()
+        try:
+            db.execute(delete(ReportWorker).where(ReportWorker.name == self.name))
+            db.commit()
+        finally:
+            db.close()
+
+    def prune(self) -> int:
+        """Drop finished jobs older than the result TTL, and workers long gone"""
+        now = datetime.utcnow()
+        db = SessionLocal()
+        try:
+            pruned = db.execute(delete(ReportJobRecord).where(
+                ReportJobRecord.status.in_((COMPLETED, FAILED)),
+                ReportJobRecord.finished_at < now - timedelta(seconds=self.result_ttl_seconds)
+            )).rowcount
+            db.execute(delete(ReportWorker).where(ReportWorker.heartbeat_at < now - timedelta(days=1)))
+            db.commit()
+        finally:
+            db.close()
+        return pruned
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """Take the oldest queued job (or one whose worker died), or None if there is none"""
+        now = datetime.utcnow()
+        claimable = or_(ReportJobRecord.status == QUEUED,
+                        and_(ReportJobRecord.status == RUNNING,
+                             ReportJobRecord.heartbeat_at < now - timedelta(seconds=WORKER_STALE_SECONDS)))
+        db = SessionLocal()
+        try:
+            candidates = db.execute(select(ReportJobRecord.id, ReportJobRecord.user_id, ReportJobRecord.report_type,
+                                           ReportJobRecord.sections)
+                                    .where(claimable).order_by(ReportJobRecord.created_at).limit(5)).all()
+            for job_id, user_id, report_type, sections in candidates:
+                # Only one worker's UPDATE can still match; anyone else sees rowcount 0 and moves on
+                claimed = db.execute(update(ReportJobRecord).where(ReportJobRecord.id == job_id, claimable).values(
+                    status=RUNNING, stage="collecting", progress=0.25, error=None, worker=self.name,
+                    started_at=now, heartbeat_at=now)).rowcount
+                db.commit()
+                if claimed:
+                    return {'id': job_id, 'user_id': user_id, 'report_type': report_type,
+                            'sections': tuple(sections.split(",")) if sections else None}
+        finally:
+            db.close()
+        return None
+
+    def _update(self, job_id: str, **values) -> None:
+        """Update a job this worker still holds (a job re-queued from under a stalled worker is left alone)"""
+        db = SessionLocal()
+        try:
+            db.execute(update(ReportJobRecord).where(ReportJobRecord.id == job_id,
+                                                     ReportJobRecord.worker == self.name).values(**values))
+            db.commit()
+        finally:
+            db.close()
+
+    def collect(self, job: Dict[str, Any]):
+        """The job's report data, read now from the user's records"""
+        from app.services.report_data import ReportDataBuilder
+
+        db = SessionLocal()
+        try:
+            user = db.get(User, job['user_id'])
+            if user is None:
+                raise LookupError("User no longer exists")
+            return ReportDataBuilder(db).for_user(user, job['sections'])
+        finally:
+            db.close()
+
+    async def run_job(self, job: Dict[str, Any]) -> None:
+        timings = {}
+        started = time.perf_counter()
+        try:
+            user_data, financial_data = await asyncio.to_thread(self.collect, job)
+            timings["collect_seconds"] = time.perf_counter() - started
+            await asyncio.to_thread(self._update, job['id'], stage="rendering", progress=0.5)
+
+            rendered = time.perf_counter()
+            key = report_cache_key(job['report_type'], user_data, financial_data, sections=job['sections'])
+            report = await self.renderer.render(job['report_type'], user_data, financial_data, job['sections'])
+            size = report.size
+            report.close()
+            timings["render_seconds"] = time.perf_counter() - rendered
+        except Exception as e:
+            timings["total_seconds"] = time.perf_counter() - started
+            await asyncio.to_thread(self._update, job['id'], status=FAILED, stage="failed", error=str(e),
+                                    finished_at=datetime.utcnow(), timings=json.dumps(timings))
+            self.failed += 1
+            logger.warning("Report job %s failed: %s", job['id'], e)
+            return
+        timings["total_seconds"] = time.perf_counter() - started
+        await asyncio.to_thread(self._update, job['id'], status=COMPLETED, stage="completed", progress=1.0,
+                                cache_key=key, size_bytes=size, finished_at=datetime.utcnow(),
+                                timings=json.dumps(timings))
+        self.completed += 1
+
+    async def _heartbeats(self) -> None:
+        last_pruned = 0.0
+        while True:
+            await asyncio.to_thread(self.heartbeat)
+            if time.monotonic() - last_pruned > 300:
+                await asyncio.to_thread(self.prune)
+                last_pruned = time.monotonic()
+            await asyncio.sleep(WORKER_STALE_SECONDS / 4)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Claim and render jobs until stop is set, then finish the ones in progress"""
+        if not self.cache.available():
+            raise RuntimeError(f"Report cache {self.cache.directory} is unusable; job results could not be shared")
+        await asyncio.to_thread(self.renderer.start)
+        heartbeats = asyncio.create_task(self._heartbeats())
+        slots = asyncio.Semaphore(max(1, self.concurrency))
+        running = set()
+
+        async def run_in_slot(job):
+            try:
+                await self.run_job(job)
+            finally:
+                slots.release()
+
+        try:
+            while not stop.is_set():
+                await slots.acquire()
+                job = await asyncio.to_thread(self.claim)
+                if job is None:
+                    slots.release()
+                    try:
+                        await asyncio.wait_for(stop.wait(), self.poll_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                task = asyncio.create_task(run_in_slot(job))
+                running.add(task)
+                task.add_done_callback(running.discard)
+            await asyncio.gather(*running, return_exceptions=True)
+        finally:
+            heartbeats.cancel()
+            await asyncio.gather(heartbeats, return_exceptions=True)
+            await asyncio.to_thread(self.unregister)
+            if self._owns_renderer:
+                self.renderer.shutdown()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get worker statistics"""
+        return {
+            'name': self.name,
+            'concurrency': self.concurrency,
+            'completed': self.completed,
+            'failed': self.failed,
+            'renderer': self.renderer.get_stats()
+        }
+
+
+class LocalJobWorker:
+    """Runs a ReportJobWorker inside the API process, so jobs work on a plain uvicorn deploy
+
+    REPORT_JOB_WORKER picks the mode: "auto" (default) starts one unless a
+    separate report worker has already checked in, "local" always starts
+    one, and "external" leaves jobs to python -m app.commands.report_worker.
+    Renders go through the API's own render pool.
+    """
+
+    def __init__(self, mode: Optional[str] = None, concurrency: Optional[int] = None):
+        self.mode = mode if mode is not None else os.getenv("REPORT_JOB_WORKER", "auto")
+        self.concurrency = concurrency if concurrency is not None else int(os.getenv("REPORT_JOB_WORKERS", "2"))
+        self.worker: Optional[ReportJobWorker] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, renderer: ReportRenderer) -> None:
+        """Start the worker on the running event loop, unless the mode (or an external worker) says not to"""
+        if self.mode == "external" or self._task is not None:
+            return
+        if self.mode == "auto":
+            db = SessionLocal()
+            try:
+                external = report_jobs.worker_available(db)
+            finally:
+                db.close()
+            if external:
+                logger.info("Report worker already running; this process won't run report jobs itself")
+                return
+        self.worker = ReportJobWorker(self.concurrency, renderer=renderer)
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            await self.worker.run(self._stop)
+        except RuntimeError as e:
+            logger.warning("Report jobs disabled in this process: %s", e)
+        except Exception:
+            logger.exception("In-process report worker stopped")
+
+    async def stop(self) -> None:
+        """Finish the jobs in progress and unregister"""
+        if self._task is None:
+            return
+        self._stop.set()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get in-process worker statistics"""
+        return {
+            'mode': self.mode,
+            'running': self._task is not None and not self._task.done(),
+            'worker': self.worker.get_stats() if self.worker else None
+        }
+
+
+report_jobs = ReportJobStore()
+local_job_worker = LocalJobWorker()
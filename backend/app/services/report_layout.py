@@ -0,0 +1,240 @@
+"""
+Shared report layout building blocks
+Chart drawings used by every report generator, styled by a report theme.
+Charts are memoized: the same series, size and theme reuse a flattened
+drawing instead of laying the chart out again
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.widgets.markers import makeMarker
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+
+from app.services.report_themes import Theme
+
+
+class ChartCache:
+    """Bounded LRU of flattened chart drawings
+
+    A chart is laid out once and flattened with expandUserNodes() into plain
+    shapes; every caller gets its own Drawing around those shared shapes,
+    which are never modified while drawing.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        if max_entries is None:
+            max_entries = int(os.getenv("REPORT_CHART_CACHE_SIZE", "256"))
+        self.max_entries = max_entries
+        self.enabled = max_entries > 0
+
+        # key -> (flattened drawing, seconds it took to build)
+        self.entries: "OrderedDict[Tuple, Tuple[Drawing, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.build_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def get(self, key: Tuple, build: Callable[[], Drawing]) -> Drawing:
+        """The chart for key, built by build() on a miss"""
+        if not self.enabled:
+            return build()
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                self.saved_seconds += entry[1]
+        if entry is not None:
+            return _copy(entry[0])
+
+        started = time.perf_counter()
+        flat = build().expandUserNodes()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.misses += 1
+            self.build_seconds += elapsed
+            self.entries[key] = (flat, elapsed)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return _copy(flat)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get chart cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'build_seconds': self.build_seconds,
+            'saved_seconds': self.saved_seconds
+        }
+
+
+def _copy(flat: Drawing) -> Drawing:
+    # Platypus sets attributes on a flowable while drawing it, so each story gets its own Drawing
+    drawing = Drawing(flat.width, flat.height, *flat.contents)
+    drawing.background = flat.background
+    return drawing
+
+
+def _chart_key(kind: str, theme: Theme, width: float, height: float, *data) -> Tuple:
+    # Series are passed as tuples so the key hashes (and compares) the data itself
+    return (kind, theme.name, float(width), float(height)) + data
+
+
+def draw_page_template(canvas, name: str, draw: Callable) -> None:
+    """Draw a page's static decoration through a Form XObject
+
+    The first page records draw(canvas) into the named form; every page,
+    that one included, then just references it, so the document carries
+    the decoration's drawing operations once. Page-specific text (page
+    numbers) is drawn by the caller on top.
+    """
+    if not canvas.hasForm(name):
+        canvas.beginForm(name)
+        draw(canvas)
+        canvas.endForm()
+    canvas.doForm(name)
+
+
+def _add_title(drawing: Drawing, title: Optional[str], theme: Theme, width: float, height: float) -> None:
+    if title:
+        drawing.add(String(width/2, height - 20, title,
+                           fontSize=14, fontName=theme.fonts['bold'],
+                           textAnchor='middle', fillColor=theme.chart_title_color))
+
+
+def pie_chart(items: Iterable[Tuple[str, float]], title: Optional[str], theme: Theme,
+              width=4*inch, height=3*inch) -> Drawing:
+    """Pie chart of (label, value) pairs"""
+    items = tuple((label, value) for label, value in items)
+    return chart_cache.get(_chart_key("pie", theme, width, height, title, items),
+                           lambda: _build_pie_chart(items, title, theme, width, height))
+
+
+def _build_pie_chart(items, title, theme, width, height) -> Drawing:
+    drawing = Drawing(width, height)
+
+    pie = Pie()
+    pie.x = 50
+    pie.y = 50
+    pie.width = width - 100
+    pie.height = height - 100
+    pie.data = [value for _, value in items]
+    pie.labels = [label for label, _ in items]
+
+    pie.slices.strokeColor = colors.white
+    pie.slices.strokeWidth = 2
+    for i in range(len(items)):
+        pie.slices[i].fillColor = theme.chart_colors[i % len(theme.chart_colors)]
+
+    pie.slices.labelRadius = 1.2
+    pie.slices.fontName = theme.fonts['bold']
+    pie.slices.fontSize = 10
+    pie.slices.fontColor = theme.chart_label_color
+
+    drawing.add(pie)
+    _add_title(drawing, title, theme, width, height)
+    return drawing
+
+
+def bar_chart(items: Iterable[Tuple[str, float]], title: Optional[str], theme: Theme,
+              width=5*inch, height=3*inch, value_format: str = '£%s') -> Drawing:
+    """Vertical bar chart of (label, value) pairs, one color per bar"""
+    items = tuple((label, value) for label, value in items)
+    return chart_cache.get(_chart_key("bar", theme, width, height, title, value_format, items),
+                           lambda: _build_bar_chart(items, title, theme, width, height, value_format))
+
+
+def _build_bar_chart(items, title, theme, width, height, value_format) -> Drawing:
+    values = [value for _, value in items]
+    drawing = Drawing(width, height)
+
+    chart = VerticalBarChart()
+    chart.x = 50
+    chart.y = 50
+    chart.width = width - 100
+    chart.height = height - 100
+    chart.data = [values]
+    chart.categoryAxis.categoryNames = [label for label, _ in items]
+
+    chart.bars.strokeColor = colors.white
+    chart.bars.strokeWidth = 1
+    for i in range(len(values)):
+        chart.bars[(0, i)].fillColor = theme.chart_colors[i % len(theme.chart_colors)]
+
+    chart.valueAxis.valueMin = 0
+    if values and max(values) > 0:
+        chart.valueAxis.valueMax = max(values) * 1.1
+    chart.valueAxis.labelTextFormat = value_format
+    chart.categoryAxis.labels.angle = 45
+    chart.categoryAxis.labels.fontSize = 9
+    chart.categoryAxis.labels.fontName = theme.fonts['regular']
+    chart.valueAxis.labels.fontSize = 9
+    chart.valueAxis.labels.fontName = theme.fonts['regular']
+
+    drawing.add(chart)
+    _add_title(drawing, title, theme, width, height)
+    return drawing
+
+
+def line_chart(categories: Sequence[str], values: List[float], title: Optional[str], theme: Theme,
+               width=5*inch, height=3*inch, value_format: str = '£%s') -> Drawing:
+    """Single-series line chart with point markers, for trends"""
+    categories, values = tuple(categories), tuple(values)
+    return chart_cache.get(_chart_key("line", theme, width, height, title, value_format, categories, values),
+                           lambda: _build_line_chart(categories, values, title, theme, width, height, value_format))
+
+
+def _build_line_chart(categories, values, title, theme, width, height, value_format) -> Drawing:
+    drawing = Drawing(width, height)
+
+    chart = HorizontalLineChart()
+    chart.x = 50
+    chart.y = 50
+    chart.width = width - 100
+    chart.height = height - 100
+    chart.data = [list(values)]
+    chart.categoryAxis.categoryNames = list(categories)
+
+    chart.lines[0].strokeColor = theme.chart_line_color
+    chart.lines[0].strokeWidth = 3
+    chart.lines[0].symbol = makeMarker('Circle')
+    chart.lines[0].symbol.size = 6
+    chart.lines[0].symbol.fillColor = theme.chart_line_color
+
+    chart.categoryAxis.labels.angle = 45
+    chart.categoryAxis.labels.fontSize = 9
+    chart.categoryAxis.labels.fontName = theme.fonts['regular']
+    chart.valueAxis.labels.fontSize = 9
+    chart.valueAxis.labels.fontName = theme.fonts['regular']
+    chart.valueAxis.labelTextFormat = value_format
+
+    drawing.add(chart)
+    _add_title(drawing, title, theme, width, height)
+    return drawing
+
+
+chart_cache = ChartCache()
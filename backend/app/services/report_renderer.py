@@ -0,0 +1,183 @@
+"""
+PDF rendering service
+Runs StunningPDFGenerator in a pre-forked process pool so ReportLab renders
+never hold the API worker's GIL or block its event loop. Workers write the
+PDF to disk and the API streams it from there, so report bytes never
+accumulate in the API process.
+"""
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+from app.services.report_cache import ReportCache, ReportFile, report_cache, report_cache_key
+from app.services.report_content import HEALTH_SECTIONS, WEALTH_SECTIONS, select_sections
+
+# Report type -> StunningPDFGenerator method
+REPORT_METHODS = {
+    "wealth": "generate_wealth_report",
+    "estate-planning": "generate_estate_planning_report",
+    "financial-health": "generate_financial_health_report",
+}
+
+# Report type -> pages a request can pick from; other reports always render whole
+REPORT_SECTIONS = {
+    "wealth": WEALTH_SECTIONS,
+    "financial-health": HEALTH_SECTIONS,
+}
+
+
+def report_sections(report_type: str, sections: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    """Validate requested sections, returning them in report order, or None for the whole report"""
+    if not sections:
+        return None
+    if report_type not in REPORT_SECTIONS:
+        raise ValueError(f"The {report_type} report does not support sections")
+    selected = select_sections(REPORT_SECTIONS[report_type], sections)
+    return None if selected == REPORT_SECTIONS[report_type] else selected
+
+def init_worker() -> None:
+    """Import ReportLab and build every shared style once per worker, not per render"""
+    from app.services.report_engine import report_engine
+    report_engine.warm()
+
+
+def _warm() -> int:
+    return os.getpid()
+
+
+def _generator():
+    """A fresh per-render generator; its styles and colors are shared process-wide"""
+    from app.services.stunning_pdf_generator import StunningPDFGenerator
+    return StunningPDFGenerator()
+
+
+def _render(report_type: str, user_data: Dict[str, Any], financial_data: Dict[str, Any],
+            sections: Optional[Tuple[str, ...]] = None) -> bytes:
+    """Render a report in the current process; only plain dicts cross the process boundary"""
+    options = {"sections": sections} if sections else {}
+    return getattr(_generator(), REPORT_METHODS[report_type])(user_data, financial_data, **options)
+
+
+def render_to_file(report_type: str, user_data: Dict[str, Any], financial_data: Dict[str, Any], path: str,
+                    sections: Optional[Tuple[str, ...]] = None) -> int:
+    """Render a report straight into a file; only the path and size cross the process boundary"""
+    options = {"sections": sections} if sections else {}
+    with open(path, "wb") as output:
+        getattr(_generator(), REPORT_METHODS[report_type])(user_data, financial_data, output=output, **options)
+    return os.path.getsize(path)
+
+
+class ReportRenderer:
+    """Async front end to a pool of PDF render processes
+
+    With workers=0 (e.g. on serverless hosts that forbid subprocesses)
+    renders run in a thread instead, which keeps the event loop free to
+    schedule but still contends for the GIL.
+    """
+
+    def __init__(self, workers: Optional[int] = None, cache: Optional[ReportCache] = report_cache):
+        self.workers = workers if workers is not None else int(os.getenv("REPORT_WORKERS", "2"))
+        self.cache = cache
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._start_lock = threading.Lock()
+
+        self.rendered = 0
+        self.failed = 0
+        self.total_render_seconds = 0.0
+
+    def start(self) -> None:
+        """Spawn and warm every worker so the first request doesn't pay for process start and imports"""
+        with self._start_lock:
+            if self.workers <= 0 or self._pool is not None:
+                return
+            # spawn rather than fork: the API process has threads and open DB connections
+            pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker
+            )
+            warmups = [pool.submit(_warm) for _ in range(self.workers)]
+            for future in warmups:
+                future.result()
+            self._pool = pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    async def render(self, report_type: str, user_data: Dict[str, Any], financial_data: Dict[str, Any],
+                     sections: Optional[Sequence[str]] = None) -> ReportFile:
+        """Render a report (or just some of its sections) off the event loop, reusing a cached render if possible
+
+        Returns the PDF as an open ReportFile; the caller streams and closes it.
+        """
+        if report_type not in REPORT_METHODS:
+            raise ValueError(f"Unknown report type: {report_type}")
+        sections = report_sections(report_type, sections)
+
+        key = target = None
+        if self.cache is not None and self.cache.enabled:
+            key = report_cache_key(report_type, user_data, financial_data, sections=sections)
+            cached = await asyncio.to_thread(self.cache.open, key)
+            if cached is not None:
+                return cached
+            target = self.cache.temp_path(key)
+        if target is None:
+            fd, name = tempfile.mkstemp(prefix="report-", suffix=".pdf")
+            os.close(fd)
+            target = Path(name)
+
+        started = time.perf_counter()
+        try:
+            if self.workers <= 0:
+                await asyncio.to_thread(render_to_file, report_type, user_data, financial_data, str(target), sections)
+            else:
+                await self._submit(render_to_file, report_type, user_data, financial_data, str(target), sections)
+        except Exception:
+            self.failed += 1
+            target.unlink(missing_ok=True)
+            raise
+        self.rendered += 1
+        self.total_render_seconds += time.perf_counter() - started
+
+        if key is not None:
+            return await asyncio.to_thread(self.cache.commit, key, target)
+        return ReportFile.open(target, delete=True)
+
+    async def _submit(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        if self._pool is None:
+            await loop.run_in_executor(None, self.start)
+        pool = self._pool
+        try:
+            return await loop.run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (OOM, segfault); replace the pool and retry once
+            with self._start_lock:
+                if self._pool is pool:
+                    self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            await loop.run_in_executor(None, self.start)
+            return await loop.run_in_executor(self._pool, fn, *args)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get renderer statistics"""
+        return {
+            'workers': self.workers,
+            'running': self._pool is not None,
+            'rendered': self.rendered,
+            'failed': self.failed,
+            'total_render_seconds': self.total_render_seconds,
+            'cache': self.cache.get_stats() if self.cache is not None else None
+        }
+
+
+report_renderer = ReportRenderer()
@@ -0,0 +1,74 @@
+"""
+Report themes
+Each theme is a small data module (palette, chart colors, fonts and, for
+flowing layouts, paragraph styles and page decoration) imported only when a
+report asks for it, so a worker loads just the themes it renders. The
+layout engine in report_document draws every theme.
+"""
+import importlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from reportlab.lib.colors import Color, HexColor
+
+# Theme name -> data module
+THEMES = {
+    "stunning": "app.services.report_themes.stunning",
+    "modern": "app.services.report_themes.modern",
+    "professional": "app.services.report_themes.professional",
+    "classic": "app.services.report_themes.classic",
+}
+
+DEFAULT_FONTS = {"regular": "Helvetica", "bold": "Helvetica-Bold"}
+
+# Palette roles the layout engine draws with; every theme defines all of them
+COLOR_ROLES = ('primary', 'accent', 'dark', 'text', 'muted', 'background', 'highlight', 'rule',
+               'success', 'warning', 'danger')
+
+_loaded: Dict[str, "Theme"] = {}
+_lock = threading.Lock()
+
+
+class Theme:
+    """A theme's palette and fonts as ReportLab objects, shared read-only by every render"""
+
+    def __init__(self, name: str, module):
+        missing = set(COLOR_ROLES) - set(module.COLORS)
+        if missing:
+            raise ValueError(f"Report theme {name} has no {', '.join(sorted(missing))} color")
+        self.name = name
+        self.layout: str = module.LAYOUT  # "pages" (one canvas-drawn page per section) or "flow"
+        self.colors: Dict[str, Color] = {key: HexColor(value) for key, value in module.COLORS.items()}
+        self.colors['white'] = HexColor('#ffffff')
+        self.chart_colors: List[Color] = [HexColor(value) for value in module.CHART_COLORS]
+        chart_style = getattr(module, "CHART_STYLE", {})
+        self.chart_title_color = HexColor(chart_style.get("title_color", "#0f172a"))
+        self.chart_label_color = HexColor(chart_style.get("label_color", "#334155"))
+        self.chart_line_color = HexColor(chart_style.get("line_color", "#ec4899"))
+        self.fonts = {**DEFAULT_FONTS, **getattr(module, "FONTS", {})}
+
+        # Flowing layouts only
+        self.cover: str = getattr(module, "COVER", "plain")
+        self.section_header: str = getattr(module, "SECTION_HEADER", "paragraph")
+        self.styles: Dict[str, Dict[str, Any]] = getattr(module, "STYLES", {})
+        self.page_margins: Tuple[float, float, float, float] = getattr(module, "PAGE_MARGINS", (50, 50, 50, 50))
+        self.page_decoration: Tuple[tuple, ...] = getattr(module, "PAGE_DECORATION", ())
+        self.page_number: Optional[Dict[str, Any]] = getattr(module, "PAGE_NUMBER", None)
+
+
+def get_theme(name: str) -> Theme:
+    """Load a theme on first use"""
+    theme = _loaded.get(name)
+    if theme is None:
+        if name not in THEMES:
+            raise ValueError(f"Unknown report theme: {name}")
+        with _lock:
+            theme = _loaded.get(name)
+            if theme is None:
+                theme = Theme(name, importlib.import_module(THEMES[name]))
+                _loaded[name] = theme
+    return theme
+
+
+def loaded_themes() -> List[str]:
+    return sorted(_loaded)
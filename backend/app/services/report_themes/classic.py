@@ -0,0 +1,52 @@
+"""
+Classic theme: the palette and bordered section titles of the original function-based reports
+"""
+LAYOUT = "flow"
+
+# Palette role -> hex color
+COLORS = {
+    'primary': '#ec4899',     # Brand pink
+    'accent': '#0ea5e9',      # Sky blue
+    'dark': '#0f172a',        # Darker slate
+    'text': '#0f172a',        # Darker slate
+    'muted': '#64748b',       # Medium gray
+    'background': '#f8fafc',  # Light gray
+    'highlight': '#f8fafc',   # Light gray
+    'rule': '#64748b',        # Medium gray
+    'success': '#10b981',     # Emerald green
+    'warning': '#f59e0b',     # Amber
+    'danger': '#ef4444',      # Red
+}
+
+CHART_COLORS = ['#3b82f6', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6']
+
+CHART_STYLE = {
+    'title_color': '#0f172a',
+    'label_color': '#1e293b',
+    'line_color': '#ec4899',
+}
+
+COVER = "plain"
+SECTION_HEADER = "paragraph"
+
+# Style role -> ParagraphStyle overrides (colors are palette roles)
+STYLES = {
+    'title': {'fontSize': 36, 'leading': 42},
+    'section': {'fontSize': 24, 'leading': 29, 'textColor': 'primary', 'spaceBefore': 30, 'spaceAfter': 20,
+                'borderWidth': 2, 'borderColor': 'primary', 'borderPadding': 10, 'backColor': 'background'},
+    'subsection': {'fontSize': 18, 'leading': 22},
+    'body': {'fontSize': 12, 'leading': 15},
+    'highlight': {'fontSize': 14, 'leading': 18, 'fontName': 'Helvetica', 'borderColor': 'muted',
+                  'borderWidth': 1, 'borderPadding': 15},
+}
+
+PAGE_MARGINS = (54, 54, 54, 54)  # left, right, top, bottom
+
+# Drawn once per document as a form; see report_document.draw_decoration
+PAGE_DECORATION = (
+    ('rect', 'background', 0, 0, None, None),
+    ('rect', 'primary', 0, -21.6, None, 21.6),
+)
+
+PAGE_NUMBER = {'y': 21.6, 'align': 'centre', 'color': 'muted', 'size': 8,
+               'format': "WealthTracker Pro | Page {page}"}
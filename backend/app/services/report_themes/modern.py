@@ -0,0 +1,60 @@
+"""
+Modern theme: pink headings and tables on slate, with a ruled header and footer
+"""
+LAYOUT = "flow"
+
+# Palette role -> hex color
+COLORS = {
+    'primary': '#ec4899',     # Pink
+    'accent': '#1e293b',      # Medium blue
+    'dark': '#0f172a',        # Dark blue
+    'text': '#334155',        # Gray
+    'muted': '#64748b',       # Light gray
+    'background': '#f8fafc',  # Table body
+    'highlight': '#fef3f2',   # Highlight box
+    'rule': '#cbd5e1',        # Table grid
+    'success': '#10b981',     # Green
+    'warning': '#f59e0b',     # Orange
+    'danger': '#ef4444',      # Red
+}
+
+CHART_COLORS = [
+    '#ec4899',  # Pink
+    '#3b82f6',  # Blue
+    '#10b981',  # Green
+    '#f59e0b',  # Orange
+    '#8b5cf6',  # Purple
+    '#06b6d4',  # Cyan
+    '#ef4444',  # Red
+    '#64748b',  # Gray
+]
+
+CHART_STYLE = {
+    'title_color': '#0f172a',
+    'label_color': '#334155',
+    'line_color': '#ec4899',
+}
+
+COVER = "plain"
+SECTION_HEADER = "paragraph"
+
+# Style role -> ParagraphStyle overrides (colors are palette roles)
+STYLES = {
+    'title': {'fontSize': 28, 'leading': 34},
+    'section': {'fontSize': 18, 'leading': 22, 'textColor': 'primary'},
+    'subsection': {'fontSize': 14, 'leading': 17},
+    'body': {'fontSize': 11, 'leading': 14},
+    'highlight': {'fontSize': 12, 'leading': 15, 'textColor': 'dark'},
+}
+
+PAGE_MARGINS = (50, 50, 80, 80)  # left, right, top, bottom
+
+# Drawn once per document as a form; see report_document.draw_decoration
+PAGE_DECORATION = (
+    ('text', 'primary', 'bold', 16, 50, -50, "WealthTracker Pro"),
+    ('line', 'primary', 2, 50, -60, -50, -60),
+    ('text', 'text', 'regular', 9, 50, 50, "Generated on {date}"),
+    ('line', 'text', 0.5, 50, 60, -50, 60),
+)
+
+PAGE_NUMBER = {'x': -50, 'y': 50, 'align': 'right', 'color': 'text', 'size': 9}
@@ -0,0 +1,62 @@
+"""
+Professional theme: dark slate bands with pink accents and a wide chart palette
+"""
+LAYOUT = "flow"
+
+# Palette role -> hex color
+COLORS = {
+    'primary': '#0f172a',     # Dark slate
+    'accent': '#ec4899',      # Pink
+    'dark': '#0f172a',        # Titles
+    'text': '#334155',        # Text gray
+    'muted': '#e2e8f0',       # Light text on slate
+    'background': '#f8fafc',  # Light background
+    'highlight': '#fef7f7',   # Highlight box
+    'rule': '#cbd5e1',        # Table grid
+    'success': '#10b981',     # Green
+    'warning': '#f59e0b',     # Orange
+    'danger': '#ef4444',      # Red
+}
+
+CHART_COLORS = [
+    '#ec4899',  # Pink
+    '#8b5cf6',  # Purple
+    '#06b6d4',  # Cyan
+    '#10b981',  # Green
+    '#f59e0b',  # Orange
+    '#ef4444',  # Red
+    '#6366f1',  # Indigo
+    '#84cc16',  # Lime
+]
+
+CHART_STYLE = {
+    'title_color': '#0f172a',
+    'label_color': '#334155',
+    'line_color': '#ec4899',
+}
+
+COVER = "band"
+SECTION_HEADER = "band"
+
+# Style role -> ParagraphStyle overrides (colors are palette roles)
+STYLES = {
+    'title': {'fontSize': 32, 'leading': 38},
+    'subsection': {'fontSize': 16, 'leading': 19, 'textColor': 'primary'},
+    'body': {'fontSize': 12, 'leading': 16},
+    'highlight': {'fontSize': 13, 'leading': 16, 'borderColor': 'accent', 'borderWidth': 2, 'borderPadding': 15},
+}
+
+PAGE_MARGINS = (50, 50, 70, 50)  # left, right, top, bottom
+
+# Drawn once per document as a form; see report_document.draw_decoration
+PAGE_DECORATION = (
+    ('rect', 'primary', 0, -60, None, 60),
+    ('rect', 'accent', 0, -65, None, 5),
+    ('text', 'white', 'bold', 12, 50, -40, "WealthTracker Pro"),
+    ('text', 'muted', 'regular', 10, 50, -25, "Generated {date}"),
+    ('rect', 'primary', 0, 0, None, 50),
+    ('rect', 'accent', 0, 50, None, 3),
+    ('text', 'white', 'regular', 9, 50, 25, "Confidential & Proprietary"),
+)
+
+PAGE_NUMBER = {'x': -50, 'y': 25, 'align': 'right', 'color': 'white', 'size': 9}
@@ -0,0 +1,28 @@
+"""
+Stunning theme: large color blocks on the WealthTracker Pro black and pink
+Each section is drawn straight on the canvas as one page
+"""
+LAYOUT = "pages"
+
+# Palette role -> hex color
+COLORS = {
+    'primary': '#0f172a',     # Primary black
+    'accent': '#ec4899',      # Brand pink
+    'dark': '#0f172a',        # Titles
+    'text': '#2d2d2d',        # Dark text
+    'muted': '#666666',       # Light text
+    'background': '#f8fafc',  # Light background
+    'highlight': '#fdf2f8',   # Pale pink
+    'rule': '#d3d3d3',        # Score ring track
+    'success': '#10b981',     # Green
+    'warning': '#f59e0b',     # Amber
+    'danger': '#ef4444',      # Red
+}
+
+CHART_COLORS = ['#ec4899', '#0f172a', '#be185d', '#1e293b', '#666666']
+
+CHART_STYLE = {
+    'title_color': '#0f172a',
+    'label_color': '#2d2d2d',
+    'line_color': '#ec4899',
+}
@@ -0,0 +1,366 @@
+"""
+Nightly snapshot and rollup pipeline
+For each day, walks active users in id order a chunk at a time and, in one
+transaction per chunk, writes each user's end-of-day snapshot (their latest
+wealth record on or before the day, carried forward when nothing new was
+recorded; users with no record get none) and refreshes their cached
+wealth progress. All of it is INSERT ... SELECT, so the work per chunk is a
+handful of statements however many users it holds. The chunk's transaction
+also advances the day's checkpoint, so an interrupted run resumes after the
+last committed chunk.
+Once every chunk is in, the day's totals are rolled up from its snapshots.
+A run first takes a lease on the day's checkpoint and renews it in every
+chunk's transaction, so a second run for the same day (another app worker,
+or a manual run) skips the day instead of interleaving with the first.
+
+Runs from python -m app.commands.nightly_rollup, or in the app process at
+NIGHTLY_ROLLUP_AT (UTC, HH:MM) when that is set.
+"""
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import Date, case, delete, exists, func, insert, literal, or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.models import DailyRollup, DailySnapshot, RollupCheckpoint, User, WealthProgress, WealthRecord, engine
+
+logger = logging.getLogger(__name__)
+
+# A run that stops renewing its lease (crashed, or stuck on one chunk) loses the day after this long
+LEASE_SECONDS = int(os.getenv("NIGHTLY_ROLLUP_LEASE_SECONDS", "600"))
+
+WEALTH_COLUMNS = ('cash_savings', 'stocks_securities', 'real_estate', 'retirement_accounts',
+                  'business_assets', 'other_investments', 'total_wealth')
+
+users = User.__table__
+records = WealthRecord.__table__
+snapshots = DailySnapshot.__table__
+progress = WealthProgress.__table__
+rollups = DailyRollup.__table__
+checkpoints = RollupCheckpoint.__table__
+
+
+def next_chunk(connection, after_user_id: int, batch_size: int) -> List[int]:
+    """The next batch_size active user ids after after_user_id (keyset pagination, no open cursor)"""
+    return list(connection.scalars(
+        select(users.c.id).where(users.c.id > after_user_id, users.c.is_active.is_(True))
+        .order_by(users.c.id).limit(batch_size)
+    ))
+
+
+def write_snapshots(connection, day: date, first_id: int, last_id: int) -> Dict[str, int]:
+    """Snapshot every active user in [first_id, last_id] as of the end of day"""
+    in_chunk = snapshots.c.user_id.between(first_id, last_id)
+    connection.execute(delete(snapshots).where(snapshots.c.date == day, in_chunk))  # a re-run replaces the day
+
+    # One index seek per user on (user_id, date): the latest record dated up to the day
+    latest = (select(records.c.id)
+              .where(records.c.user_id == users.c.id, records.c.date <= day)
+              .order_by(records.c.date.desc(), records.c.id.desc())
+              .limit(1).scalar_subquery())
+    source_ids = select(latest).where(users.c.id.between(first_id, last_id), users.c.is_active.is_(True))
+    connection.execute(insert(snapshots).from_select(
+        ['user_id', 'date', 'recorded_on', *WEALTH_COLUMNS],
+        select(records.c.user_id, literal(day, Date), records.c.date, *[records.c[c] for c in WEALTH_COLUMNS])
+        .where(records.c.id.in_(source_ids))
+    ))
+
+    written, carried = connection.execute(
+        select(func.count(), func.coalesce(func.sum(case((snapshots.c.recorded_on < day, 1), else_=0)), 0))
+        .where(snapshots.c.date == day, in_chunk)
+    ).one()
+    return {'snapshots': written, 'carried_forward': carried}
+
+
+def refresh_progress(connection, day: date, first_id: int, last_id: int) -> None:
+    """Cached current, month-start and year-start wealth for the chunk's users, as of day
+
+    Rows already as of a later day (a backfill of an older date) are left alone.
+    """
+    connection.execute(delete(progress).where(progress.c.user_id.between(first_id, last_id),
+                                              progress.c.as_of <= day))
+
+    earlier = snapshots.alias('earlier')
+
+    def wealth_at(start: date):
+        # Wealth at the close of the day before start, or the first snapshot after it
+        return (select(earlier.c.total_wealth)
+                .where(earlier.c.user_id == snapshots.c.user_id,
+                       earlier.c.date >= start - timedelta(days=1), earlier.c.date <= day)
+                .order_by(earlier.c.date).limit(1).scalar_subquery())
+
+    connection.execute(insert(progress).from_select(
+        ['user_id', 'as_of', 'current_wealth', 'month_start_wealth', 'year_start_wealth', 'updated_at'],
+        select(snapshots.c.user_id, literal(day, Date), snapshots.c.total_wealth,
+               wealth_at(day.replace(day=1)), wealth_at(day.replace(month=1, day=1)), literal(datetime.utcnow()))
+        .where(snapshots.c.date == day, snapshots.c.user_id.between(first_id, last_id),
+               ~exists().where(progress.c.user_id == snapshots.c.user_id))
+    ))
+
+
+def write_rollup(connection, day: date) -> None:
+    """The day's totals across every snapshot"""
+    connection.execute(delete(rollups).where(rollups.c.date == day))
+    connection.execute(insert(rollups).from_select(
+        ['date', 'users', 'users_updated', 'avg_wealth', *WEALTH_COLUMNS, 'computed_at'],
+        select(literal(day, Date), func.count(),
+               func.coalesce(func.sum(case((snapshots.c.recorded_on == day, 1), else_=0)), 0),
+               func.coalesce(func.avg(snapshots.c.total_wealth), 0.0),
+               *[func.coalesce(func.sum(snapshots.c[c]), 0.0) for c in WEALTH_COLUMNS],
+               literal(datetime.utcnow()))
+        .where(snapshots.c.date == day)
+    ))
+
+
+def get_checkpoint(day: date, create: bool = True) -> Dict[str, Any]:
+    """The day's checkpoint, created as needed
+
+    With create=False nothing is written: a missing checkpoint reads as a
+    fresh one.
+    """
+    fresh = {'date': day, 'last_user_id': 0, 'users': 0, 'locked_by': None, 'locked_until': None,
+             'completed_at': None}
+    query = select(checkpoints).where(checkpoints.c.date == day)
+    with engine.begin() as connection:
+        row = connection.execute(query).mappings().first()
+    if row is None and create:
+        try:
+            with engine.begin() as connection:
+                connection.execute(insert(checkpoints).values(date=day, last_user_id=0, users=0))
+        except IntegrityError:
+            pass  # another run created it first
+        with engine.begin() as connection:
+            row = connection.execute(query).mappings().first()
+    return dict(row) if row is not None else fresh
+
+
+def claim_day(connection, day: date, owner: str, lease_seconds: int = LEASE_SECONDS) -> bool:
+    """Take or renew the lease on the day's checkpoint; False while another run holds it
+
+    A single conditional UPDATE, so two runs can't both win it.
+    """
+    now = datetime.utcnow()
+    result = connection.execute(
+        update(checkpoints)
+        .where(checkpoints.c.date == day,
+               or_(checkpoints.c.locked_by.is_(None), checkpoints.c.locked_by == owner,
+                   checkpoints.c.locked_until < now))
+        .values(locked_by=owner, locked_until=now + timedelta(seconds=lease_seconds))
+    )
+    return result.rowcount == 1
+
+
+def release_day(day: date, owner: str) -> None:
+    """Give up the lease on the day (no-op if this run no longer holds it)"""
+    with engine.begin() as connection:
+        connection.execute(update(checkpoints).where(checkpoints.c.date == day, checkpoints.c.locked_by == owner)
+                           .values(locked_by=None, locked_until=None))
+
+
+def pending_days(until: date, max_days: int) -> List[date]:
+    """Days after the last completed rollup up to until, at most max_days of them (oldest first)"""
+    with engine.connect() as connection:
+        last = connection.scalar(select(func.max(checkpoints.c.date))
+                                 .where(checkpoints.c.completed_at.is_not(None), checkpoints.c.date <= until))
+    first = until - timedelta(days=max_days - 1)
+    if last is not None:
+        first = max(first, last + timedelta(days=1))
+    return [first + timedelta(days=i) for i in range((until - first).days + 1)]
+
+
+def run_day(day: date, batch_size: int = 1000, dry_run: bool = False, restart: bool = False,
+            stop: Optional[threading.Event] = None,
+            on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """Snapshot, refresh and roll up one day, resuming from its checkpoint
+
+    The day is skipped (stats['locked_by'] names the holder) while another
+    run holds its lease. A dry run does all of the work for each chunk and
+    rolls it back, so it reports real counts and throughput without
+    changing anything; it takes no lease.
+    """
+    stop = stop or threading.Event()
+    owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    checkpoint = get_checkpoint(day, create=not dry_run)
+    stats = {
+        'date': day.isoformat(),
+        'dry_run': dry_run,
+        'already_complete': False,
+        'locked_by': None,
+        'resumed_after_user_id': 0,
+        'users': 0,
+        'snapshots': 0,
+        'carried_forward': 0,
+        'chunks': 0,
+        'elapsed_seconds': 0.0,
+        'users_per_second': 0.0,
+        'interrupted': False
+    }
+    if checkpoint['completed_at'] is not None and not restart:
+        stats['already_complete'] = True
+        return stats
+
+    if not dry_run:
+        with engine.begin() as connection:
+            claimed = claim_day(connection, day, owner)
+            if claimed and restart:
+                connection.execute(update(checkpoints).where(checkpoints.c.date == day).values(
+                    last_user_id=0, users=0, completed_at=None, started_at=datetime.utcnow()))
+        if not claimed:
+            stats['locked_by'] = get_checkpoint(day, create=False)['locked_by']
+            return stats
+        # Re-read under the lease: the previous holder may have got further (or finished) meanwhile
+        checkpoint = get_checkpoint(day)
+        if checkpoint['completed_at'] is not None:
+            release_day(day, owner)
+            stats['already_complete'] = True
+            return stats
+    elif restart:
+        checkpoint['last_user_id'] = 0
+
+    stats['resumed_after_user_id'] = checkpoint['last_user_id']
+    started = time.perf_counter()
+    after = checkpoint['last_user_id']
+    try:
+        while not stop.is_set():
+            connection = engine.connect()
+            try:
+                with connection.begin() as transaction:
+                    # Renew the lease in the chunk's transaction; if it expired and another
+                    # run took the day over, this run stops and the other carries on
+                    if not dry_run and not claim_day(connection, day, owner):
+                        raise RuntimeError(f"Lost the rollup lease for {day}")
+                    user_ids = next_chunk(connection, after, batch_size)
+                    if not user_ids:
+                        break
+                    counts = write_snapshots(connection, day, user_ids[0], user_ids[-1])
+                    refresh_progress(connection, day, user_ids[0], user_ids[-1])
+                    if dry_run:
+                        transaction.rollback()
+                    else:
+                        connection.execute(update(checkpoints).where(checkpoints.c.date == day).values(
+                            last_user_id=user_ids[-1], users=checkpoints.c.users + len(user_ids),
+                            updated_at=datetime.utcnow()))
+            finally:
+                connection.close()
+
+            after = user_ids[-1]
+            stats['users'] += len(user_ids)
+            stats['snapshots'] += counts['snapshots']
+            stats['carried_forward'] += counts['carried_forward']
+            stats['chunks'] += 1
+            stats['elapsed_seconds'] = time.perf_counter() - started
+            stats['users_per_second'] = stats['users'] / stats['elapsed_seconds'] if stats['elapsed_seconds'] else 0.0
+            if on_progress:
+                on_progress(stats)
+
+        stats['interrupted'] = stop.is_set()
+        if not stats['interrupted'] and not dry_run:
+            with engine.begin() as connection:
+                if not claim_day(connection, day, owner):
+                    raise RuntimeError(f"Lost the rollup lease for {day}")
+                write_rollup(connection, day)
+                connection.execute(update(checkpoints).where(checkpoints.c.date == day).values(
+                    completed_at=datetime.utcnow(), updated_at=datetime.utcnow()))
+    finally:
+        if not dry_run:
+            release_day(day, owner)
+    stats['elapsed_seconds'] = time.perf_counter() - started
+    return stats
+
+
+class RollupScheduler:
+    """Runs the nightly rollup in the app process once a day
+
+    Catches up on up to max_catch_up missed days after downtime. It can be
+    enabled on several app workers: each day's lease lets one of them run
+    it, and the others skip it (counted in skipped_locked, not failures).
+    """
+
+    def __init__(self, at: Optional[str] = None, batch_size: Optional[int] = None,
+                 max_catch_up: Optional[int] = None):
+        self.at = at if at is not None else os.getenv("NIGHTLY_ROLLUP_AT", "")
+        self.batch_size = batch_size if batch_size is not None else int(os.getenv("NIGHTLY_ROLLUP_BATCH_SIZE", "1000"))
+        self.max_catch_up = (max_catch_up if max_catch_up is not None
+                             else int(os.getenv("NIGHTLY_ROLLUP_CATCH_UP_DAYS", "7")))
+        self._stop = threading.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        self.runs = 0
+        self.failures = 0
+        self.skipped_locked = 0
+        self.next_run_at: Optional[datetime] = None
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    def start(self) -> None:
+        """Start the schedule on the running event loop (no-op unless NIGHTLY_ROLLUP_AT is set)"""
+        if not self.at or self._task is not None:
+            return
+        self._stop.clear()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()  # a run in progress stops after its current chunk
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def seconds_until_next_run(self, now: datetime) -> float:
+        hour, minute = (int(part) for part in self.at.split(":"))
+        self.next_run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if self.next_run_at <= now:
+            self.next_run_at += timedelta(days=1)
+        return (self.next_run_at - now).total_seconds()
+
+    def run_pending(self) -> List[Dict[str, Any]]:
+        """Roll up every pending day up to yesterday (UTC)"""
+        results = []
+        for day in pending_days(datetime.utcnow().date() - timedelta(days=1), self.max_catch_up):
+            result = run_day(day, self.batch_size, stop=self._stop)
+            if result['locked_by']:
+                # Another worker is rolling up; it carries on with the later days itself
+                self.skipped_locked += 1
+                logger.info("Nightly rollup for %s is already running in %s; skipped", day, result['locked_by'])
+                break
+            results.append(result)
+            if self._stop.is_set():
+                break
+        return results
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.seconds_until_next_run(datetime.utcnow()))
+            try:
+                results = await asyncio.to_thread(self.run_pending)
+            except Exception:
+                self.failures += 1
+                logger.exception("Nightly rollup failed; it resumes from its checkpoint on the next run")
+                continue
+            self.runs += 1
+            for result in results:
+                logger.info("Nightly rollup for %s: %d users in %.1fs (%.0f users/s)", result['date'],
+                            result['users'], result['elapsed_seconds'], result['users_per_second'])
+            self.last_run = {'finished_at': datetime.utcnow().isoformat(), 'days': results}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get nightly rollup schedule statistics"""
+        return {
+            'enabled': bool(self.at),
+            'at': self.at or None,
+            'next_run_at': self.next_run_at.isoformat() if self.next_run_at else None,
+            'runs': self.runs,
+            'failures': self.failures,
+            'skipped_locked': self.skipped_locked,
+            'last_run': self.last_run
+        }
+
+
+rollup_scheduler = RollupScheduler()
@@ -0,0 +1,222 @@
+"""
+Per-request timing breakdown
+Auth, DB and serialization report into a request-scoped context that is emitted
+as a Server-Timing header and folded into per-route latency histograms
+"""
+import functools
+import inspect
+import os
+import time
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional
+
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING", "1") != "0"
+
+# Latency histogram bucket upper bounds, in seconds
+HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestTiming:
+    """Timings collected while handling one request"""
+
+    __slots__ = ("started", "durations", "db_count", "handler_finished", "route")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations: Dict[str, float] = {}
+        self.db_count = 0
+        self.handler_finished: Optional[float] = None
+        self.route: Optional[str] = None
+
+    def add(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+
+_current: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    return _current.get()
+
+
+class timed:
+    """Context manager adding the duration of the block to the current request's timing, if any"""
+
+    # A plain class rather than @contextmanager: this sits on hot paths (every query, every auth)
+    __slots__ = ("name", "timing", "started")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.timing = _current.get()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.timing is not None:
+            self.timing.add(self.name, time.perf_counter() - self.started)
+        return False
+
+
+def instrument_engine(engine) -> None:
+    """Report every SQL statement's execution time and count into the request timing"""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        timing = _current.get()
+        if timing is not None:
+            timing.add("db", time.perf_counter() - started)
+            timing.db_count += 1
+
+
+class RouteHistograms:
+    """Cumulative latency histograms and phase totals per route"""
+
+    def __init__(self, buckets=HISTOGRAM_BUCKETS):
+        self.buckets = buckets
+        self.routes: Dict[str, Dict[str, Any]] = {}
+
+    def observe(self, route: str, timing: RequestTiming, total: float) -> None:
+        stats = self.routes.get(route)
+        if stats is None:
+            stats = {"buckets": [0] * (len(self.buckets) + 1), "count": 0, "sum": 0.0, "db_count": 0, "phases": {}}
+            self.routes[route] = stats
+        index = 0
+        while index < len(self.buckets) and total > self.buckets[index]:
+            index += 1
+        stats["buckets"][index] += 1
+        stats["count"] += 1
+        stats["sum"] += total
+        stats["db_count"] += timing.db_count
+        phases = stats["phases"]
+        for name, seconds in timing.durations.items():
+            phases[name] = phases.get(name, 0.0) + seconds
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """Per-route histograms with cumulative bucket counts"""
+        result = []
+        for route, stats in self.routes.items():
+            cumulative, running = [], 0
+            for count in stats["buckets"]:
+                running += count
+                cumulative.append(running)
+            result.append({
+                "route": route,
+                "buckets": list(zip([*self.buckets, "+Inf"], cumulative)),
+                "count": stats["count"],
+                "sum_seconds": stats["sum"],
+                "db_queries": stats["db_count"],
+                "phase_seconds": dict(stats["phases"])
+            })
+        return result
+
+
+route_histograms = RouteHistograms()
+
+
+def _format_server_timing(timing: RequestTiming, total: float) -> bytes:
+    parts = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in timing.durations.items()]
+    parts.append(f'db_count;desc="{timing.db_count}"')
+    parts.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(parts).encode("latin-1")
+
+
+class ServerTimingMiddleware:
+    """Open a timing context per request and emit it as a Server-Timing header"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not SERVER_TIMING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = _current.set(timing)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                now = time.perf_counter()
+                if timing.handler_finished is not None:
+                    timing.add("serialize", now - timing.handler_finished)
+                total = now - timing.started
+                message["headers"] = list(message.get("headers", ())) + [
+                    (b"server-timing", _format_server_timing(timing, total))
+                ]
+                if timing.route is not None:
+                    route_histograms.observe(timing.route, timing, total)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+
+
+def _mark_handler_finished(endpoint):
+    """Wrap an endpoint so the timing context knows when serialization starts"""
+    if getattr(endpoint, "_marks_handler_finished", False):
+        return endpoint  # already wrapped (routes are re-created by include_router)
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                timing = _current.get()
+                if timing is not None:
+                    timing.handler_finished = time.perf_counter()
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                timing = _current.get()
+                if timing is not None:
+                    timing.handler_finished = time.perf_counter()
+    wrapper._marks_handler_finished = True
+    return wrapper
+
+
+def _route_label(scope: Scope, route_path: str) -> str:
+    """Route template including any include_router prefix, e.g. /api/milestones/{milestone_id}"""
+    # Depending on the FastAPI version path_format may or may not carry the
+    # router prefix, so recover it from the concrete request path.
+    rendered = route_path
+    for name, value in scope.get("path_params", {}).items():
+        rendered = rendered.replace("{" + name + "}", str(value))
+    path = scope["path"]
+    if path.endswith(rendered):
+        return path[:len(path) - len(rendered)] + route_path
+    return route_path
+
+
+class TimedRoute(APIRoute):
+    """APIRoute that labels the request timing with its route and marks where serialization begins"""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, _mark_handler_finished(endpoint), **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        route_path = self.path_format
+
+        async def timed_route_handler(request):
+            timing = _current.get()
+            if timing is not None:
+                timing.route = f"{request.method} {_route_label(request.scope, route_path)}"
+            return await handler(request)
+
+        return timed_route_handler
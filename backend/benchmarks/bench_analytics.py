@@ -0,0 +1,117 @@
+"""
+Dashboard analytics latency for users with long histories
+Seeds a throwaway SQLite database with ten years of weekly wealth snapshots
+and daily income and expenses per user, then times get_dashboard_analytics
+with and without the composite (user_id, date) indexes.
+
+Run from the backend directory:
+    python -m benchmarks.bench_analytics
+    python -m benchmarks.bench_analytics --users 200 --years 10 --target-ms 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+
+def seed(engine, users: int, years: int, today: date) -> int:
+    """Insert the synthetic history with executemany, returning the row count"""
+    from app.models import ExpenseRecord, IncomeRecord, User, WealthRecord
+
+    days = years * 365
+    user_rows, wealth_rows, income_rows, expense_rows = [], [], [], []
+    for user_id in range(1, users + 1):
+        user_rows.append({'id': user_id, 'email': f'user{user_id}@example.com', 'password_hash': 'x', 'name': f'User {user_id}'})
+        for day in range(0, days, 7):
+            wealth = 100000.0 + (days - day) * 40 + (user_id * 7919 + day) % 5000
+            wealth_rows.append({'user_id': user_id, 'date': today - timedelta(days=day), 'cash_savings': wealth * 0.1,
+                                'stocks_securities': wealth * 0.3, 'real_estate': wealth * 0.6, 'total_wealth': wealth})
+        for day in range(days):
+            when = today - timedelta(days=day)
+            if day % 30 == 0:
+                income_rows.append({'user_id': user_id, 'income_name': 'Salary', 'amount': 4000.0,
+                                    'income_date': when, 'category': 'Employment'})
+            expense_rows.append({'user_id': user_id, 'expense_name': 'Spending', 'amount': 20.0 + day % 90,
+                                 'expense_date': when, 'category': 'Living'})
+    with engine.begin() as connection:
+        for model, rows in ((User, user_rows), (WealthRecord, wealth_rows),
+                            (IncomeRecord, income_rows), (ExpenseRecord, expense_rows)):
+            connection.execute(model.__table__.insert(), rows)
+    return len(user_rows) + len(wealth_rows) + len(income_rows) + len(expense_rows)
+
+
+def time_users(users: int, today: date, repeat: int):
+    """Per-call latencies over every seeded user, repeated, plus the query count of one call"""
+    from sqlalchemy import event
+    from app.models import SessionLocal, engine
+    from app.services.analytics import get_dashboard_analytics
+
+    queries = []
+    count = lambda *args: queries.append(1)
+    event.listen(engine, "before_cursor_execute", count)
+    db = SessionLocal()
+    try:
+        get_dashboard_analytics(1, db, today)  # warm the connection and statement cache
+        queries.clear()
+        get_dashboard_analytics(1, db, today)
+        per_call = len(queries)
+
+        latencies = []
+        for _ in range(repeat):
+            for user_id in range(1, users + 1):
+                started = time.perf_counter()
+                get_dashboard_analytics(user_id, db, today)
+                latencies.append(time.perf_counter() - started)
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", count)
+    return latencies, per_call
+
+
+def report(label: str, latencies, per_call: int) -> float:
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+    print(f"{label:18s} p50 {p50:7.2f} ms   p95 {p95:7.2f} ms   max {latencies[-1] * 1000:7.2f} ms   {per_call} queries")
+    return p95
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dashboard analytics queries")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--years", type=int, default=10, help="history per user")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--target-ms", type=float, default=20.0, help="fail if p95 with indexes exceeds this")
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp(prefix="bench_analytics_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(directory, 'analytics.db')}"
+    from app.models import Base, create_tables, engine
+
+    create_tables()
+    today = date.today()
+    started = time.perf_counter()
+    rows = seed(engine, args.users, args.years, today)
+    print(f"Seeded {rows} rows for {args.users} users x {args.years} years in {time.perf_counter() - started:.1f}s")
+
+    p95 = report("with indexes", *time_users(args.users, today, args.repeat))
+
+    # Same data without the composite indexes, for comparison
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name.startswith("idx_"):
+                    index.drop(bind=connection)
+    report("without indexes", *time_users(args.users, today, args.repeat))
+
+    if p95 > args.target_ms:
+        print(f"p95 with indexes {p95:.2f} ms is over the {args.target_ms:.0f} ms target")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
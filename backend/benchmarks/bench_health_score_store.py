@@ -0,0 +1,144 @@
+"""
+Stored health scores: concurrent writes and refresh cost
+Seeds a throwaway SQLite database, then has another session add an asset
+between a rescore's input read and its commit, and fails unless the stored
+row is left flagged dirty and the next read picks the asset up. Also times
+a stored-score hit, a one-group refresh and a full compute.
+
+Run from the backend directory:
+    python -m benchmarks.bench_health_score_store
+    python -m benchmarks.bench_health_score_store --repeat 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+
+def add_asset(user_id: int, value: float) -> None:
+    """Commit one cash asset for the user from its own session, as another request would"""
+    from app.models import AssetDetail, SessionLocal
+
+    db = SessionLocal()
+    try:
+        db.add(AssetDetail(user_id=user_id, wealth_record_id=0, asset_name='Savings', asset_category='cash_savings',
+                           asset_type='savings', ownership_type='sole', value=value))
+        db.commit()
+    finally:
+        db.close()
+
+
+def check_interleaved_write(user_id: int) -> bool:
+    """Add an asset while the store is between reading its inputs and committing the rescore"""
+    from app.models import HealthScore, SessionLocal, User
+    from app.services.health_calculator import HealthScoreStore
+    from app.services.report_data import ReportDataBuilder
+
+    store = HealthScoreStore()
+    db = SessionLocal()
+    try:
+        before = store.get(db.get(User, user_id), db).asset_total
+    finally:
+        db.close()
+    add_asset(user_id, 1000.0)  # flags the assets group dirty
+
+    writer = threading.Thread(target=add_asset, args=(user_id, 5000.0))
+    health_columns = ReportDataBuilder.health_columns
+
+    def read_then_write(self, *args, **kwargs):
+        columns = health_columns(self, *args, **kwargs)
+        writer.start()
+        writer.join(0.5)  # the write may wait for the rescore's commit, but gets its chance to land first
+        return columns
+
+    ReportDataBuilder.health_columns = read_then_write
+    db = SessionLocal()
+    try:
+        store.get(db.get(User, user_id), db)
+    finally:
+        ReportDataBuilder.health_columns = health_columns
+        db.close()
+    writer.join()
+
+    db = SessionLocal()
+    try:
+        dirty = db.query(HealthScore.assets_dirty).filter(HealthScore.user_id == user_id).scalar()
+        after = store.get(db.get(User, user_id), db).asset_total
+    finally:
+        db.close()
+    print(f"interleaved write    row left dirty: {bool(dirty)}   asset_total {before:,.0f} -> {after:,.0f} "
+          f"(expected {before + 6000:,.0f})")
+    return bool(dirty) and after == before + 6000
+
+
+def time_reads(user_id: int, repeat: int) -> None:
+    from app.models import HealthScore, SessionLocal, User
+    from app.services.health_calculator import HealthScoreStore
+
+    store = HealthScoreStore()
+    db = SessionLocal()
+    try:
+        user = db.get(User, user_id)
+        store.get(user, db)
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            store.get(user, db)
+        hit_seconds = time.perf_counter() - started
+
+        row = db.query(HealthScore).filter(HealthScore.user_id == user_id).one()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            row.assets_dirty = True
+            db.commit()
+            store.get(user, db)
+        refresh_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            db.delete(row)
+            db.commit()
+            row = store.get(user, db)
+        compute_seconds = time.perf_counter() - started
+    finally:
+        db.close()
+
+    for label, seconds in (("stored score", hit_seconds), ("refresh 1 group", refresh_seconds),
+                           ("full compute", compute_seconds)):
+        print(f"{label:20s} {seconds / repeat * 1000:8.3f} ms per read")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check and time the stored health score refresh")
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp(prefix="bench_health_store_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(directory, 'health.db')}"
+    from app.models import SessionLocal, User, create_tables
+
+    create_tables()
+    db = SessionLocal()
+    try:
+        users = [User(email=f'user{i}@example.com', password_hash='x', name=f'User {i}', will_location='Safe')
+                 for i in range(2)]
+        db.add_all(users)
+        db.commit()
+        user_ids = [user.id for user in users]
+    finally:
+        db.close()
+    for user_id in user_ids:
+        add_asset(user_id, 20000.0)
+
+    ok = check_interleaved_write(user_ids[0])
+    time_reads(user_ids[1], max(1, args.repeat))
+    if not ok:
+        print("a write made during a rescore was lost")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
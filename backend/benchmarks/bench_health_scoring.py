@@ -0,0 +1,177 @@
+"""
+Cohort health scoring: parity and throughput
+Scores synthetic users (including the edge cases: no income, no expenses,
+no assets, a single asset class, blank estate fields) with the original
+per-user scalar code and with the vectorized score_health, fails if any
+metric differs, and times both.
+
+Run from the backend directory:
+    python -m benchmarks.bench_health_scoring
+    python -m benchmarks.bench_health_scoring --users 100000
+"""
+import argparse
+import random
+import sys
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+from app.services.health_scoring import health_columns, score_health
+
+CATEGORIES = ['Cash & Savings', 'Investments', 'Property', 'Retirement', 'Other']
+
+
+def scalar_health_metrics(financial_data: Dict[str, Any], user_data: Dict[str, Any]) -> Dict[str, float]:
+    """The per-user scoring the health report used before score_health, kept as the parity reference"""
+    monthly_expenses = financial_data.get('monthly_expenses', 0)
+    monthly_income = financial_data.get('monthly_income', 0)
+    assets = financial_data.get('assets', {})
+    
+    # Emergency Fund Score (0-100)
+    emergency_fund = assets.get('Cash & Savings', 0)
+    months_coverage = (emergency_fund / monthly_expenses) if monthly_expenses > 0 else 0
+    emergency_score = min(100, (months_coverage / 6) * 100)
+    
+    # Expense Ratio Score (0-100) - % of income spent on expenses
+    if monthly_income > 0:
+        expense_ratio = (monthly_expenses / monthly_income) * 100
+        # Good: <70%, Warning: 70-85%, Poor: >85%
+        if expense_ratio < 70:
+            expense_ratio_score = 100
+        elif expense_ratio < 85:
+            expense_ratio_score = 100 - ((expense_ratio - 70) / 15) * 40  # 100 down to 60
+        else:
+            expense_ratio_score = max(0, 60 - ((expense_ratio - 85) / 15) * 60)  # 60 down to 0
+    else:
+        expense_ratio_score = 0
+        
+    # Milestone Achievement Score (0-100) - based on milestones data
+    milestones_data = financial_data.get('milestones', [])
+    if milestones_data:
+        completed_milestones = sum(1 for m in milestones_data if m.get('is_completed', False))
+        milestone_score = (completed_milestones / len(milestones_data)) * 100
+    else:
+        milestone_score = 0
+    
+    # Insurance Score (0-100) - based on actual insurance data
+    insurance_policies = user_data.get('insurance_policies') or ''
+    if insurance_policies and str(insurance_policies).strip():
+        # Simple scoring based on having insurance policies documented
+        insurance_score = 80  # Has some insurance
+    else:
+        insurance_score = 0  # No insurance documented
+    
+    # Diversification Score (0-100)
+    total_assets = sum(assets.values())
+    if total_assets > 0:
+        # Calculate how evenly distributed assets are
+        asset_ratios = [v/total_assets for v in assets.values()]
+        # Simple diversification: penalize if one asset is >70%
+        max_ratio = max(asset_ratios)
+        diversification_score = max(0, 100 - (max_ratio - 0.7) * 200) if max_ratio > 0.7 else 100
+    else:
+        diversification_score = 0
+        
+    # Estate Planning Score (0-100) - based on actual estate planning data
+    estate_score = 0
+    
+    # Check for will
+    will_location = user_data.get('will_location') or ''
+    if will_location and str(will_location).strip():
+        estate_score += 40
+        
+    # Check for solicitor
+    solicitor_name = user_data.get('solicitor_name') or ''
+    if solicitor_name and str(solicitor_name).strip():
+        estate_score += 30
+        
+    # Check for power of attorney
+    power_of_attorney = user_data.get('power_of_attorney_location') or ''
+    if power_of_attorney and str(power_of_attorney).strip():
+        estate_score += 30
+    
+    # Overall score (weighted average)
+    overall_score = (
+        emergency_score * 0.20 +
+        expense_ratio_score * 0.20 +
+        milestone_score * 0.15 +
+        insurance_score * 0.15 +
+        diversification_score * 0.15 +
+        estate_score * 0.15
+    )
+    
+    return {
+        'overall': overall_score,
+        'emergency_fund': emergency_score,
+        'expense_ratio': expense_ratio_score,
+        'expense_percentage': (monthly_expenses / monthly_income * 100) if monthly_income > 0 else 0,
+        'milestones': milestone_score,
+        'insurance': insurance_score,
+        'diversification': diversification_score,
+        'estate_planning': estate_score
+    }
+
+
+def synthetic_user(rng: random.Random):
+    """(user_data, financial_data) with a mix of typical values and edge cases"""
+    categories = rng.sample(CATEGORIES, rng.choice([0, 1, 1, 2, 3, 5]))
+    assets = {category: round(rng.uniform(0, 400000), 2) for category in categories}
+    milestone_count = rng.choice([0, 0, 1, 3, 10])
+    text = lambda: rng.choice(['', '   ', None, 'Documented'])
+    user_data = {
+        'insurance_policies': text(),
+        'will_location': text(),
+        'solicitor_name': text(),
+        'power_of_attorney_location': text(),
+    }
+    financial_data = {
+        'assets': assets,
+        'monthly_income': rng.choice([0, 0.0, rng.uniform(500, 20000)]),
+        'monthly_expenses': rng.choice([0, rng.uniform(0, 25000)]),
+        'milestones': [{'is_completed': rng.random() < 0.4} for _ in range(milestone_count)],
+    }
+    return user_data, financial_data
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check vectorized health scoring against the scalar version")
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    records = [synthetic_user(rng) for _ in range(args.users)]
+
+    started = time.perf_counter()
+    expected = [scalar_health_metrics(financial_data, user_data) for user_data, financial_data in records]
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    columns = health_columns(records)
+    columns_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    scores = score_health(columns)
+    vector_seconds = time.perf_counter() - started
+
+    mismatches = 0
+    for metric, values in scores.items():
+        reference = np.array([row[metric] for row in expected], dtype=np.float64)
+        bad = np.flatnonzero(~np.isclose(values, reference, rtol=1e-12, atol=1e-9))
+        mismatches += len(bad)
+        for i in bad[:3]:
+            print(f"MISMATCH {metric} user {i}: scalar {reference[i]!r} vectorized {values[i]!r} {records[i]}")
+
+    print(f"{args.users} users")
+    print(f"scalar loop          {scalar_seconds * 1000:9.1f} ms")
+    print(f"build columns        {columns_seconds * 1000:9.1f} ms")
+    print(f"score_health         {vector_seconds * 1000:9.1f} ms  ({scalar_seconds / vector_seconds:.0f}x the scalar loop)")
+    if mismatches:
+        print(f"{mismatches} metric values differ")
+        return 1
+    print(f"All {len(scores)} metrics match for every user")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Page decorations drawn per page vs reused from a Form XObject
+Builds long documents under each flowing theme's page decoration, once
+redrawing it on every page (the old behaviour) and once through
+FlowLayout.decorate_page, and compares output size and build time
+
+Run from the backend directory:
+    python -m benchmarks.bench_page_templates
+"""
+import io
+import timeit
+
+from reportlab import rl_config
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate
+
+from app.services.report_document import FlowLayout, draw_decoration
+from app.services.report_themes import get_theme
+
+THEMES = ["professional", "modern", "classic"]
+PAGE_COUNTS = [3, 10, 50]
+
+
+def story(layout, pages):
+    style = layout.styles['body']
+    flowables = []
+    for i in range(pages):
+        flowables += [Paragraph(f"Page {i + 1}. " + "Portfolio commentary. " * 40, style), PageBreak()]
+    return flowables
+
+
+def redraw_every_page(layout):
+    # What the generators' header/footer callbacks used to do: issue the static drawing operations on each page
+    def decorate(canvas, doc):
+        canvas.saveState()
+        draw_decoration(canvas, layout.theme)
+        canvas.setFont(layout.regular_font, 9)
+        canvas.drawRightString(A4[0] - 50, 25, f"Page {doc.page}")
+        canvas.restoreState()
+    return decorate
+
+
+def build(layout, decorate, pages):
+    buffer = io.BytesIO()
+    SimpleDocTemplate(buffer, pagesize=A4).build(story(layout, pages), onFirstPage=decorate, onLaterPages=decorate)
+    return len(buffer.getvalue())
+
+
+def main():
+    rl_config.invariant = 1  # no timestamps or random ids, so sizes are comparable
+    for name in THEMES:
+        layout = FlowLayout(get_theme(name))
+        for pages in PAGE_COUNTS:
+            results = []
+            for decorate in (redraw_every_page(layout), layout.decorate_page):
+                size = build(layout, decorate, pages)
+                seconds = min(timeit.repeat(lambda: build(layout, decorate, pages), number=5, repeat=5)) / 5
+                results.append((size, seconds))
+            (before_size, before_s), (after_size, after_s) = results
+            print(f"{name:13s} {pages:3d} pages  {before_size:7d} -> {after_size:7d} bytes "
+                  f"({after_size / before_size - 1:+6.1%})  {before_s * 1000:6.1f} -> {after_s * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
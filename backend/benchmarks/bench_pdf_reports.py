@@ -0,0 +1,205 @@
+"""
+PDF render benchmark suite
+Renders every report of every generator for small, medium and huge synthetic
+portfolios, each case in a fresh interpreter, and records wall time, CPU
+time, peak RSS, page count and output size. Results can be saved as a JSON
+baseline and later runs compared against it, failing on regressions.
+
+Run from the backend directory:
+    python -m benchmarks.bench_pdf_reports --save pdf_baseline.json
+    python -m benchmarks.bench_pdf_reports --compare pdf_baseline.json --threshold 0.2
+    python -m benchmarks.bench_pdf_reports --generator stunning --size huge
+"""
+import argparse
+import json
+import platform
+import re
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+# Generator -> report type -> how to render it
+GENERATORS = {
+    "stunning": ("app.services.stunning_pdf_generator", "StunningPDFGenerator", {
+        "wealth": "generate_wealth_report",
+        "estate-planning": "generate_estate_planning_report",
+        "financial-health": "generate_financial_health_report",
+    }),
+    "modern": ("app.services.modern_pdf_generator", "ModernPDFGenerator", {
+        "wealth": "generate_wealth_report",
+        "estate-planning": "generate_estate_planning_report",
+        "financial-health": "generate_financial_health_report",
+    }),
+    "professional": ("app.services.professional_pdf_generator", "ProfessionalPDFGenerator", {
+        "wealth": "generate_wealth_report",
+        "estate-planning": "generate_estate_planning_report",
+        "financial-health": "generate_financial_health_report",
+    }),
+    "classic": ("app.services.pdf_generator", "ClassicPDFGenerator", {
+        "wealth": "generate_wealth_report",
+        "estate-planning": "generate_estate_planning_report",
+        "financial-health": "generate_financial_health_report",
+    }),
+}
+
+# Portfolio size -> (asset categories, liabilities, milestones)
+SIZES = {
+    "small": (3, 1, 2),
+    "medium": (12, 4, 25),
+    "huge": (60, 20, 400),
+}
+
+# Metrics compared against a baseline; a larger value is worse for all of them
+COMPARED = ("wall_ms", "cpu_ms", "peak_rss_mb", "bytes")
+
+
+def portfolio(size: str):
+    """Deterministic synthetic user and financial data for a portfolio size"""
+    asset_count, liability_count, milestone_count = SIZES[size]
+    assets = {f"Asset class {i + 1}": 5000.0 + (i * 7919) % 90000 for i in range(asset_count)}
+    liabilities = {f"Loan {i + 1}": 1000.0 + (i * 3571) % 40000 for i in range(liability_count)}
+    total_assets = sum(assets.values())
+    total_liabilities = sum(liabilities.values())
+    user_data = {
+        "name": "Benchmark Client",
+        "email": "bench@example.com",
+        "currency": "GBP",
+        "insurance_policies": "Life cover with Example Assurance",
+        "will_location": "Solicitor's office",
+        "solicitor_name": "A. Solicitor",
+        "power_of_attorney_location": "Home safe",
+    }
+    financial_data = {
+        "net_worth": total_assets - total_liabilities,
+        "total_assets": total_assets,
+        "total_liabilities": total_liabilities,
+        "assets": assets,
+        "liabilities": liabilities,
+        "health_score": 742,
+        "monthly_income": 8500,
+        "monthly_expenses": 6200,
+        "emergency_fund": 25000,
+        "inheritance_tax_threshold": 325000,
+        "potential_tax": max(0.0, (total_assets - 325000) * 0.4),
+        "milestones": [
+            {"title": f"Goal {i + 1}", "is_completed": i % 4 == 0,
+             "target_amount": 10000.0 * (i % 9 + 1), "current_amount": 2500.0 * (i % 7 + 1)}
+            for i in range(milestone_count)
+        ],
+    }
+    return user_data, financial_data
+
+
+def render_case(generator: str, report_type: str, size: str, repeat: int):
+    """Render one case repeatedly in this process; the first render warms imports and styles"""
+    import importlib
+
+    module_name, class_name, methods = GENERATORS[generator]
+    module = importlib.import_module(module_name)
+    user_data, financial_data = portfolio(size)
+    cls = getattr(module, class_name)
+    render = lambda: getattr(cls(), methods[report_type])(user_data, financial_data)
+
+    pdf = render()
+    walls, cpus = [], []
+    for _ in range(repeat):
+        wall, cpu = time.perf_counter(), time.process_time()
+        pdf = render()
+        walls.append(time.perf_counter() - wall)
+        cpus.append(time.process_time() - cpu)
+
+    return {
+        "wall_ms": statistics.median(walls) * 1000,
+        "cpu_ms": statistics.median(cpus) * 1000,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "pages": len(re.findall(rb"/Type /Page[^s]", pdf)),
+        "bytes": len(pdf),
+    }
+
+
+def run_case(generator: str, report_type: str, size: str, repeat: int):
+    """Run a case in a fresh interpreter, so peak RSS is that case's alone"""
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_pdf_reports", "--case", generator, report_type, size,
+         "--repeat", str(repeat)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"exit code {result.returncode}"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, threshold: float):
+    """Cases whose metrics grew by more than threshold over the baseline"""
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get(name)
+        if base is None or "error" in base or "error" in metrics:
+            continue
+        for metric in COMPARED:
+            if base[metric] > 0 and metrics[metric] > base[metric] * (1 + threshold):
+                regressions.append((name, metric, base[metric], metrics[metric]))
+        if metrics["pages"] != base["pages"]:
+            print(f"  note: {name} pages {base['pages']} -> {metrics['pages']}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark PDF report rendering")
+    parser.add_argument("--generator", action="append", choices=sorted(GENERATORS), help="repeatable, default: all")
+    parser.add_argument("--report-type", action="append", choices=["wealth", "estate-planning", "financial-health"])
+    parser.add_argument("--size", action="append", choices=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=5, help="timed renders per case (median is recorded)")
+    parser.add_argument("--save", help="write the results to this JSON baseline")
+    parser.add_argument("--compare", help="compare against this JSON baseline and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed growth per metric (0.2 = 20%%)")
+    parser.add_argument("--case", nargs=3, metavar=("GENERATOR", "REPORT", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case:
+        print(json.dumps(render_case(*args.case, args.repeat)))
+        return 0
+
+    results = {}
+    print(f"{'case':40s} {'wall ms':>9s} {'cpu ms':>9s} {'rss MB':>8s} {'pages':>6s} {'bytes':>9s}")
+    for generator in args.generator or list(GENERATORS):
+        for report_type in args.report_type or list(GENERATORS[generator][2]):
+            for size in args.size or list(SIZES):
+                name = f"{generator}/{report_type}/{size}"
+                metrics = results[name] = run_case(generator, report_type, size, args.repeat)
+                if "error" in metrics:
+                    print(f"{name:40s} failed: {metrics['error']}")
+                else:
+                    print(f"{name:40s} {metrics['wall_ms']:9.1f} {metrics['cpu_ms']:9.1f} {metrics['peak_rss_mb']:8.1f} "
+                          f"{metrics['pages']:6d} {metrics['bytes']:9d}", flush=True)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "repeat": args.repeat,
+                "results": results
+            }, f, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.save}")
+
+    failed = [name for name, metrics in results.items() if "error" in metrics]
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, metric, before, after in regressions:
+            print(f"REGRESSION {name} {metric}: {before:.1f} -> {after:.1f} (+{(after / before - 1):.0%})")
+        if regressions:
+            return 1
+        print(f"No regressions over {args.threshold:.0%} against {args.compare}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Monte Carlo projection latency
+Times project() for a monthly simulation over many paths, checks that the
+same seed gives the same bands and that a zero-volatility run matches plain
+compounding.
+
+Run from the backend directory:
+    python -m benchmarks.bench_projections
+    python -m benchmarks.bench_projections --paths 10000 --years 40 --target-ms 1000
+"""
+import argparse
+import statistics
+import sys
+import time
+from datetime import date
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Monte Carlo projections")
+    parser.add_argument("--paths", type=int, default=10000)
+    parser.add_argument("--years", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=1000.0, help="fail if the median run exceeds this")
+    args = parser.parse_args(argv)
+
+    from app.services.projections import project
+
+    today = date(2025, 1, 1)
+    goals = [{'id': 1, 'title': 'House deposit', 'target_amount': 400000.0, 'target_date': date(2030, 1, 1)},
+             {'id': 2, 'title': 'Retirement', 'target_amount': 2000000.0, 'target_date': date(2055, 1, 1)}]
+    assumptions = dict(monthly_contribution=2000.0, contribution_years=25, monthly_withdrawal=6000.0,
+                       withdrawal_start_year=25, paths=args.paths, seed=42)
+
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        result = project(250000.0, args.years, goals, today=today, **assumptions)
+        timings.append(time.perf_counter() - started)
+    median = statistics.median(timings) * 1000
+    print(f"{args.paths} paths x {args.years} years monthly: median {median:.0f} ms   best {min(timings) * 1000:.0f} ms")
+    final = result['final']
+    print(f"final P10 {final['p10']:,.0f}   P50 {final['p50']:,.0f}   P90 {final['p90']:,.0f}   "
+          f"depleted {result['depletion_probability']:.1%}")
+    for goal in result['goals']:
+        print(f"  {goal['title']}: {goal['probability']:.1%}")
+
+    failed = False
+    if project(250000.0, args.years, goals, today=today, **assumptions) != result:
+        print("same seed gave different results")
+        failed = True
+
+    flat = project(100000.0, 10, volatility=0.0, inflation_volatility=0.0, paths=100)['final']['p50']
+    if abs(flat - 100000.0 * 1.07 ** 10) > 0.01:
+        print(f"zero-volatility run {flat:,.2f} doesn't match 7% compounding")
+        failed = True
+
+    if median > args.target_ms:
+        print(f"median {median:.0f} ms is over the {args.target_ms:.0f} ms target")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
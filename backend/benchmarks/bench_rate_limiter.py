@@ -0,0 +1,113 @@
+"""
+Microbenchmark for the security middleware rate limiter
+Compares the sliding-window counter against the old per-IP timestamp lists at 10k distinct IPs,
+times the shared-memory backend and checks that workers sharing it enforce one combined limit
+
+Run from the backend directory:
+    python -m benchmarks.bench_rate_limiter
+"""
+import asyncio
+import multiprocessing
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+from app.middleware.rate_limit import SlidingWindowRateLimiter, SharedMemoryRateLimiter, RedisRateLimiter
+
+DISTINCT_IPS = 10000
+REQUESTS = 500000
+CALLS_PER_MINUTE = 100
+
+
+class LegacyListLimiter:
+    """The previous implementation: a timestamp list per IP rebuilt on every request"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.requests = defaultdict(list)
+        self.lock = threading.Lock()
+
+    def allow(self, key: str, now: float) -> bool:
+        with self.lock:
+            self.requests[key] = [t for t in self.requests[key] if now - t < 60]
+            if len(self.requests[key]) >= self.limit:
+                return False
+            self.requests[key].append(now)
+            return True
+
+
+def run(name, limiter, keys, timestamps):
+    start = time.perf_counter()
+    for key, now in zip(keys, timestamps):
+        limiter.allow(key, now)
+    elapsed = time.perf_counter() - start
+    tracked = getattr(limiter, 'requests', None)
+    if tracked is None and hasattr(limiter, '__len__'):
+        tracked = limiter
+    print(f"{name:<16} {elapsed / len(keys) * 1e9:8.0f} ns/request  tracked clients: {len(tracked) if tracked is not None else '-'}")
+
+
+def _shared_worker(path, attempts, results):
+    limiter = SharedMemoryRateLimiter(CALLS_PER_MINUTE, path=path, buckets=1024)
+    results.put(sum(limiter.allow("198.51.100.1") for _ in range(attempts)))
+
+
+def check_shared_limit(workers=4):
+    """Several processes hammering one IP must share a single limit, not limit x workers"""
+    path = os.path.join(tempfile.mkdtemp(), "ratelimit.bin")
+    results = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=_shared_worker, args=(path, CALLS_PER_MINUTE, results)) for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+    allowed = sum(results.get() for _ in procs)
+    print(f"{workers} processes x {CALLS_PER_MINUTE} requests from one IP -> {allowed} allowed (limit {CALLS_PER_MINUTE})")
+
+
+async def run_redis(keys):
+    try:
+        from fakeredis import FakeAsyncRedis  # local stand-in for a Redis server
+    except ImportError:
+        print("redis (fakeredis)  skipped: pip install fakeredis to run")
+        return
+    limiter = RedisRateLimiter(CALLS_PER_MINUTE, client=FakeAsyncRedis())
+    sample = keys[:20000]
+    start = time.perf_counter()
+    for key in sample:
+        await limiter.check(key)
+    elapsed = time.perf_counter() - start
+    print(f"{'redis (fakeredis)':<16} {elapsed / len(sample) * 1e9:8.0f} ns/request  (in-process stand-in, excludes network)")
+
+
+def main():
+    rng = random.Random(42)
+    ips = [f"10.{i // 65536}.{(i // 256) % 256}.{i % 256}" for i in range(DISTINCT_IPS)]
+    keys = [rng.choice(ips) for _ in range(REQUESTS)]
+    # Spread the requests over five simulated minutes so windows roll and idle clients expire
+    timestamps = [i * 300.0 / REQUESTS for i in range(REQUESTS)]
+
+    print(f"{REQUESTS} requests across {DISTINCT_IPS} distinct IPs, limit {CALLS_PER_MINUTE}/min")
+    run("legacy list", LegacyListLimiter(CALLS_PER_MINUTE), keys, timestamps)
+    run("sliding window", SlidingWindowRateLimiter(CALLS_PER_MINUTE), keys, timestamps)
+    shared = SharedMemoryRateLimiter(CALLS_PER_MINUTE, path=os.path.join(tempfile.mkdtemp(), "ratelimit.bin"))
+    run("shared memory", shared, keys, timestamps)
+    shared.close()
+    asyncio.run(run_redis(keys))
+
+    # Hot client near its limit: the legacy cost grows with calls_per_minute, the counter's does not
+    hot_keys = ["203.0.113.7"] * REQUESTS
+    for limit in (100, 1000, 10000):
+        print(f"-- single hot client, limit {limit}/min")
+        run("legacy list", LegacyListLimiter(limit), hot_keys[:50000], timestamps[:50000])
+        run("sliding window", SlidingWindowRateLimiter(limit), hot_keys[:50000], timestamps[:50000])
+
+    print("-- cross-worker sharing")
+    check_shared_limit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Chart cost of repeated report renders
+Renders the same professional reports (pie, bar and line charts) with the
+chart cache disabled, as every render used to, and enabled
+
+Run from the backend directory:
+    python -m benchmarks.bench_report_charts
+"""
+import time
+
+from app.services import report_layout
+from app.services.report_layout import ChartCache
+from app.services.professional_pdf_generator import ProfessionalPDFGenerator
+from benchmarks.bench_report_renderer import FINANCIAL_DATA, USER_DATA
+
+RENDERS = 30
+REPORTS = ["generate_wealth_report", "generate_financial_health_report", "generate_estate_planning_report"]
+
+
+def render_all(cache):
+    report_layout.chart_cache = cache
+    started = time.perf_counter()
+    size = 0
+    for _ in range(RENDERS):
+        for method in REPORTS:
+            size += len(getattr(ProfessionalPDFGenerator(), method)(USER_DATA, FINANCIAL_DATA))
+    return (time.perf_counter() - started) / (RENDERS * len(REPORTS)), size
+
+
+def main():
+    original = report_layout.chart_cache
+    render_all(ChartCache(max_entries=0))  # warm styles and imports
+    try:
+        before, size_before = render_all(ChartCache(max_entries=0))
+        cache = ChartCache(max_entries=64)
+        after, size_after = render_all(cache)
+    finally:
+        report_layout.chart_cache = original
+
+    assert size_before == size_after
+    stats = cache.get_stats()
+    print(f"per report  uncached {before * 1000:7.2f} ms   cached {after * 1000:7.2f} ms   ({before / after:.2f}x)")
+    print(f"chart cache hit rate {stats['hit_rate']:.1%}, {stats['entries']} entries, "
+          f"chart layout saved {stats['saved_seconds'] * 1000:.1f} ms over {RENDERS * len(REPORTS)} reports")
+
+
+if __name__ == "__main__":
+    main()
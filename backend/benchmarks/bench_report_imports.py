@@ -0,0 +1,46 @@
+"""
+Import time and memory of each report generator in a fresh interpreter
+A render worker pays this once at start; themes load only when used
+
+Run from the backend directory:
+    python -m benchmarks.bench_report_imports
+"""
+import subprocess
+import sys
+
+MODULES = [
+    "app.services.stunning_pdf_generator",
+    "app.services.modern_pdf_generator",
+    "app.services.professional_pdf_generator",
+    "app.services.pdf_generator",
+]
+
+PROBE = """
+import resource, sys, time
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+from app.services.report_themes import loaded_themes
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline, len(sys.modules), ",".join(loaded_themes()) or "-")
+"""
+
+
+def main():
+    for module in MODULES:
+        runs = []
+        for _ in range(3):
+            result = subprocess.run([sys.executable, "-c", PROBE.format(module=module)],
+                                    capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"{module:42s} failed: {result.stderr.strip().splitlines()[-1]}")
+                break
+            elapsed, rss_kb, module_count, themes = result.stdout.split()
+            runs.append((float(elapsed), int(rss_kb), int(module_count), themes))
+        if runs:
+            elapsed, rss_kb, module_count, themes = min(runs)
+            print(f"{module:42s} {elapsed * 1000:7.1f} ms  +{rss_kb / 1024:5.1f} MiB  {module_count:4d} modules  themes: {themes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Peak API-process memory while many clients download large reports
+Compares the old path (whole PDF in a BytesIO, copied into Response(content=...))
+with streaming a rendered ReportFile from disk in 64 KB chunks. Clients are
+slow readers, so every response is in flight at the same time.
+
+Run from the backend directory:
+    python -m benchmarks.bench_report_memory
+"""
+import asyncio
+import os
+import tempfile
+import tracemalloc
+from io import BytesIO
+
+from starlette.responses import Response, StreamingResponse
+
+from app.services.report_cache import ReportFile
+
+CONCURRENT_DOWNLOADS = 20
+REPORT_BYTES = 4 * 1024 * 1024  # an image-heavy report
+
+
+def scope():
+    return {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "path": "/api/reports/wealth", "raw_path": b"/api/reports/wealth", "query_string": b"",
+            "headers": [], "client": ("127.0.0.1", 1234), "server": ("testserver", 80), "scheme": "http"}
+
+
+async def download(response):
+    """Send a response to a client that reads slowly, returning the bytes it received"""
+    received = 0
+    request_sent = False
+    disconnect = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal received
+        if message["type"] == "http.response.body":
+            received += len(message.get("body", b""))
+            await asyncio.sleep(0.002)  # slow network
+
+    await response(scope(), receive, send)
+    disconnect.set()
+    return received
+
+
+def in_memory_response(pdf_path):
+    # What the handlers used to do: render into a BytesIO, read() a copy, wrap it in a Response
+    buffer = BytesIO()
+    with open(pdf_path, "rb") as f:
+        buffer.write(f.read())
+    buffer.seek(0)
+    return Response(content=buffer.read(), media_type="application/pdf")
+
+
+def streamed_response(pdf_path):
+    report = ReportFile.open(pdf_path)
+    return StreamingResponse(report.iter_chunks(), media_type="application/pdf",
+                             headers={"Content-Length": str(report.size)})
+
+
+async def measure(make_response, pdf_path):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    received = await asyncio.gather(*(download(make_response(pdf_path)) for _ in range(CONCURRENT_DOWNLOADS)))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert all(size == REPORT_BYTES for size in received)
+    return peak
+
+
+async def main():
+    fd, pdf_path = tempfile.mkstemp(suffix=".pdf")
+    with os.fdopen(fd, "wb") as f:
+        f.write(os.urandom(REPORT_BYTES))
+    try:
+        for label, make_response in (("in-memory Response", in_memory_response),
+                                      ("streamed ReportFile", streamed_response)):
+            peak = await measure(make_response, pdf_path)
+            print(f"{label:20s} peak {peak / 2**20:7.1f} MiB for {CONCURRENT_DOWNLOADS} downloads"
+                  f"  ({peak / CONCURRENT_DOWNLOADS / 2**10:8.1f} KiB per download, report {REPORT_BYTES / 2**20:.0f} MiB)")
+    finally:
+        os.unlink(pdf_path)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
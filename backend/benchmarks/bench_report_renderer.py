@@ -0,0 +1,92 @@
+"""
+Interactive latency while PDF reports render
+Fires 20 concurrent report renders and measures how late a 5 ms interactive
+probe runs on the same event loop: rendering inline in the handler (the old
+behaviour) vs the process-pool ReportRenderer
+
+Run from the backend directory:
+    python -m benchmarks.bench_report_renderer
+"""
+import asyncio
+import statistics
+import time
+
+from app.services.report_renderer import ReportRenderer, _render
+
+CONCURRENT_REPORTS = 20
+PROBE_INTERVAL = 0.005
+
+USER_DATA = {"name": "Bench User", "email": "bench@example.com", "currency": "GBP"}
+FINANCIAL_DATA = {
+    "net_worth": 315000,
+    "total_assets": 350000,
+    "total_liabilities": 35000,
+    "assets": {"Cash & Savings": 75000, "Investments": 175000, "Property": 100000},
+    "liabilities": {"Mortgage": 30000, "Other Debt": 5000},
+    "health_score": 782,
+    "monthly_income": 8500,
+    "monthly_expenses": 6200,
+    "milestones": [
+        {"title": f"Goal {i}", "is_completed": i % 3 == 0, "target_amount": 10000 * i, "current_amount": 4000 * i}
+        for i in range(1, 9)
+    ]
+}
+REPORT_TYPES = ["wealth", "estate-planning", "financial-health"]
+
+
+async def inline_render(report_type):
+    # What the handlers used to do: render synchronously on the event loop
+    return _render(report_type, USER_DATA, FINANCIAL_DATA)
+
+
+async def probe(lags, stop):
+    """Interactive requests arriving every PROBE_INTERVAL (open loop); record how late each gets served"""
+    started = time.perf_counter()
+    slot = 1
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, started + slot * PROBE_INTERVAL - time.perf_counter()))
+        now = time.perf_counter()
+        # Every arrival that fell due while the loop was blocked waited until now
+        while started + slot * PROBE_INTERVAL <= now:
+            lags.append(now - (started + slot * PROBE_INTERVAL))
+            slot += 1
+
+
+async def run(render):
+    lags, stop = [], asyncio.Event()
+    probe_task = asyncio.create_task(probe(lags, stop))
+    await asyncio.sleep(0.05)
+    started = time.perf_counter()
+    await asyncio.gather(*(render(REPORT_TYPES[i % len(REPORT_TYPES)]) for i in range(CONCURRENT_REPORTS)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe_task
+    lags.sort()
+    return elapsed, statistics.median(lags), lags[max(0, int(len(lags) * 0.99) - 1)], lags[-1]
+
+
+def report(label, result):
+    elapsed, p50, p99, worst = result
+    print(f"{label:28s} {elapsed * 1000:8.1f} ms total   probe lag p50 {p50 * 1000:6.2f} ms"
+          f"  p99 {p99 * 1000:7.2f} ms  max {worst * 1000:7.2f} ms")
+
+
+async def main():
+    _render("wealth", USER_DATA, FINANCIAL_DATA)  # import ReportLab before timing the inline case
+    report("inline (blocking the loop)", await run(inline_render))
+
+    for workers in (2, 4):
+        renderer = ReportRenderer(workers=workers, cache=None)
+        renderer.start()
+        try:
+            async def pooled_render(report_type):
+                (await renderer.render(report_type, USER_DATA, FINANCIAL_DATA)).close()
+
+            result = await run(pooled_render)
+        finally:
+            renderer.shutdown()
+        report(f"process pool ({workers} workers)", result)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,36 @@
+"""
+Per-report setup cost of the themed layouts
+"Before" rebuilds a theme's paragraph styles for every report, as each
+generator's __init__ used to; "after" is the layout a render sets up, whose
+styles come from the shared report engine
+
+Run from the backend directory:
+    python -m benchmarks.bench_report_setup
+"""
+import timeit
+
+from app.services.report_document import FlowLayout, _build_styles
+from app.services.report_engine import report_engine
+from app.services.report_themes import get_theme
+
+THEMES = ["modern", "professional", "classic"]
+
+
+def per_call(fn, number=2000):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def report(label, before, after):
+    print(f"{label:32s} before {before * 1e6:8.1f} us   after {after * 1e6:6.2f} us   ({before / after:6.0f}x)")
+
+
+def main():
+    for name in THEMES:
+        theme = get_theme(name)
+        FlowLayout(theme)  # build the styles once, as a warmed worker would have
+        report(name, per_call(lambda: _build_styles(theme)), per_call(lambda: FlowLayout(theme)))
+    print(report_engine.get_stats())
+
+
+if __name__ == "__main__":
+    main()
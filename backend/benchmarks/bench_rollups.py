@@ -0,0 +1,82 @@
+"""
+Nightly rollup throughput
+Seeds a throwaway SQLite database with users holding a year of weekly
+wealth records, then times a full nightly run (snapshots, progress refresh
+and the day's rollup) and a dry run, and extrapolates to a maintenance
+window.
+
+Run from the backend directory:
+    python -m benchmarks.bench_rollups
+    python -m benchmarks.bench_rollups --users 100000 --batch-size 5000 --window-users 2000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+
+def seed(engine, users: int, weeks: int, today: date) -> int:
+    """Insert the synthetic users and wealth history with executemany, returning the row count"""
+    from app.models import User, WealthRecord
+
+    user_rows = [{'id': user_id, 'email': f'user{user_id}@example.com', 'password_hash': 'x',
+                  'name': f'User {user_id}', 'is_active': user_id % 50 != 0}
+                 for user_id in range(1, users + 1)]
+    wealth_rows = []
+    for user_id in range(1, users + 1):
+        # Most users last recorded a few days ago, so most snapshots are carried forward
+        for week in range(weeks):
+            day = today - timedelta(days=week * 7 + user_id % 7)
+            wealth = 50000.0 + (user_id * 7919 + week * 31) % 400000
+            wealth_rows.append({'user_id': user_id, 'date': day, 'cash_savings': wealth * 0.2,
+                                'stocks_securities': wealth * 0.3, 'real_estate': wealth * 0.5, 'total_wealth': wealth})
+    with engine.begin() as connection:
+        connection.execute(User.__table__.insert(), user_rows)
+        connection.execute(WealthRecord.__table__.insert(), wealth_rows)
+    return len(user_rows) + len(wealth_rows)
+
+
+def report(label: str, stats) -> float:
+    print(f"{label:10s} {stats['users']} users in {stats['chunks']} chunks   {stats['elapsed_seconds']:6.2f}s   "
+          f"{stats['users_per_second']:8.0f} users/s   {stats['snapshots']} snapshots "
+          f"({stats['carried_forward']} carried forward)")
+    return stats['users_per_second']
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the nightly snapshot and rollup run")
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--weeks", type=int, default=52, help="weekly wealth records per user")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--window-users", type=int, default=1000000, help="user count to extrapolate a run time for")
+    parser.add_argument("--window-minutes", type=float, default=60.0,
+                        help="fail if --window-users would take longer than this")
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp(prefix="bench_rollups_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(directory, 'rollups.db')}"
+    from app.models import create_tables, engine
+    from app.services.rollups import run_day
+
+    create_tables()
+    today = date.today()
+    started = time.perf_counter()
+    rows = seed(engine, args.users, args.weeks, today)
+    print(f"Seeded {rows} rows for {args.users} users x {args.weeks} weeks in {time.perf_counter() - started:.1f}s")
+
+    report("dry run", run_day(today, args.batch_size, dry_run=True))
+    users_per_second = report("run", run_day(today, args.batch_size))
+    report("next day", run_day(today + timedelta(days=1), args.batch_size))
+
+    minutes = args.window_users / users_per_second / 60 if users_per_second else float("inf")
+    print(f"{args.window_users} users at this rate: {minutes:.1f} minutes")
+    if minutes > args.window_minutes:
+        print(f"over the {args.window_minutes:.0f} minute window")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Per-request overhead of SecurityMiddleware
+Drives a trivial ASGI app directly (no server, no sockets) bare, behind the
+pure-ASGI SecurityMiddleware and behind an equivalent BaseHTTPMiddleware
+
+Run from the backend directory:
+    python -m benchmarks.bench_security_middleware
+"""
+import asyncio
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+
+from app.middleware.security import SecurityMiddleware
+
+REQUESTS = 20000
+
+
+async def endpoint(scope, receive, send):
+    await PlainTextResponse("ok")(scope, receive, send)
+
+
+class LegacySecurityMiddleware(BaseHTTPMiddleware):
+    """The previous BaseHTTPMiddleware shape, headers set one at a time"""
+
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Content-Security-Policy"] = "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'"
+        return response
+
+
+def make_scope(i):
+    return {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/api/health", "raw_path": b"/api/health",
+        "query_string": b"", "root_path": "", "headers": [(b"host", b"localhost")],
+        "client": (f"10.0.{(i // 256) % 256}.{i % 256}", 50000), "server": ("localhost", 5000),
+    }
+
+
+async def drive(app):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    scopes = [make_scope(i) for i in range(REQUESTS)]
+    start = time.perf_counter()
+    for scope in scopes:
+        await app(scope, receive, send)
+    return (time.perf_counter() - start) / REQUESTS
+
+
+async def main():
+    bare = await drive(endpoint)
+    # Limit high enough that nothing is rejected; we are measuring the pass-through cost
+    asgi = await drive(SecurityMiddleware(endpoint, calls_per_minute=10**9))
+    legacy = await drive(LegacySecurityMiddleware(endpoint))
+    print(f"bare app                      {bare * 1e6:7.1f} us/request")
+    print(f"pure ASGI SecurityMiddleware  {asgi * 1e6:7.1f} us/request  (+{(asgi - bare) * 1e6:.1f} us)")
+    print(f"BaseHTTPMiddleware (legacy)   {legacy * 1e6:7.1f} us/request  (+{(legacy - bare) * 1e6:.1f} us)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
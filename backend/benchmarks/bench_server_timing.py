@@ -0,0 +1,34 @@
+"""
+Per-request overhead of ServerTimingMiddleware
+Reuses the direct ASGI driver from bench_security_middleware
+
+Run from the backend directory:
+    python -m benchmarks.bench_server_timing
+"""
+import asyncio
+
+from app.services.timing import ServerTimingMiddleware, timed
+from benchmarks.bench_security_middleware import drive, endpoint
+
+
+async def instrumented_endpoint(scope, receive, send):
+    # Roughly what a real request reports: auth plus a few queries
+    with timed("auth"):
+        pass
+    for _ in range(3):
+        with timed("db"):
+            pass
+    await endpoint(scope, receive, send)
+
+
+async def main():
+    bare = await drive(endpoint)
+    timed_bare = await drive(ServerTimingMiddleware(endpoint))
+    timed_full = await drive(ServerTimingMiddleware(instrumented_endpoint))
+    print(f"bare app                          {bare * 1e6:7.1f} us/request")
+    print(f"ServerTimingMiddleware            {timed_bare * 1e6:7.1f} us/request  (+{(timed_bare - bare) * 1e6:.1f} us)")
+    print(f"  with auth + 3 db spans reported {timed_full * 1e6:7.1f} us/request  (+{(timed_full - bare) * 1e6:.1f} us)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
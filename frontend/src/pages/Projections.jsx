@@ -1,5 +1,6 @@
-import React, { useState } from 'react'
+import React, { useState, useEffect, useCallback, useRef } from 'react'
 import { useAuth } from '../contexts/AuthContext'
+import axios from 'axios'
 
 export default function Projections() {
   const { user } = useAuth()
@@ -12,6 +13,66 @@ export default function Projections() {
     retirementAge: 65,
     currentAge: 35
   })
+  const [simulation, setSimulation] = useState(null)
+  const [simulating, setSimulating] = useState(false)
+  const [simulationError, setSimulationError] = useState(null)
+  const [retryAt, setRetryAt] = useState(0)
+  const lastRun = useRef(null)
+
+  const projectionRequest = () => ({
+    years: parseInt(timeframe),
+    initial_wealth: Math.max(0, assumptions.currentWealth || 0),
+    monthly_contribution: Math.max(0, assumptions.monthlyContributions || 0),
+    expected_return: (assumptions.expectedReturn || 0) / 100,
+    inflation: (assumptions.inflationRate || 0) / 100
+  })
+
+  // Monte Carlo bands and milestone odds from the server. Runs are rate limited,
+  // so a failed run keeps the last result on screen and says why
+  const runSimulation = useCallback(async (request) => {
+    lastRun.current = JSON.stringify(request)
+    setSimulating(true)
+    try {
+      const token = localStorage.getItem('token')
+      const response = await axios.post('/api/projections', request, {
+        headers: { 'Authorization': `Bearer ${token}` }
+      })
+      setSimulation(response.data)
+      setSimulationError(null)
+    } catch (err) {
+      console.error('Failed to run projection:', err)
+      lastRun.current = null  // let the same inputs be retried
+      if (err.response?.status === 429) {
+        const seconds = parseInt(err.response.headers['retry-after']) || 60
+        setRetryAt(Date.now() + seconds * 1000)
+        setSimulationError(`Too many simulations; try again in ${seconds} seconds.`)
+      } else {
+        setSimulationError('Failed to run the simulation. Please try again.')
+      }
+    } finally {
+      setSimulating(false)
+    }
+  }, [])
+
+  // Re-run once the inputs have settled, unless they are unchanged or we are rate limited
+  useEffect(() => {
+    const timer = setTimeout(() => {
+      const request = projectionRequest()
+      if (Date.now() < retryAt || JSON.stringify(request) === lastRun.current) return
+      runSimulation(request)
+    }, 1200)
+    return () => clearTimeout(timer)
+  }, [timeframe, assumptions, retryAt, runSimulation])
+
+  // Clear the rate-limit notice when it expires
+  useEffect(() => {
+    if (!retryAt) return
+    const timer = setTimeout(() => {
+      setRetryAt(0)
+      setSimulationError(null)
+    }, Math.max(0, retryAt - Date.now()))
+    return () => clearTimeout(timer)
+  }, [retryAt])
 
   const pageStyle = {
     backgroundColor: '#0f172a',
@@ -61,6 +122,18 @@ export default function Projections() {
   }
 
   const projections = calculateProjections()
+  const final = simulation?.final
+
+  const formatProbability = (probability) => {
+    return probability === null ? 'Beyond projection' : `${Math.round(probability * 100)}%`
+  }
+
+  const probabilityColor = (probability) => {
+    if (probability === null) return '#64748b'
+    if (probability >= 0.8) return '#10b981'
+    if (probability >= 0.5) return '#f59e0b'
+    return '#ef4444'
+  }
 
   const scenarios = [
     {
@@ -207,6 +280,29 @@ export default function Projections() {
                 />
               </div>
             </div>
+            <div style={{ display: 'flex', alignItems: 'center', gap: '16px', marginTop: '24px', flexWrap: 'wrap' }}>
+              <button
+                onClick={() => runSimulation(projectionRequest())}
+                disabled={simulating || retryAt > 0}
+                style={{
+                  padding: '12px 24px',
+                  backgroundColor: simulating || retryAt > 0 ? '#475569' : '#3b82f6',
+                  border: 'none',
+                  borderRadius: '12px',
+                  color: 'white',
+                  fontSize: '1rem',
+                  fontWeight: '600',
+                  cursor: simulating || retryAt > 0 ? 'not-allowed' : 'pointer'
+                }}
+              >
+                {simulating ? 'Simulating…' : 'Run Simulation'}
+              </button>
+              {simulationError && (
+                <span style={{ color: '#fecaca', fontSize: '0.875rem' }}>
+                  {simulationError}{simulation ? ' Showing the last result.' : ''}
+                </span>
+              )}
+            </div>
           </div>
 
           {/* Main Projection */}
@@ -217,13 +313,13 @@ export default function Projections() {
             <div style={{ display: 'grid', gridTemplateColumns: 'repeat(auto-fit, minmax(200px, 1fr))', gap: '16px' }}>
               <div style={{ textAlign: 'center' }}>
                 <div style={{ fontSize: '1.5rem', fontWeight: '700', color: '#10b981', marginBottom: '4px' }}>
-                  {formatCurrency(projections.futureValue)}
+                  {formatCurrency(final ? final.p50 : projections.futureValue)}
                 </div>
-                <div style={{ color: '#94a3b8', fontSize: '0.875rem' }}>Projected Value</div>
+                <div style={{ color: '#94a3b8', fontSize: '0.875rem' }}>{final ? 'Median Projected Value' : 'Projected Value'}</div>
               </div>
               <div style={{ textAlign: 'center' }}>
                 <div style={{ fontSize: '1.5rem', fontWeight: '700', color: '#3b82f6', marginBottom: '4px' }}>
-                  {formatCurrency(projections.inflationAdjusted)}
+                  {formatCurrency(final ? final.p50_real : projections.inflationAdjusted)}
                 </div>
                 <div style={{ color: '#94a3b8', fontSize: '0.875rem' }}>Inflation-Adjusted</div>
               </div>
@@ -240,8 +336,42 @@ export default function Projections() {
                 <div style={{ color: '#94a3b8', fontSize: '0.875rem' }}>Investment Growth</div>
               </div>
             </div>
+            {final && (
+              <div style={{ display: 'flex', justifyContent: 'space-between', flexWrap: 'wrap', gap: '8px', marginTop: '24px', paddingTop: '16px', borderTop: '1px solid #334155' }}>
+                <span style={{ color: '#94a3b8', fontSize: '0.875rem' }}>
+                  Range across {simulation.paths.toLocaleString()} simulated markets (P10 – P90)
+                </span>
+                <span style={{ fontWeight: '600', color: '#e2e8f0' }}>
+                  {formatCurrency(final.p10)} – {formatCurrency(final.p90)}
+                </span>
+              </div>
+            )}
           </div>
 
+          {/* Milestone Odds */}
+          {simulation && simulation.goals.length > 0 && (
+            <div style={{ ...cardStyle, marginTop: '24px' }}>
+              <h3 style={{ fontSize: '1.25rem', fontWeight: '600', color: 'white', margin: '0 0 24px 0' }}>
+                Milestone Odds {simulating && <span style={{ color: '#64748b', fontSize: '0.875rem', fontWeight: '400' }}>updating…</span>}
+              </h3>
+              <div style={{ display: 'flex', flexDirection: 'column', gap: '12px' }}>
+                {simulation.goals.map((goal) => (
+                  <div key={goal.id} style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center' }}>
+                    <div>
+                      <div style={{ fontWeight: '500', color: '#e2e8f0' }}>{goal.title}</div>
+                      <div style={{ color: '#64748b', fontSize: '0.875rem' }}>
+                        {formatCurrency(goal.target_amount)} by {new Date(goal.target_date).toLocaleDateString('en-GB')}
+                      </div>
+                    </div>
+                    <span style={{ fontWeight: '600', color: probabilityColor(goal.probability) }}>
+                      {formatProbability(goal.probability)}
+                    </span>
+                  </div>
+                ))}
+              </div>
+            </div>
+          )}
+
           {/* Scenario Analysis */}
           <div style={{ ...cardStyle, marginTop: '24px' }}>
             <h3 style={{ fontSize: '1.25rem', fontWeight: '600', color: 'white', margin: '0 0 24px 0' }}>
@@ -369,7 +499,7 @@ export default function Projections() {
               </div>
               <div style={{ fontSize: '0.875rem', color: '#94a3b8', lineHeight: '1.5' }}>
                 <ul style={{ margin: '0', paddingLeft: '20px' }}>
-                  <li>Returns are compounded annually</li>
+                  <li>Projected values are the median of simulated market paths; scenarios compound annually</li>
                   <li>Contributions are made monthly</li>
                   <li>No account for taxes or fees</li>
                   <li>Inflation estimates based on historical averages</li>
@@ -15,7 +15,8 @@ export default function Reports() {
     setError(null)
     try {
       const token = localStorage.getItem('token')
-      const response = await axios.get('/api/reports/health-check', {
+      // JSON preview of the report figures; PDFs are only rendered on download
+      const response = await axios.get('/api/reports/preview', {
         headers: { 'Authorization': `Bearer ${token}` }
       })
       setReportData(response.data)
@@ -207,6 +208,51 @@ export default function Reports() {
             </div>
           )}
 
+          {/* Report Preview */}
+          {reportData && (
+            <div style={{ display: 'grid', gridTemplateColumns: 'repeat(auto-fit, minmax(220px, 1fr))', gap: '24px', marginBottom: '24px' }}>
+              <div style={cardStyle}>
+                <div style={{ color: '#94a3b8', fontSize: '0.875rem' }}>Financial Health Score</div>
+                <div style={{ fontSize: '2.5rem', fontWeight: '700', color: getHealthColor(reportData.health.score) }}>
+                  {Math.round(reportData.health.score)}<span style={{ fontSize: '1rem', color: '#94a3b8' }}> / 100</span>
+                </div>
+                {reportData.health.metrics.map((metric) => (
+                  <div key={metric.key} style={{ display: 'flex', justifyContent: 'space-between', fontSize: '0.875rem', marginTop: '4px' }}>
+                    <span style={{ color: '#cbd5e1' }}>{metric.label}</span>
+                    <span style={{ color: getHealthColor(metric.score), fontWeight: '600' }}>{Math.round(metric.score)}</span>
+                  </div>
+                ))}
+              </div>
+              <div style={cardStyle}>
+                <div style={{ color: '#94a3b8', fontSize: '0.875rem' }}>Net Worth</div>
+                <div style={{ fontSize: '2rem', fontWeight: '700', marginBottom: '8px' }}>{formatCurrency(reportData.summary.net_worth)}</div>
+                {reportData.assets.map((asset) => (
+                  <div key={asset.category} style={{ display: 'flex', justifyContent: 'space-between', fontSize: '0.875rem', marginTop: '4px' }}>
+                    <span style={{ color: '#cbd5e1' }}>{asset.category}</span>
+                    <span>{formatCurrency(asset.value)} ({asset.share.toFixed(0)}%)</span>
+                  </div>
+                ))}
+              </div>
+              <div style={cardStyle}>
+                <div style={{ color: '#94a3b8', fontSize: '0.875rem' }}>Milestones</div>
+                <div style={{ fontSize: '2rem', fontWeight: '700', marginBottom: '8px' }}>
+                  {reportData.milestones.completed} / {reportData.milestones.total}
+                </div>
+                {reportData.milestones.items.slice(0, 5).map((milestone, index) => (
+                  <div key={index} style={{ fontSize: '0.875rem', marginTop: '8px' }}>
+                    <div style={{ display: 'flex', justifyContent: 'space-between', color: '#cbd5e1' }}>
+                      <span>{milestone.title}</span>
+                      <span>{milestone.progress.toFixed(0)}%</span>
+                    </div>
+                    <div style={{ height: '4px', borderRadius: '2px', backgroundColor: '#334155', marginTop: '4px' }}>
+                      <div style={{ width: `${milestone.progress}%`, height: '100%', borderRadius: '2px', backgroundColor: '#ec4899' }} />
+                    </div>
+                  </div>
+                ))}
+              </div>
+            </div>
+          )}
+
           {/* Download Report Options */}
           <div style={{ display: 'grid', gridTemplateColumns: 'repeat(auto-fit, minmax(300px, 1fr))', gap: '24px' }}>
             